@@ -0,0 +1,328 @@
+"""
+Benchmark ClientBuilder against a local stub of the quote API.
+
+Measures quotes per second, p50/p99 call latency and memory per quote of
+``get_last_quote`` and ``get_history_quote`` for several pair counts, plus the
+package import time. Results are written to ``benchmarks/results/`` and, when
+a baseline exists, compared against it: the run exits with status 1 if any
+metric regressed by more than the tolerance.
+
+    python benchmarks/run.py                      # run and compare
+    python benchmarks/run.py --save-baseline      # run and store as baseline
+    python benchmarks/run.py --latency-ms 20 --error-rate 0.01 --payload-size 512
+    python benchmarks/run.py --replay             # library overhead, no sockets
+
+With ``--replay``, one call of every case is recorded against the stub and
+every measured call is then answered from that recording, so the numbers
+exclude HTTP and JSON transfer costs.
+
+The working tree under ``src/`` is benchmarked, not an installed copy.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional
+
+from stub_server import StubQuoteServer, currency_pairs
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(os.path.dirname(BENCHMARKS_DIR), "src")
+RESULTS_DIR = os.path.join(BENCHMARKS_DIR, "results")
+BASELINE_PATH = os.path.join(RESULTS_DIR, "baseline.json")
+
+HISTORY_REFERENCE_DATE = 20240102
+
+# Metrics compared against the baseline, and whether a higher value is better.
+COMPARED_METRICS = {
+    "quotes_per_second": True,
+    "p50_ms": False,
+    "p99_ms": False,
+    "retained_bytes_per_quote": False,
+    "import_ms": False,
+}
+
+IMPORT_CODE = """
+import time
+started = time.perf_counter()
+from currency_quote import ClientBuilder
+print((time.perf_counter() - started) * 1000)
+"""
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def measure_import(runs: int = 5) -> Dict[str, float]:
+    """Return the best time to import ClientBuilder in a fresh interpreter."""
+    env = dict(os.environ, PYTHONPATH=SRC_DIR)
+    timings = [
+        float(
+            subprocess.run(
+                [sys.executable, "-c", IMPORT_CODE],
+                capture_output=True,
+                text=True,
+                check=True,
+                env=env,
+            ).stdout
+        )
+        for _ in range(runs)
+    ]
+    return {"import_ms": min(timings)}
+
+
+def measure_calls(
+    call: Callable[[], list], iterations: int, server: StubQuoteServer
+) -> Dict[str, float]:
+    """
+    Time repeated calls, then trace the memory of one more.
+
+    Args:
+        call: Performs one library call and returns its quotes.
+        iterations: Number of timed calls, after one warm-up call.
+        server: The stub, to count the requests issued per call.
+
+    Returns:
+        dict: Throughput, latency and memory metrics.
+    """
+    call()
+    requests_before = server.request_count
+    latencies = []
+    quotes = 0
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        call_started = time.perf_counter()
+        quotes += len(call())
+        latencies.append(time.perf_counter() - call_started)
+    elapsed = time.perf_counter() - started
+    requests_per_call = (server.request_count - requests_before) / iterations
+
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        result = call()
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    count = max(len(result), 1)
+    return {
+        "calls": iterations,
+        "quotes": quotes,
+        "requests_per_call": requests_per_call,
+        "quotes_per_second": quotes / elapsed,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "retained_bytes_per_quote": (retained - before) / count,
+        "peak_bytes_per_quote": (peak - before) / count,
+    }
+
+
+def benchmark_cases(client) -> Dict[str, Callable[[], list]]:
+    return {
+        "get_last_quote": client.get_last_quote,
+        "get_history_quote": lambda: client.get_history_quote(
+            reference_date=HISTORY_REFERENCE_DATE
+        ),
+    }
+
+
+def replay_from_recording(clients: list, timing: str) -> None:
+    """Record one call of each case against the stub, then replay every call."""
+    # pylint: disable=import-outside-toplevel
+    from currency_quote import (
+        QuoteArchive,
+        RecordingTransport,
+        ReplayTransport,
+        set_transport,
+    )
+
+    path = os.path.join(tempfile.mkdtemp(prefix="currency-quote-"), "responses.jsonl")
+    set_transport(RecordingTransport(QuoteArchive(path)))
+    for client in clients:
+        for call in benchmark_cases(client).values():
+            call()
+    set_transport(ReplayTransport(QuoteArchive(path), timing=timing))
+
+
+def run_suite(args: argparse.Namespace, server: StubQuoteServer) -> Dict[str, dict]:
+    # Imported only now: the endpoints are read from the environment at import.
+    # pylint: disable=import-outside-toplevel
+    from currency_quote import ClientBuilder
+    from currency_quote.adapters.outbound.http_transport import HTTP_TRANSPORT
+    from currency_quote.adapters.outbound.last_quote_cache import LAST_QUOTE_CACHE
+    from currency_quote.utils.resilience import AdaptiveTokenBucket
+
+    # Measure the client, not the TTL cache or the politeness limit.
+    LAST_QUOTE_CACHE.ttl_seconds = 0
+    if not args.keep_rate_limit:
+        HTTP_TRANSPORT.rate_limiter = AdaptiveTokenBucket(
+            max_rate=1e9, burst=10**9, max_wait_seconds=60
+        )
+
+    clients = {
+        pair_count: ClientBuilder(currency_pairs(pair_count), history_store=None)
+        for pair_count in args.pairs
+    }
+    if args.replay:
+        replay_from_recording(list(clients.values()), args.replay)
+
+    results = {}
+    for pair_count, client in clients.items():
+        for operation, call in benchmark_cases(client).items():
+            name = f"{operation}[pairs={pair_count}]"
+            results[name] = measure_calls(call, args.iterations, server)
+            print(format_row(name, results[name]), flush=True)
+
+    results["import"] = measure_import()
+    print(format_row("import", results["import"]), flush=True)
+    return results
+
+
+def format_row(name: str, metrics: Dict[str, float]) -> str:
+    if "import_ms" in metrics:
+        return f"{name:<34} import {metrics['import_ms']:8.1f} ms"
+    return (
+        f"{name:<34} {metrics['quotes_per_second']:10.0f} quotes/s"
+        f"  p50 {metrics['p50_ms']:7.2f} ms  p99 {metrics['p99_ms']:7.2f} ms"
+        f"  {metrics['retained_bytes_per_quote']:7.0f} B/quote"
+        f"  {metrics['requests_per_call']:5.1f} req/call"
+    )
+
+
+def find_regressions(
+    results: Dict[str, dict], baseline: Dict[str, dict], tolerance: float
+) -> List[str]:
+    """Describe every metric worse than the baseline by more than ``tolerance``."""
+    regressions = []
+
+    for name, metrics in results.items():
+        for metric, higher_is_better in COMPARED_METRICS.items():
+            current = metrics.get(metric)
+            reference = baseline.get(name, {}).get(metric)
+            if current is None or not reference:
+                continue
+
+            change = (current - reference) / abs(reference)
+            if (-change if higher_is_better else change) > tolerance:
+                regressions.append(
+                    f"{name} {metric}: {reference:.2f} -> {current:.2f} ({change:+.0%})"
+                )
+
+    return regressions
+
+
+def write_json(path: str, document: dict) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(document, file, indent=2, sort_keys=True)
+        file.write("\n")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=__doc__.strip().splitlines()[0],
+    )
+    parser.add_argument(
+        "--pairs",
+        type=lambda value: [int(item) for item in value.split(",")],
+        default=[1, 10, 100, 250],
+        help="Comma-separated pair counts (default: 1,10,100,250).",
+    )
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--payload-size", type=int, default=0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--keep-rate-limit",
+        action="store_true",
+        help="Keep the client's upstream rate limit instead of lifting it.",
+    )
+    parser.add_argument(
+        "--replay",
+        nargs="?",
+        const="fast",
+        choices=["fast", "recorded"],
+        help="Answer from a recording of the stub instead of the network, "
+        "immediately (fast, the default) or with the recorded latency.",
+    )
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--save-baseline", action="store_true")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    server = StubQuoteServer(
+        pair_count=max(args.pairs),
+        latency_seconds=args.latency_ms / 1000,
+        error_rate=args.error_rate,
+        payload_size=args.payload_size,
+        seed=args.seed,
+    )
+
+    os.environ["CURRENCY_QUOTE_API_URL"] = server.url
+    for name in ("CURRENCY_QUOTE_PARITIES_SNAPSHOT", "CURRENCY_QUOTE_HISTORY_STORE"):
+        os.environ.pop(name, None)
+    sys.path.insert(0, SRC_DIR)
+
+    with server:
+        results = run_suite(args, server)
+
+    document = {
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "settings": {
+            "iterations": args.iterations,
+            "latency_ms": args.latency_ms,
+            "error_rate": args.error_rate,
+            "payload_size": args.payload_size,
+            "keep_rate_limit": args.keep_rate_limit,
+            "replay": args.replay,
+        },
+        "results": results,
+    }
+    stamp = document["created_at"].replace(":", "").replace("+0000", "Z")
+    write_json(os.path.join(RESULTS_DIR, f"{stamp}.json"), document)
+
+    if args.save_baseline:
+        write_json(args.baseline, document)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("No baseline to compare against, run with --save-baseline first.")
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as file:
+        baseline = json.load(file)
+
+    if baseline.get("settings") != document["settings"]:
+        print("Baseline was recorded with other settings, not comparing.")
+        return 0
+
+    regressions = find_regressions(results, baseline["results"], args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    print(f"{len(regressions)} regression(s) beyond {args.tolerance:.0%}.")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,237 @@
+"""
+Local stand-in for the quote API, for benchmarks.
+
+Serves ``/json/available``, ``/last/`` and ``/json/daily/`` with payloads shaped
+like the upstream ones, for a deterministic universe of pairs, with optional
+latency, error rate and padding to make payloads larger.
+
+Run it on its own with ``python benchmarks/stub_server.py --port 8000`` and
+point the library at it with ``CURRENCY_QUOTE_API_URL=http://127.0.0.1:8000``.
+"""
+
+import argparse
+import hashlib
+import itertools
+import json
+import random
+import string
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional
+from urllib.parse import parse_qs, urlsplit
+
+MAJOR_CURRENCIES = ["USD", "EUR", "GBP", "JPY", "CHF", "CAD", "AUD", "CNY", "ARS"]
+QUOTE_CURRENCY = "BRL"
+
+
+def currency_pairs(count: int) -> List[str]:
+    """
+    Return ``count`` pairs quoted in BRL: the majors first, then synthetic codes.
+
+    Args:
+        count: Number of pairs, e.g. 100.
+
+    Returns:
+        list: Pair codes such as ['USD-BRL', 'EUR-BRL', ..., 'AAA-BRL'].
+    """
+    codes = itertools.chain(
+        MAJOR_CURRENCIES,
+        (
+            "".join(letters)
+            for letters in itertools.product(string.ascii_uppercase, repeat=3)
+            if "".join(letters) not in MAJOR_CURRENCIES + [QUOTE_CURRENCY]
+        ),
+    )
+    return [f"{code}-{QUOTE_CURRENCY}" for code in itertools.islice(codes, count)]
+
+
+def _base_price(currency_pair: str) -> float:
+    digest = hashlib.sha256(currency_pair.encode("ascii")).digest()
+    return 0.5 + int.from_bytes(digest[:4], "big") / 2**32 * 10
+
+
+def quote_row(currency_pair: str, timestamp: int, padding: str = "") -> dict:
+    """Return one upstream-shaped quote row for a pair at a Unix timestamp."""
+    code, codein = currency_pair.split("-")
+    bid = _base_price(currency_pair) * (1 + (timestamp // 86400 % 17) / 1000)
+    row = {
+        "code": code,
+        "codein": codein,
+        "name": f"{code}/{codein}",
+        "high": f"{bid * 1.01:.4f}",
+        "low": f"{bid * 0.99:.4f}",
+        "varBid": "0.0123",
+        "pctChange": "0.24",
+        "bid": f"{bid:.4f}",
+        "ask": f"{bid * 1.001:.4f}",
+        "timestamp": str(timestamp),
+        "create_date": datetime.fromtimestamp(timestamp, timezone.utc).strftime(
+            "%Y-%m-%d %H:%M:%S"
+        ),
+    }
+    if padding:
+        row["padding"] = padding
+    return row
+
+
+class StubQuoteServer:
+    """
+    Threaded HTTP server imitating the quote API on a local port.
+
+    Args:
+        pair_count: Number of pairs listed by ``/json/available``.
+        latency_seconds: Delay added before every response.
+        error_rate: Probability of answering 500 instead of the payload.
+        payload_size: Extra bytes of padding added to every quote row.
+        seed: Seed of the error draws, for reproducible runs.
+        port: Port to listen on, any free one by default.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        pair_count: int = 500,
+        latency_seconds: float = 0.0,
+        error_rate: float = 0.0,
+        payload_size: int = 0,
+        seed: int = 0,
+        port: int = 0,
+    ):
+        self.pairs = currency_pairs(pair_count)
+        self.latency_seconds = latency_seconds
+        self.error_rate = error_rate
+        self.padding = "x" * payload_size
+        self.request_count = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._known = frozenset(self.pairs)
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), _StubHandler)
+        self._server.daemon_threads = True
+        self._server.stub = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubQuoteServer":
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="stub-quote-server", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "StubQuoteServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def respond(self, path: str):
+        """Return the (status, payload) answering a request path."""
+        with self._lock:
+            self.request_count += 1
+            failed = self._random.random() < self.error_rate
+
+        if self.latency_seconds:
+            time.sleep(self.latency_seconds)
+        if failed:
+            return 500, {"status": 500, "message": "Stub error"}
+
+        parts = urlsplit(path)
+        segments = [segment for segment in parts.path.split("/") if segment]
+
+        if segments == ["json", "available"]:
+            return 200, {pair: pair.replace("-", "/") for pair in self.pairs}
+        if len(segments) == 2 and segments[0] == "last":
+            return self._last(segments[1].split(","))
+        if len(segments) in (3, 4) and segments[:2] == ["json", "daily"]:
+            days = int(segments[3]) if len(segments) == 4 else 1
+            return self._daily(segments[2], days, parse_qs(parts.query))
+
+        return 404, {"status": 404, "message": "Not found"}
+
+    def _last(self, requested: List[str]):
+        unknown = [pair for pair in requested if pair not in self._known]
+        if unknown:
+            return 404, {"status": 404, "message": f"moeda nao encontrada {unknown[0]}"}
+
+        timestamp = int(time.time())
+        payload: Dict[str, dict] = {
+            pair.replace("-", ""): quote_row(pair, timestamp, self.padding)
+            for pair in requested
+        }
+        return 200, payload
+
+    def _daily(self, currency_pair: str, days: int, query: Dict[str, List[str]]):
+        if currency_pair not in self._known:
+            return 404, {"status": 404, "message": "moeda nao encontrada"}
+
+        end_date = query.get("end_date", [None])[0]
+        end = (
+            datetime.strptime(end_date, "%Y%m%d").replace(tzinfo=timezone.utc)
+            if end_date
+            else datetime.now(timezone.utc)
+        )
+        # One quote per day at 18:00 UTC, most recent day first like upstream.
+        last_timestamp = int(end.timestamp()) // 86400 * 86400 + 64800
+        return 200, [
+            quote_row(currency_pair, last_timestamp - offset * 86400, self.padding)
+            for offset in range(days)
+        ]
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; without this, Nagle's algorithm
+    # and delayed ACKs add ~40ms to every keep-alive response.
+    disable_nagle_algorithm = True
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        status, payload = self.server.stub.respond(self.path)
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--pairs", type=int, default=500)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--payload-size", type=int, default=0)
+    args = parser.parse_args()
+
+    server = StubQuoteServer(
+        pair_count=args.pairs,
+        latency_seconds=args.latency_ms / 1000,
+        error_rate=args.error_rate,
+        payload_size=args.payload_size,
+        port=args.port,
+    )
+    print(f"Serving {len(server.pairs)} pairs on {server.url}")
+    server.start()
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,54 @@
-from currency_quote.adapters.inbound.lib_controller import ClientBuilder
+import logging
+from importlib import import_module
+from typing import TYPE_CHECKING
+
 from currency_quote.utils.logger import setup_logging
 
-# Setup logging when package is imported
-setup_logging()
+if TYPE_CHECKING:
+    from currency_quote.adapters.inbound.async_lib_controller import AsyncClientBuilder
+    from currency_quote.adapters.inbound.lib_controller import ClientBuilder
+
+# Library loggers stay silent unless the application configures logging, e.g.
+# by calling setup_logging().
+logging.getLogger("currency_quote").addHandler(logging.NullHandler())
+
+# Public names are imported on first access, so `import currency_quote` does not
+# load the HTTP stack or any optional dependency.
+_LAZY_ATTRIBUTES = {
+    "ClientBuilder": "currency_quote.adapters.inbound.lib_controller",
+    "AsyncClientBuilder": "currency_quote.adapters.inbound.async_lib_controller",
+    "set_metrics": "currency_quote.utils.metrics",
+    "InMemoryMetrics": "currency_quote.utils.metrics",
+    "OpenTelemetryMetrics": "currency_quote.utils.metrics",
+    "set_transport": "currency_quote.adapters.outbound.http_transport",
+    "QuoteArchive": "currency_quote.adapters.outbound.quote_archive",
+    "RecordingTransport": "currency_quote.adapters.outbound.replay_transport",
+    "ReplayTransport": "currency_quote.adapters.outbound.replay_transport",
+}
+
+__all__ = [
+    "ClientBuilder",
+    "AsyncClientBuilder",
+    "setup_logging",
+    "set_metrics",
+    "InMemoryMetrics",
+    "OpenTelemetryMetrics",
+    "set_transport",
+    "QuoteArchive",
+    "RecordingTransport",
+    "ReplayTransport",
+]
+
+
+def __getattr__(name: str):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
 
-__all__ = ["ClientBuilder"]
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
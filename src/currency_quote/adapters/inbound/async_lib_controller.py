@@ -0,0 +1,76 @@
+from typing import Optional, Union
+from currency_quote.adapters.inbound.quote_presenter import (
+    present_quotes,
+    quote_to_dict,
+)
+from currency_quote.adapters.outbound.async_http import AsyncHttpClient
+from currency_quote.adapters.outbound.quote_poller import AsyncQuoteSubscription
+from currency_quote.application.ports.inbound.async_controller import IAsyncController
+from currency_quote.application.use_cases.async_get_last_currency_quote import (
+    AsyncGetLastCurrencyQuoteUseCase,
+)
+from currency_quote.application.use_cases.async_get_history_currency_quote import (
+    AsyncGetHistCurrencyQuoteUseCase,
+)
+from currency_quote.application.use_cases.async_stream_currency_quote import (
+    AsyncStreamCurrencyQuoteUseCase,
+)
+from currency_quote.config.endpoints import API
+from currency_quote.domain.entities.currency import CurrencyObject
+from currency_quote.domain.entities.quote_columns import QuoteColumns
+
+
+class AsyncClientBuilder(IAsyncController):
+    """
+    Asyncio counterpart of ClientBuilder.
+
+    Every AsyncClientBuilder shares the process-wide keep-alive connection pool
+    unless an ``http_client`` is given.
+    """
+
+    def __init__(
+        self,
+        currency_list: Union[list, str],
+        http_client: Optional[AsyncHttpClient] = None,
+    ):
+        self.currency_list = currency_list
+        self.currency_obj = CurrencyObject(self.currency_list)
+        self.http_client = http_client
+
+    async def get_last_quote(self, columnar: bool = False) -> Union[list, QuoteColumns]:
+        use_case_result = await AsyncGetLastCurrencyQuoteUseCase.execute(
+            currency_obj=self.currency_obj, http_client=self.http_client
+        )
+
+        return present_quotes(use_case_result, columnar=columnar)
+
+    async def get_history_quote(
+        self, reference_date: int, columnar: bool = False
+    ) -> Union[list, QuoteColumns]:
+        use_case_result = await AsyncGetHistCurrencyQuoteUseCase.execute(
+            currency_obj=self.currency_obj,
+            reference_date=reference_date,
+            http_client=self.http_client,
+        )
+
+        return present_quotes(use_case_result, columnar=columnar)
+
+    async def stream(
+        self, interval: float = API.STREAM_INTERVAL_SECONDS
+    ) -> AsyncQuoteSubscription:
+        """
+        Follow the pairs' last quotes, receiving each quote only when it changes.
+
+        Args:
+            interval: Seconds between two upstream polls.
+
+        Returns:
+            AsyncQuoteSubscription: An async iterator of quote dicts; close it,
+                or use it as an async context manager, to stop streaming.
+        """
+        return await AsyncStreamCurrencyQuoteUseCase.execute(
+            currency_obj=self.currency_obj,
+            interval=interval,
+            http_client=self.http_client,
+            transform=quote_to_dict,
+        )
@@ -1,4 +1,4 @@
-from typing import Union
+from typing import Iterable, Iterator, List, Optional, Union
 from currency_quote.application.ports.inbound.controller import IController
 from currency_quote.application.use_cases.get_last_currency_quote import (
     GetLastCurrencyQuoteUseCase,
@@ -6,57 +6,272 @@ from currency_quote.application.use_cases.get_last_currency_quote import (
 from currency_quote.application.use_cases.get_history_currency_quote import (
     GetHistCurrencyQuoteUseCase,
 )
+from currency_quote.application.use_cases.get_history_range_currency_quote import (
+    GetHistRangeCurrencyQuoteUseCase,
+)
+from currency_quote.application.use_cases.get_history_matrix import (
+    GetHistoryMatrixUseCase,
+)
+from currency_quote.application.use_cases.get_cross_currency_quote import (
+    GetCrossCurrencyQuoteUseCase,
+    GetRateMatrixUseCase,
+)
+from currency_quote.application.use_cases.stream_currency_quote import (
+    StreamCurrencyQuoteUseCase,
+)
+from currency_quote.application.use_cases.prefetch_history import (
+    PrefetchHistoryUseCase,
+)
+from currency_quote.application.use_cases.validate_currency import (
+    ValidateCurrencyUseCase,
+)
+from currency_quote.application.ports.outbound.history_store import IHistoryStore
+from currency_quote.adapters.outbound.quote_poller import QuoteSubscription
+from currency_quote.adapters.outbound.sqlite_history_store import SQLiteHistoryStore
+from currency_quote.adapters.inbound.quote_presenter import (
+    cross_quote_to_dict,
+    present_quotes,
+    quote_to_dict,
+)
+from currency_quote.config.cache import Cache
+from currency_quote.config.endpoints import API
+from currency_quote.domain.entities.cross_rate import RateMatrix
 from currency_quote.domain.entities.currency import CurrencyObject
+from currency_quote.domain.entities.history_matrix import HistoryMatrix
+from currency_quote.domain.entities.quote_columns import QuoteColumns
+from currency_quote.domain.entities.quote_result import QuoteResult
 
 
 class ClientBuilder(IController):
-    def __init__(self, currency_list: Union[list, str]):
+    """
+    Long-lived client for a set of currency pairs.
+
+    The pairs are validated against the available parities on first use and
+    the result is reused by every later call, until upstream availability
+    changes. Pairs can be added or removed without validating the others again.
+    """
+
+    def __init__(
+        self,
+        currency_list: Union[list, str],
+        history_store: Union[str, IHistoryStore, None] = Cache.HISTORY_STORE_PATH,
+    ):
         self.currency_list = currency_list
         self.currency_obj = CurrencyObject(self.currency_list)
+        self.validated_currency = ValidateCurrencyUseCase.session(self.currency_obj)
+        self.history_store: Optional[IHistoryStore] = (
+            SQLiteHistoryStore(history_store)
+            if isinstance(history_store, str)
+            else history_store
+        )
 
-    def get_last_quote(self) -> list:
+    def get_last_quote(self, columnar: bool = False) -> Union[list, QuoteColumns]:
         use_case_result = GetLastCurrencyQuoteUseCase.execute(
-            currency_obj=self.currency_obj
+            currency_obj=self.currency_obj, validated_currency=self.validated_currency
         )
 
-        controller_return = []
+        return present_quotes(use_case_result, columnar=columnar)
 
-        for item in use_case_result:
-            dic = {
-                "currency_pair": item.currency_pair,
-                "currency_pair_name": item.currency_pair_name,
-                "base_currency_code": item.base_currency_code,
-                "quote_currency_code": item.quote_currency_code,
-                "quote_timestamp": item.quote_timestamp,
-                "bid_price": item.bid_price,
-                "ask_price": item.ask_price,
-                "quote_extracted_at": item.quote_extracted_at,
-            }
-
-            controller_return.append(dic)
-
-        return controller_return
-
-    def get_history_quote(self, reference_date: int) -> list:
+    def get_history_quote(
+        self, reference_date: int, columnar: bool = False
+    ) -> Union[list, QuoteColumns]:
         use_case_result = GetHistCurrencyQuoteUseCase.execute(
             currency_obj=self.currency_obj,
             reference_date=reference_date,
+            history_store=self.history_store,
+            validated_currency=self.validated_currency,
         )
 
-        use_case_result_parsed = []
+        return present_quotes(use_case_result, columnar=columnar)
+
+    def get_history_range(self, start_date: int, end_date: int) -> Iterator[dict]:
+        """
+        Stream the daily quotes of every pair between two dates, inclusive.
+
+        Args:
+            start_date: First date of the range, as YYYYMMDD.
+            end_date: Last date of the range, as YYYYMMDD.
+
+        Yields:
+            dict: One quote per pair and day, grouped by pair, oldest first.
+        """
+        use_case_result = GetHistRangeCurrencyQuoteUseCase.execute(
+            currency_obj=self.currency_obj,
+            start_date=start_date,
+            end_date=end_date,
+            history_store=self.history_store,
+            validated_currency=self.validated_currency,
+        )
 
         for item in use_case_result:
-            dic = {
-                "currency_pair": item.currency_pair,
-                "currency_pair_name": item.currency_pair_name,
-                "base_currency_code": item.base_currency_code,
-                "quote_currency_code": item.quote_currency_code,
-                "quote_timestamp": item.quote_timestamp,
-                "bid_price": item.bid_price,
-                "ask_price": item.ask_price,
-                "quote_extracted_at": item.quote_extracted_at,
-            }
-
-            use_case_result_parsed.append(dic)
-
-        return use_case_result_parsed
+            yield quote_to_dict(item)
+
+    def get_history_matrix(
+        self,
+        reference_dates: Iterable[int],
+        checkpoint: Optional[str] = None,
+        max_workers: int = API.MAX_CONCURRENT_REQUESTS,
+        max_rate: float = API.RATE_LIMIT_PER_SECOND,
+    ) -> HistoryMatrix:
+        """
+        Fetch every pair on every date into one dense matrix.
+
+        Consecutive dates are merged into ranged requests per pair, run
+        concurrently within a request rate budget. With a checkpoint file,
+        finished requests are recorded as they complete, and calling again with
+        the same pairs and dates resumes an interrupted backfill.
+
+        Args:
+            reference_dates: Dates as YYYYMMDD, e.g. range(20240101, 20240132).
+            checkpoint: Optional path of the checkpoint file.
+            max_workers: Maximum number of requests in flight.
+            max_rate: Maximum number of requests started per second.
+
+        Returns:
+            HistoryMatrix: Bid and ask per (pair, date), NaN when there is no
+                quote; pairs whose requests failed are listed in ``errors``.
+
+        Raises:
+            ValueError: If a date is malformed or not in the past.
+        """
+        return GetHistoryMatrixUseCase.execute(
+            currency_obj=self.currency_obj,
+            reference_dates=reference_dates,
+            history_store=self.history_store,
+            validated_currency=self.validated_currency,
+            checkpoint_path=checkpoint,
+            max_workers=max_workers,
+            max_rate=max_rate,
+        )
+
+    def add_pairs(self, currency_list: Union[list, str]) -> List[str]:
+        """
+        Start quoting more pairs; only the new ones are validated.
+
+        Args:
+            currency_list: The pairs to add, e.g. ['GBP-BRL'] or 'GBP-BRL'.
+
+        Returns:
+            list: The pairs that were not requested yet.
+
+        Raises:
+            ValueError: If a pair is malformed.
+        """
+        added = self.validated_currency.add(currency_list)
+        self._sync_currency_list()
+        return added
+
+    def remove_pairs(self, currency_list: Union[list, str]) -> List[str]:
+        """
+        Stop quoting pairs, without validating the remaining ones again.
+
+        Args:
+            currency_list: The pairs to remove, e.g. ['GBP-BRL'] or 'GBP-BRL'.
+
+        Returns:
+            list: The pairs that were removed.
+
+        Raises:
+            ValueError: If no pair would be left.
+        """
+        removed = self.validated_currency.remove(currency_list)
+        self._sync_currency_list()
+        return removed
+
+    def _sync_currency_list(self) -> None:
+        self.currency_list = self.validated_currency.currency_list
+        self.currency_obj = CurrencyObject(self.currency_list)
+
+    def get_cross_quote(self) -> list:
+        """
+        Price the client's pairs from quoted legs, including pairs not quoted upstream.
+
+        Each pair follows the shortest path through the available parities, e.g.
+        EUR-JPY as EUR-BRL times the inverse of JPY-BRL, and every leg is fetched
+        in a single /last/ request.
+
+        Returns:
+            QuoteResult: One dict per pair, with a "legs" entry recording the
+                provenance; ``errors`` maps each pair that could not be priced
+                to the error of its failed leg.
+        """
+        use_case_result = GetCrossCurrencyQuoteUseCase.execute(
+            currency_obj=self.currency_obj
+        )
+
+        return QuoteResult(
+            (cross_quote_to_dict(item) for item in use_case_result),
+            use_case_result.errors,
+        )
+
+    def get_rate_matrix(self, pivot: Optional[str] = None) -> RateMatrix:
+        """
+        Build the bid/ask matrix between every currency of the client's pairs.
+
+        Only the legs of each currency against the pivot are fetched, in one
+        /last/ request, and the N×N matrices are derived from them.
+
+        Args:
+            pivot: Currency to triangulate through. Defaults to the one quoted
+                against the most of the others.
+
+        Returns:
+            RateMatrix: The currencies, pivot, legs and NumPy bid/ask matrices;
+                rates through a leg that failed are NaN, see its ``errors``.
+        """
+        currencies = list(
+            dict.fromkeys(
+                currency
+                for currency_pair in self.currency_obj.get_currency_list()
+                for currency in currency_pair.split("-")
+            )
+        )
+
+        return GetRateMatrixUseCase.execute(currencies=currencies, pivot=pivot)
+
+    def stream(
+        self, interval: float = API.STREAM_INTERVAL_SECONDS
+    ) -> QuoteSubscription:
+        """
+        Follow the pairs' last quotes, receiving each quote only when it changes.
+
+        Every stream in the process is served by one shared poller, so many
+        consumers of the same pairs cost a single upstream request per interval.
+
+        Args:
+            interval: Seconds between two upstream polls.
+
+        Returns:
+            QuoteSubscription: An iterator of quote dicts; close it, or use it as
+                a context manager, to stop streaming.
+        """
+        return StreamCurrencyQuoteUseCase.execute(
+            currency_obj=self.currency_obj, interval=interval, transform=quote_to_dict
+        )
+
+    def prefetch_history(self, start_date: int, end_date: int) -> int:
+        """
+        Backfill the history store with every pair's quotes between two dates.
+
+        Only dates missing from the store are requested upstream, so the call can
+        be repeated to extend or resume a backfill.
+
+        Args:
+            start_date: First date of the range, as YYYYMMDD.
+            end_date: Last date of the range, as YYYYMMDD.
+
+        Returns:
+            int: The number of quotes stored for the range.
+
+        Raises:
+            ValueError: If the client was built without a history store.
+        """
+        if self.history_store is None:
+            raise ValueError("prefetch_history requires a history_store")
+
+        return PrefetchHistoryUseCase.execute(
+            currency_obj=self.currency_obj,
+            start_date=start_date,
+            end_date=end_date,
+            history_store=self.history_store,
+        )
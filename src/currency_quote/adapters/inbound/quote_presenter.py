@@ -0,0 +1,58 @@
+from typing import Iterable, List, Union
+from currency_quote.domain.entities.cross_rate import CrossQuote
+from currency_quote.domain.entities.currency import CurrencyQuote
+from currency_quote.domain.entities.quote_columns import QuoteColumns
+from currency_quote.domain.entities.quote_result import QuoteResult
+
+
+def quote_to_dict(item: CurrencyQuote) -> dict:
+    return {
+        "currency_pair": item.currency_pair,
+        "currency_pair_name": item.currency_pair_name,
+        "base_currency_code": item.base_currency_code,
+        "quote_currency_code": item.quote_currency_code,
+        "quote_timestamp": item.quote_timestamp,
+        "bid_price": item.bid_price,
+        "ask_price": item.ask_price,
+        "quote_extracted_at": item.quote_extracted_at,
+    }
+
+
+def cross_quote_to_dict(item: CrossQuote) -> dict:
+    return {
+        "currency_pair": item.currency_pair,
+        "base_currency_code": item.base_currency_code,
+        "quote_currency_code": item.quote_currency_code,
+        "quote_timestamp": item.quote_timestamp,
+        "bid_price": item.bid_price,
+        "ask_price": item.ask_price,
+        "quote_extracted_at": item.quote_extracted_at,
+        "legs": [
+            {"currency_pair": leg.currency_pair, "inverted": leg.inverted}
+            for leg in item.legs
+        ],
+    }
+
+
+def present_quotes(
+    quotes: Iterable[CurrencyQuote], columnar: bool = False
+) -> Union[List[dict], QuoteColumns]:
+    """
+    Shape use case results for the inbound controllers.
+
+    Args:
+        quotes: The quotes returned by a use case.
+        columnar: Return a QuoteColumns instead of one dict per quote.
+
+    Returns:
+        QuoteResult or QuoteColumns: The quotes in the requested layout. Either
+            way ``errors`` maps each pair that failed to its exception.
+    """
+    errors = dict(getattr(quotes, "errors", {}))
+
+    if columnar:
+        columns = QuoteColumns.from_quotes(quotes)
+        columns.errors = errors
+        return columns
+
+    return QuoteResult((quote_to_dict(item) for item in quotes), errors)
@@ -0,0 +1,147 @@
+import asyncio
+import time
+from typing import List, Optional
+
+from currency_quote.adapters.outbound.async_http import (
+    ASYNC_HTTP_CLIENT,
+    AsyncHttpClient,
+)
+from currency_quote.adapters.outbound.http_transport import is_transient_error
+from currency_quote.adapters.outbound.currency_api import (
+    MissingQuoteError,
+    last_quote_url,
+    parse_history_quote,
+    parse_last_quote,
+    plan_last_quote_batches,
+    record_fetch,
+)
+from currency_quote.application.ports.outbound.async_currency_repository import (
+    IAsyncCurrencyRepository,
+)
+from currency_quote.config.endpoints import API
+from currency_quote.domain.entities.currency import CurrencyQuote, CurrencyObject
+from currency_quote.domain.entities.quote_result import QuoteResult
+from currency_quote.utils.clock import now_timestamp
+from currency_quote.utils.dates import is_valid_reference_date
+from currency_quote.utils.logger import get_logger
+from currency_quote.utils.metrics import get_metrics
+
+logger = get_logger("async_currency_api")
+
+
+class AsyncCurrencyAPI(IAsyncCurrencyRepository):
+    """Async repository for fetching currency quotes over a shared connection pool."""
+
+    def __init__(
+        self,
+        currency_obj: CurrencyObject,
+        http_client: Optional[AsyncHttpClient] = None,
+        max_concurrency: int = API.MAX_CONCURRENT_REQUESTS,
+    ):
+        self.currency_list = currency_obj.get_currency_list()
+        self.http_client = http_client or ASYNC_HTTP_CLIENT
+        self.max_concurrency = max_concurrency
+
+    async def get_last_quote(self) -> QuoteResult:
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch(batch: List[str]) -> dict:
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    return await self.http_client.get_json(last_quote_url(batch))
+                finally:
+                    record_fetch(batch, started)
+
+        metrics = get_metrics()
+        quote_result = QuoteResult()
+        pending = list(dict.fromkeys(self.currency_list))
+        retry_time_seconds = getattr(
+            self.http_client, "retry_time_seconds", API.RETRY_TIME_SECONDS
+        )
+
+        for attempt in range(API.PARTIAL_RETRY_ATTEMPTS + 1):
+            if attempt:
+                logger.warning(
+                    "Retrying last quote of %d failed pairs: %s",
+                    len(pending),
+                    ", ".join(pending),
+                )
+                metrics.increment("currency_quote_partial_retries_total", len(pending))
+                await asyncio.sleep(retry_time_seconds * attempt)
+                for item in pending:
+                    del quote_result.errors[item]
+
+            batches = plan_last_quote_batches(pending)
+            payloads = await asyncio.gather(
+                *(fetch(batch) for batch in batches), return_exceptions=True
+            )
+
+            response = {}
+            errors = {}
+
+            for batch, payload in zip(batches, payloads):
+                if isinstance(payload, BaseException):
+                    errors.update(dict.fromkeys(batch, payload))
+                else:
+                    response.update(payload)
+
+            with metrics.timer("currency_quote_phase_seconds", phase="parse"):
+                parsed = parse_last_quote(
+                    response, [item for item in pending if item not in errors]
+                )
+            quote_result.extend(parsed)
+            errors.update(parsed.errors)
+            quote_result.errors.update(errors)
+            pending = [
+                item
+                for item, error in errors.items()
+                if isinstance(error, MissingQuoteError) or is_transient_error(error)
+            ]
+
+            if not pending:
+                break
+
+        quotes = {quote.currency_pair: quote for quote in quote_result}
+
+        return QuoteResult(
+            (quotes[item] for item in self.currency_list if item in quotes),
+            quote_result.errors,
+        ).raise_if_empty()
+
+    async def get_history_quote(self, reference_date: int) -> QuoteResult:
+        if not is_valid_reference_date(reference_date):
+            logger.error("Invalid reference date: %d", reference_date)
+            return QuoteResult()
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        extracted_at = now_timestamp()
+
+        async def fetch(item: str) -> CurrencyQuote:
+            url = (
+                f"{API.ENDPOINT_HISTORY_COTATION}{item}"
+                f"?start_date={reference_date}&end_date={reference_date}"
+            )
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    response = await self.http_client.get_json(url)
+                finally:
+                    record_fetch([item], started)
+            with get_metrics().timer("currency_quote_phase_seconds", phase="parse"):
+                return parse_history_quote(item, response, extracted_at)
+
+        results = await asyncio.gather(
+            *(fetch(item) for item in self.currency_list), return_exceptions=True
+        )
+
+        quote_result = QuoteResult()
+
+        for item, result in zip(self.currency_list, results):
+            if isinstance(result, BaseException):
+                logger.error("Failed to fetch history quote for %s: %s", item, result)
+                quote_result.errors[item] = result
+            else:
+                quote_result.append(result)
+
+        return quote_result.raise_if_empty()
@@ -0,0 +1,68 @@
+# src/currency_quote/adapters/outbound/async_currency_validator_api.py
+import asyncio
+import weakref
+from functools import partial
+from typing import Optional
+
+from currency_quote.adapters.outbound.async_http import (
+    ASYNC_HTTP_CLIENT,
+    AsyncHttpClient,
+)
+from currency_quote.adapters.outbound.parities_cache import PARITIES_CACHE
+from currency_quote.application.ports.outbound.async_currency_validator_repository import (
+    IAsyncCurrencyValidator,
+)
+from currency_quote.config.endpoints import API
+from currency_quote.domain.entities.currency import CurrencyObject
+
+_PENDING_LOADS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Task]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _raise(error: Exception):
+    raise error
+
+
+async def _load_parities(http_client: AsyncHttpClient) -> None:
+    PARITIES_CACHE.put(await http_client.get_json(API.ENDPOINT_AVALIABLE_PARITIES))
+
+
+async def load_parities(http_client: AsyncHttpClient) -> None:
+    """Load the parities cache once per event loop, however many callers wait on it."""
+    loop = asyncio.get_running_loop()
+    task = _PENDING_LOADS.get(loop)
+
+    if task is None or task.done():
+        task = loop.create_task(_load_parities(http_client))
+        _PENDING_LOADS[loop] = task
+
+    await asyncio.shield(task)
+
+
+class AsyncCurrencyValidatorAPI(IAsyncCurrencyValidator):
+    def __init__(
+        self,
+        currency_quote: CurrencyObject,
+        http_client: Optional[AsyncHttpClient] = None,
+    ) -> None:
+        self.currency_quote = currency_quote
+        self.http_client = http_client or ASYNC_HTTP_CLIENT
+
+    async def validate_currency_code(self) -> list:
+        # Share the process-wide parities cache with the synchronous validator,
+        # loading it through the event loop only when it cannot be served as is.
+        loader = None
+        if PARITIES_CACHE.peek() is None:
+            try:
+                await load_parities(self.http_client)
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                # Handing the failure to the cache as its loader's makes it fall
+                # back to an expired copy, like a failed synchronous refresh.
+                loader = partial(_raise, exc)
+
+        validated_list, _ = PARITIES_CACHE.get_index(loader).split(
+            self.currency_quote.get_currency_list()
+        )
+
+        return validated_list
@@ -0,0 +1,175 @@
+import asyncio
+from typing import Any, Optional
+
+from currency_quote.adapters.outbound.http_transport import (
+    RETRYABLE_STATUS_CODES,
+    UPSTREAM_CIRCUIT_BREAKER,
+    UPSTREAM_RATE_LIMITER,
+    endpoint_label,
+)
+from currency_quote.config.endpoints import API
+from currency_quote.utils.logger import get_logger
+from currency_quote.utils.metrics import get_metrics
+from currency_quote.utils.optional import import_optional
+from currency_quote.utils.resilience import (
+    AdaptiveTokenBucket,
+    CircuitBreaker,
+    RateLimitedError,
+)
+
+logger = get_logger("async_http")
+
+
+def _import_aiohttp():
+    return import_optional("aiohttp", extra="async")
+
+
+class AsyncHttpClient:
+    """
+    Keep-alive HTTP session shared by the async outbound adapters.
+
+    The underlying aiohttp session, and therefore its connection pool, is
+    created on first use inside a running event loop and recreated only if the
+    client is later used from a different loop. Calls share the circuit breaker
+    and rate limiter of the synchronous transport.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        max_connections: int = API.MAX_ASYNC_CONNECTIONS,
+        connect_timeout: float = API.CONNECTION_TIMEOUT_SECONDS,
+        read_timeout: float = API.READ_TIMEOUT_SECONDS,
+        retry_attempts: int = API.RETRY_ATTEMPTS,
+        retry_time_seconds: float = API.RETRY_TIME_SECONDS,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        rate_limiter: Optional[AdaptiveTokenBucket] = None,
+    ):
+        self.max_connections = max_connections
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.retry_attempts = retry_attempts
+        self.retry_time_seconds = retry_time_seconds
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.rate_limiter = rate_limiter or AdaptiveTokenBucket()
+        self._session: Optional[Any] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_session(self):
+        aiohttp = _import_aiohttp()
+        loop = asyncio.get_running_loop()
+
+        if self._session is None or self._session.closed or self._loop is not loop:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_connections),
+                timeout=aiohttp.ClientTimeout(
+                    sock_connect=self.connect_timeout, sock_read=self.read_timeout
+                ),
+                headers={"Accept-Encoding": "gzip, deflate"},
+                raise_for_status=True,
+            )
+            self._loop = loop
+
+        return self._session
+
+    async def get_json(self, url: str) -> Any:
+        """
+        Fetch a JSON document, retrying transient failures with a growing delay.
+
+        Args:
+            url: The URL to fetch.
+
+        Returns:
+            The decoded JSON body.
+        """
+        self.circuit_breaker.before_call()
+        try:
+            return await self._get_json(url)
+        except asyncio.CancelledError:
+            # The call may hold the half-open probe and will never report back.
+            self.circuit_breaker.cancel()
+            raise
+
+    async def _get_json(self, url: str) -> Any:
+        aiohttp = _import_aiohttp()
+        metrics = get_metrics()
+        endpoint = endpoint_label(url) if metrics.enabled else ""
+        attempt = 0
+
+        while True:
+            try:
+                wait = self.rate_limiter.reserve()
+            except RateLimitedError:
+                self.circuit_breaker.cancel()
+                raise
+            if wait:
+                await asyncio.sleep(wait)
+
+            try:
+                with metrics.timer(
+                    "currency_quote_http_request_seconds", endpoint=endpoint
+                ):
+                    async with self._get_session().get(url) as response:
+                        body = await response.read()
+                        payload = await response.json(content_type=None)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+                status = getattr(exc, "status", None)
+                metrics.increment(
+                    "currency_quote_http_requests_total",
+                    endpoint=endpoint,
+                    outcome=str(status or "error"),
+                )
+                if status == 429:
+                    self.rate_limiter.throttle(self._retry_after(exc))
+
+                attempt += 1
+                if attempt >= self.retry_attempts or not self._is_retryable(status):
+                    logger.error("Failed after %d attempts: %s", attempt, url)
+                    if status is None or status >= 500 or status == 429:
+                        self.circuit_breaker.record_failure()
+                    else:
+                        self.circuit_breaker.record_success()
+                    raise
+                metrics.increment(
+                    "currency_quote_http_retries_total", endpoint=endpoint
+                )
+                await asyncio.sleep(self.retry_time_seconds * attempt)
+            except asyncio.CancelledError:
+                raise
+            except BaseException:
+                # e.g. a body that is not JSON: the call is over, so is any probe.
+                self.circuit_breaker.record_failure()
+                raise
+            else:
+                metrics.increment(
+                    "currency_quote_http_requests_total",
+                    endpoint=endpoint,
+                    outcome="ok",
+                )
+                metrics.observe(
+                    "currency_quote_http_response_bytes", len(body), endpoint=endpoint
+                )
+                self.rate_limiter.relax()
+                self.circuit_breaker.record_success()
+                return payload
+
+    @staticmethod
+    def _is_retryable(status: Optional[int]) -> bool:
+        return status is None or status in RETRYABLE_STATUS_CODES
+
+    @staticmethod
+    def _retry_after(exc: Exception) -> Optional[float]:
+        try:
+            return float(exc.headers["Retry-After"])
+        except (AttributeError, KeyError, TypeError, ValueError):
+            return None
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._loop = None
+
+
+ASYNC_HTTP_CLIENT = AsyncHttpClient(
+    circuit_breaker=UPSTREAM_CIRCUIT_BREAKER, rate_limiter=UPSTREAM_RATE_LIMITER
+)
@@ -0,0 +1,174 @@
+from functools import partial
+from typing import Callable, Iterator, List, Optional
+
+from currency_quote.adapters.outbound.currency_api import (
+    CurrencyAPI,
+    NoHistoryQuoteError,
+)
+from currency_quote.application.ports.outbound.currency_repository import (
+    ICurrencyRepository,
+)
+from currency_quote.application.ports.outbound.history_store import IHistoryStore
+from currency_quote.domain.entities.currency import CurrencyQuote, CurrencyObject
+from currency_quote.domain.entities.quote_result import QuoteResult
+from currency_quote.utils.dates import (
+    contiguous_ranges,
+    is_valid_reference_date,
+    timestamp_to_reference_date,
+)
+from currency_quote.utils.logger import get_logger
+from currency_quote.utils.metrics import get_metrics
+
+logger = get_logger("cached_history_repository")
+
+
+class CachedHistoryRepository(ICurrencyRepository):
+    """
+    Read-through decorator that keeps fetched history in a local store.
+
+    Historical quotes of a closed date never change, so each (pair, date) is
+    fetched from the wrapped repository once and served from the store after
+    that. Last quotes are always delegated.
+    """
+
+    def __init__(
+        self,
+        currency_obj: CurrencyObject,
+        store: IHistoryStore,
+        repository: Callable[[CurrencyObject], ICurrencyRepository] = CurrencyAPI,
+    ):
+        self.currency_obj = currency_obj
+        self.currency_list = currency_obj.get_currency_list()
+        self.store = store
+        self.repository = repository
+
+    def get_last_quote(self) -> List[CurrencyQuote]:
+        return self.repository(self.currency_obj).get_last_quote()
+
+    def get_history_quote(self, reference_date: int) -> QuoteResult:
+        if not is_valid_reference_date(reference_date):
+            return self.repository(self.currency_obj).get_history_quote(reference_date)
+
+        stored = {}
+        missing = []
+        errors = {}
+
+        for item in self.currency_list:
+            quotes, missing_dates = self.store.lookup(
+                item, reference_date, reference_date
+            )
+            _record_lookup(missing_dates)
+            if missing_dates:
+                missing.append(item)
+            elif quotes:
+                stored[item] = quotes[0]
+            else:
+                errors[item] = NoHistoryQuoteError(
+                    f"No history quote for {item} on {reference_date}"
+                )
+
+        if missing:
+            # Upstream failing must never lose what the store already answered.
+            try:
+                fetched = self.repository(CurrencyObject(missing)).get_history_quote(
+                    reference_date
+                )
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                logger.error(
+                    "Failed to fetch history of %s: %s", ", ".join(missing), exc
+                )
+                fetched = QuoteResult(errors=dict.fromkeys(missing, exc))
+
+            for quote in fetched:
+                self.store.save(
+                    quote.currency_pair,
+                    reference_date,
+                    reference_date,
+                    [(reference_date, quote)],
+                )
+                stored[quote.currency_pair] = quote
+
+            for item, error in getattr(fetched, "errors", {}).items():
+                if isinstance(error, NoHistoryQuoteError):
+                    # Upstream has nothing for this day: remember it, do not ask again.
+                    self.store.save(item, reference_date, reference_date, [])
+                errors[item] = error
+
+        return QuoteResult(
+            (stored[item] for item in self.currency_list if item in stored), errors
+        ).raise_if_empty()
+
+    def get_history_range(
+        self, start_date: int, end_date: int
+    ) -> Iterator[CurrencyQuote]:
+        if (
+            not is_valid_reference_date(start_date)
+            or not is_valid_reference_date(end_date)
+            or start_date > end_date
+        ):
+            yield from self.repository(self.currency_obj).get_history_range(
+                start_date, end_date
+            )
+            return
+
+        for item in self.currency_list:
+            quotes, missing_dates = self.store.lookup(item, start_date, end_date)
+            _record_lookup(missing_dates)
+
+            if missing_dates:
+                self._backfill(item, missing_dates)
+                quotes, _ = self.store.lookup(item, start_date, end_date)
+
+            yield from quotes
+
+    def prefetch(self, start_date: int, end_date: int) -> int:
+        """
+        Make sure every pair's history between two dates is in the store.
+
+        Args:
+            start_date: First date of the range, as YYYYMMDD.
+            end_date: Last date of the range, as YYYYMMDD.
+
+        Returns:
+            int: The number of quotes available in the store for the range.
+        """
+        return sum(1 for _ in self.get_history_range(start_date, end_date))
+
+    def _backfill(self, item: str, missing_dates: List[int]) -> None:
+        """
+        Fetch the missing windows of a pair and mark them as fetched.
+
+        The whole window is marked, including the days upstream returned no
+        quote for: inside a closed range those are weekends and holidays, and
+        marking them is what keeps them from being requested on every call. A
+        day upstream skipped by mistake is therefore not fetched again until it
+        is removed from the store.
+        """
+        repository = self.repository(CurrencyObject([item]))
+
+        for window_start, window_end in contiguous_ranges(missing_dates):
+            logger.info(
+                "Fetching history of %s from %d to %d", item, window_start, window_end
+            )
+            quotes = [
+                (timestamp_to_reference_date(quote.quote_timestamp), quote)
+                for quote in repository.get_history_range(window_start, window_end)
+            ]
+            self.store.save(item, window_start, window_end, quotes)
+
+
+def _record_lookup(missing_dates: List[int]) -> None:
+    get_metrics().increment(
+        "currency_quote_cache_requests_total",
+        cache="history_store",
+        result="miss" if missing_dates else "hit",
+    )
+
+
+def history_repository(
+    history_store: Optional[IHistoryStore] = None,
+) -> Callable[[CurrencyObject], ICurrencyRepository]:
+    """Return the repository factory, reading through ``history_store`` if set."""
+    if history_store is None:
+        return CurrencyAPI
+    return partial(CachedHistoryRepository, store=history_store)
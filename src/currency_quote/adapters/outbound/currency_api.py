@@ -1,81 +1,327 @@
-from datetime import datetime
-from typing import List
-from api_to_dataframe import ClientBuilder, RetryStrategies
+import time
+from typing import Iterable, Iterator, List, Optional
 
+from currency_quote.adapters.outbound.http_transport import (
+    get_transport,
+    is_transient_error,
+)
+from currency_quote.adapters.outbound.last_quote_cache import (
+    LAST_QUOTE_CACHE,
+    LastQuoteCache,
+)
 from currency_quote.application.ports.outbound.currency_repository import (
     ICurrencyRepository,
 )
+from currency_quote.application.ports.outbound.http_transport import IHttpTransport
 from currency_quote.config.endpoints import API
 from currency_quote.domain.entities.currency import CurrencyQuote, CurrencyObject
+from currency_quote.domain.entities.quote_result import QuoteResult
+from currency_quote.utils.clock import now_timestamp
+from currency_quote.utils.batching import plan_batches
+from currency_quote.utils.concurrency import run_concurrently
+from currency_quote.utils.dates import (
+    date_windows,
+    days_between,
+    is_valid_reference_date,
+)
 from currency_quote.utils.logger import get_logger
+from currency_quote.utils.metrics import get_metrics
+from currency_quote.utils.resilience import CircuitOpenError, RateLimitedError
+from currency_quote.utils.singleflight import SingleFlight
 
 logger = get_logger("currency_api")
 
+# Identical requests issued concurrently by any CurrencyAPI share one upstream call.
+IN_FLIGHT = SingleFlight()
+
+
+class MissingQuoteError(ValueError):
+    """A requested pair is absent from an upstream /last/ response."""
+
+
+class NoHistoryQuoteError(ValueError):
+    """Upstream has no quote of a pair on a date, e.g. a weekend or holiday."""
+
+
+def parse_last_quote(response: dict, currency_list: List[str]) -> QuoteResult:
+    """
+    Parse a /last/ response pair by pair.
+
+    A pair that is missing from the payload or malformed is recorded in the
+    result's errors instead of discarding the rest of the batch.
+    """
+    extracted_at = now_timestamp()
+    result = QuoteResult()
+
+    for currency_pair in currency_list:
+        try:
+            result.extend(
+                CurrencyQuote.from_api_payload(
+                    response, currency_pairs=[currency_pair], extracted_at=extracted_at
+                )
+            )
+        except KeyError as exc:
+            result.errors[currency_pair] = MissingQuoteError(
+                f"Missing quote for {currency_pair} in upstream response: {exc}"
+            )
+        except (TypeError, ValueError) as exc:
+            result.errors[currency_pair] = exc
+
+    return result
+
+
+def record_fetch(currency_list: Iterable[str], started: float) -> None:
+    """Record the fetch phase of a request started at ``started``, and per pair."""
+    metrics = get_metrics()
+    if not metrics.enabled:
+        return
+
+    elapsed = time.perf_counter() - started
+    metrics.observe("currency_quote_phase_seconds", elapsed, phase="fetch")
+    for currency_pair in currency_list:
+        metrics.observe(
+            "currency_quote_pair_latency_seconds", elapsed, currency_pair=currency_pair
+        )
+
+
+def plan_last_quote_batches(currency_list: Iterable[str]) -> List[List[str]]:
+    """
+    Split pairs into /last/ requests that respect the upstream URL limits.
+
+    Pairs are sorted first, so the same pair set always maps to the same requests.
+    """
+    return plan_batches(
+        sorted(set(currency_list)),
+        prefix_length=len(API.ENDPOINT_LAST_COTATION),
+        max_length=API.MAX_URL_LENGTH,
+        max_items=API.LAST_MAX_PAIRS_PER_REQUEST,
+    )
+
+
+def last_quote_url(currency_list: List[str]) -> str:
+    return f"{API.ENDPOINT_LAST_COTATION}{','.join(currency_list)}"
+
+
+def parse_history_quote(
+    item: str, response: list, extracted_at: Optional[int] = None
+) -> CurrencyQuote:
+    if not response:
+        raise NoHistoryQuoteError(f"No history quote returned for {item}")
+    return CurrencyQuote.from_api_payload(
+        response[:1], currency_pair=item, extracted_at=extracted_at
+    )[0]
+
+
+def parse_history_quotes(
+    item: str, response: list, extracted_at: Optional[int] = None
+) -> List[CurrencyQuote]:
+    return CurrencyQuote.from_api_payload(
+        response, currency_pair=item, extracted_at=extracted_at
+    )
+
+
 class CurrencyAPI(ICurrencyRepository):
     """Repository implementation for fetching currency quotes from external API."""
-    def __init__(self, currency_obj: CurrencyObject):
+
+    def __init__(
+        self,
+        currency_obj: CurrencyObject,
+        max_workers: int = API.MAX_CONCURRENT_REQUESTS,
+        transport: Optional[IHttpTransport] = None,
+        quote_cache: Optional[LastQuoteCache] = None,
+    ):
         self.currency_list = currency_obj.get_currency_list()
+        self.max_workers = max_workers
+        self.transport = transport or get_transport()
+        self.quote_cache = LAST_QUOTE_CACHE if quote_cache is None else quote_cache
+
+    def get_last_quote(self) -> QuoteResult:
+        quotes, missing = self.quote_cache.lookup(self.currency_list)
+        errors = {}
+
+        if missing:
+            fetched = self._fetch_last_quotes(missing)
+            self.quote_cache.store(fetched)
+            quotes.update((quote.currency_pair, quote) for quote in fetched)
+            errors = fetched.errors
+
+            # While upstream is failing fast, serve older quotes rather than none.
+            unavailable = [
+                item
+                for item, error in errors.items()
+                if isinstance(error, (CircuitOpenError, RateLimitedError))
+            ]
+            for item, quote in self.quote_cache.stale(unavailable).items():
+                logger.warning("Upstream unavailable, serving stale quote for %s", item)
+                get_metrics().increment(
+                    "currency_quote_cache_requests_total",
+                    cache="last_quote",
+                    result="stale",
+                )
+                quotes[item] = quote
+                del errors[item]
+
+        return QuoteResult(
+            (quotes[item] for item in self.currency_list if item in quotes), errors
+        ).raise_if_empty()
+
+    def get_history_quote(self, reference_date: int) -> QuoteResult:
+        if not is_valid_reference_date(reference_date):
+            logger.error("Invalid reference date: %d", reference_date)
+            return QuoteResult()
 
-    def get_last_quote(self) -> List[CurrencyQuote]:
-        url = f"{API.ENDPOINT_LAST_COTATION}{','.join(self.currency_list)}"
+        extracted_at = now_timestamp()
 
-        client = ClientBuilder(
-            endpoint=url, retry_strategy=RetryStrategies.EXPONENTIAL_RETRY_STRATEGY
+        results = run_concurrently(
+            lambda item: self._fetch_history_quote(item, reference_date, extracted_at),
+            self.currency_list,
+            max_workers=self.max_workers,
         )
 
-        response = client.get_api_data()
+        quote_result = QuoteResult()
 
-        quote_list = []
+        for item, (currency_quote, error) in zip(self.currency_list, results):
+            if error is not None:
+                logger.error("Failed to fetch history quote for %s: %s", item, error)
+                quote_result.errors[item] = error
+            else:
+                quote_result.append(currency_quote)
 
-        for item in self.currency_list:
-            parsed_item = item.replace("-", "")
-            currency_quote = CurrencyQuote(
-                currency_pair=item,
-                currency_pair_name=response[parsed_item]["name"],
-                base_currency_code=response[parsed_item]["code"],
-                quote_currency_code=response[parsed_item]["codein"],
-                quote_timestamp=int(response[parsed_item]["timestamp"]),
-                bid_price=response[parsed_item]["bid"],
-                ask_price=response[parsed_item]["ask"],
-            )
+        return quote_result.raise_if_empty()
 
-            quote_list.append(currency_quote)
+    def get_history_range(
+        self, start_date: int, end_date: int
+    ) -> Iterator[CurrencyQuote]:
+        """
+        Yield the daily quotes of every pair between two dates, inclusive.
 
-        return quote_list
+        Each pair is fetched with as few ranged requests as the upstream page
+        limit allows, and only one page is held in memory at a time.
 
-    def get_history_quote(self, reference_date: int) -> List[CurrencyQuote]:
-        today = int(datetime.today().strftime("%Y%m%d"))
+        Args:
+            start_date: First date of the range, as YYYYMMDD.
+            end_date: Last date of the range, as YYYYMMDD.
 
+        Yields:
+            CurrencyQuote: Quotes grouped by pair, oldest first.
+        """
         if (
-            reference_date > today
-            or reference_date == today
-            or len(str(reference_date)) != 8
+            not is_valid_reference_date(start_date)
+            or not is_valid_reference_date(end_date)
+            or start_date > end_date
         ):
-            logger.error("Invalid reference date: %d", reference_date)
-            return []
-
-        quote_list = []
+            logger.error("Invalid date range: %d - %d", start_date, end_date)
+            return
 
         for item in self.currency_list:
-            url = (f"{API.ENDPOINT_HISTORY_COTATION}{item}"
-                   f"?start_date={reference_date}&end_date={reference_date}")
+            for window_start, window_end in date_windows(
+                start_date, end_date, API.HISTORY_MAX_DAYS_PER_REQUEST
+            ):
+                url = (
+                    f"{API.ENDPOINT_HISTORY_COTATION}{item}/"
+                    f"{days_between(window_start, window_end)}"
+                    f"?start_date={window_start}&end_date={window_end}"
+                )
 
-            client = ClientBuilder(
-                endpoint=url, retry_strategy=RetryStrategies.EXPONENTIAL_RETRY_STRATEGY
-            )
+                started = time.perf_counter()
+                try:
+                    response = self._get_json(url)
+                finally:
+                    record_fetch([item], started)
+
+                # Upstream returns the most recent day first.
+                with get_metrics().timer("currency_quote_phase_seconds", phase="parse"):
+                    quotes = parse_history_quotes(item, response)
+                yield from reversed(quotes)
 
-            response = client.get_api_data()
+    def _fetch_last_quotes(self, currency_list: List[str]) -> QuoteResult:
+        """
+        Fetch the pairs' last quotes, retrying only the pairs that failed.
 
-            currency_quote = CurrencyQuote(
-                currency_pair=item,
-                currency_pair_name=response[0]["name"],
-                base_currency_code=response[0]["code"],
-                quote_currency_code=response[0]["codein"],
-                quote_timestamp=int(response[0]["timestamp"]),
-                bid_price=float(response[0]["bid"]),
-                ask_price=float(response[0]["ask"]),
+        A pair fails when its chunk request fails or when it is missing or
+        malformed in the payload; the other pairs of the batch are kept. Only
+        pairs missing from the payload or whose request failed transiently are
+        retried, after the transport's retry delay.
+        """
+        metrics = get_metrics()
+        quote_result = QuoteResult()
+        pending = currency_list
+        retry_time_seconds = getattr(
+            self.transport, "retry_time_seconds", API.RETRY_TIME_SECONDS
+        )
+
+        for attempt in range(API.PARTIAL_RETRY_ATTEMPTS + 1):
+            if attempt:
+                logger.warning(
+                    "Retrying last quote of %d failed pairs: %s",
+                    len(pending),
+                    ", ".join(pending),
+                )
+                metrics.increment("currency_quote_partial_retries_total", len(pending))
+                time.sleep(retry_time_seconds * attempt)
+                for item in pending:
+                    del quote_result.errors[item]
+
+            batches = plan_last_quote_batches(pending)
+            results = run_concurrently(
+                self._fetch_last_quote_batch, batches, max_workers=self.max_workers
             )
 
-            quote_list.append(currency_quote)
+            response = {}
+            errors = {}
+
+            for batch, (payload, error) in zip(batches, results):
+                if error is not None:
+                    errors.update(dict.fromkeys(batch, error))
+                else:
+                    response.update(payload)
+
+            with metrics.timer("currency_quote_phase_seconds", phase="parse"):
+                parsed = parse_last_quote(
+                    response, [item for item in pending if item not in errors]
+                )
+            quote_result.extend(parsed)
+            errors.update(parsed.errors)
+            quote_result.errors.update(errors)
+            pending = [
+                item
+                for item, error in errors.items()
+                if isinstance(error, MissingQuoteError) or is_transient_error(error)
+            ]
+
+            if not pending:
+                break
+
+        for item, error in quote_result.errors.items():
+            logger.error("Failed to fetch last quote for %s: %s", item, error)
 
-        return quote_list
+        return quote_result
+
+    def _fetch_last_quote_batch(self, batch: List[str]) -> dict:
+        started = time.perf_counter()
+        try:
+            return self._get_json(last_quote_url(batch))
+        finally:
+            record_fetch(batch, started)
+
+    def _fetch_history_quote(
+        self, item: str, reference_date: int, extracted_at: int
+    ) -> CurrencyQuote:
+        url = (
+            f"{API.ENDPOINT_HISTORY_COTATION}{item}"
+            f"?start_date={reference_date}&end_date={reference_date}"
+        )
+
+        started = time.perf_counter()
+        try:
+            response = self._get_json(url)
+        finally:
+            record_fetch([item], started)
+
+        with get_metrics().timer("currency_quote_phase_seconds", phase="parse"):
+            return parse_history_quote(item, response, extracted_at)
+
+    def _get_json(self, url: str):
+        return IN_FLIGHT.do(
+            (id(self.transport), url), lambda: self.transport.get_json(url)
+        )
@@ -1,28 +1,30 @@
 # src/currency_quote/adapters/outbound/currency_validator_api.py
-from api_to_dataframe import ClientBuilder, RetryStrategies
-from currency_quote.config.endpoints import API
+from typing import Optional
+from currency_quote.adapters.outbound.parities_cache import PARITIES_CACHE
 from currency_quote.application.ports.outbound.currency_validator_repository import (
     ICurrencyValidator,
 )
+from currency_quote.application.ports.outbound.http_transport import IHttpTransport
+from currency_quote.config.endpoints import API
 from currency_quote.domain.entities.currency import CurrencyObject
 
 
 class CurrencyValidatorAPI(ICurrencyValidator):
-    def __init__(self, currency_quote: CurrencyObject) -> None:
+    def __init__(
+        self, currency_quote: CurrencyObject, transport: Optional[IHttpTransport] = None
+    ) -> None:
         self.currency_quote = currency_quote
+        self.transport = transport
 
     def validate_currency_code(self) -> list:
-        client = ClientBuilder(
-            endpoint=API.ENDPOINT_AVALIABLE_PARITIES,
-            retry_strategy=RetryStrategies.LINEAR_RETRY_STRATEGY,
+        # Without an injected transport the shared cache uses its own loader.
+        parity_index = PARITIES_CACHE.get_index(
+            loader=self._load_parities if self.transport is not None else None
         )
 
-        valid_list = client.get_api_data()
-
-        validated_list = []
-
-        for currency_code in self.currency_quote.get_currency_list():
-            if currency_code in valid_list:
-                validated_list.append(currency_code)
+        validated_list, _ = parity_index.split(self.currency_quote.get_currency_list())
 
         return validated_list
+
+    def _load_parities(self):
+        return self.transport.get_json(API.ENDPOINT_AVALIABLE_PARITIES)
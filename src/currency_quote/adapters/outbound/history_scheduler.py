@@ -0,0 +1,253 @@
+import json
+import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from currency_quote.adapters.outbound.currency_api import CurrencyAPI
+from currency_quote.application.ports.outbound.currency_repository import (
+    ICurrencyRepository,
+)
+from currency_quote.config.endpoints import API
+from currency_quote.domain.entities.currency import CurrencyObject
+from currency_quote.domain.entities.history_matrix import HistoryMatrix
+from currency_quote.utils.dates import (
+    contiguous_ranges,
+    date_windows,
+    is_valid_reference_date,
+    timestamp_to_reference_date,
+)
+from currency_quote.utils.logger import get_logger
+from currency_quote.utils.metrics import get_metrics
+from currency_quote.utils.resilience import AdaptiveTokenBucket
+
+logger = get_logger("history_scheduler")
+
+PriceRow = Tuple[int, float, float]
+
+
+class HistoryJob(NamedTuple):
+    """One ranged /json/daily/ request: a pair between two dates, inclusive."""
+
+    currency_pair: str
+    start_date: int
+    end_date: int
+
+
+def plan_history_jobs(
+    currency_pairs: Iterable[str],
+    reference_dates: Iterable[int],
+    max_days: int = API.HISTORY_MAX_DAYS_PER_REQUEST,
+) -> List[HistoryJob]:
+    """
+    Merge the dates into ranged requests, per pair.
+
+    Consecutive dates become one range, and ranges longer than the upstream
+    page limit are split, so each job is exactly one request.
+
+    Args:
+        currency_pairs: The pairs, e.g. ['USD-BRL', 'EUR-BRL'].
+        reference_dates: The dates as YYYYMMDD, in any order.
+        max_days: Maximum number of days per request.
+
+    Returns:
+        list: The jobs, grouped by pair, oldest range first.
+    """
+    windows = [
+        window
+        for start_date, end_date in contiguous_ranges(reference_dates)
+        for window in date_windows(start_date, end_date, max_days)
+    ]
+    return [
+        HistoryJob(currency_pair, start_date, end_date)
+        for currency_pair in dict.fromkeys(currency_pairs)
+        for start_date, end_date in windows
+    ]
+
+
+class HistoryCheckpoint:
+    """
+    Append-only JSON Lines record of the finished jobs and their prices.
+
+    Each finished job is one line, flushed as soon as it is written, so a
+    backfill interrupted at any point resumes from the last finished job. A line
+    cut short by the interruption is ignored.
+
+    Args:
+        path: The checkpoint file, created on first write.
+    """
+
+    def __init__(self, path: str):
+        self.path = os.path.expanduser(path)
+
+    def load(self) -> Dict[HistoryJob, List[PriceRow]]:
+        """Return the rows of every job recorded so far."""
+        finished: Dict[HistoryJob, List[PriceRow]] = {}
+
+        if not os.path.exists(self.path):
+            return finished
+
+        with open(self.path, encoding="utf-8") as file:
+            for line in file:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    logger.warning("Ignoring a truncated line of %s", self.path)
+                    continue
+                job = HistoryJob(
+                    entry["currency_pair"], entry["start_date"], entry["end_date"]
+                )
+                finished[job] = [tuple(row) for row in entry["rows"]]
+
+        return finished
+
+    def record(self, job: HistoryJob, rows: List[PriceRow]) -> None:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+
+        line = json.dumps({**job._asdict(), "rows": rows}, separators=(",", ":"))
+        with open(self.path, "a+b") as file:
+            if file.seek(0, os.SEEK_END):
+                file.seek(-1, os.SEEK_END)
+                if file.read(1) != b"\n":
+                    # End a line cut short by an interrupted run, or it swallows ours.
+                    file.write(b"\n")
+            file.write(line.encode("utf-8") + b"\n")
+            file.flush()
+
+
+class HistoryJobScheduler:
+    """
+    Fetch a (pairs × dates) history matrix with as few requests as possible.
+
+    Dates are merged into ranged requests per pair (see ``plan_history_jobs``),
+    which run on ``max_workers`` threads and start at no more than ``max_rate``
+    per second. Finished jobs are written to the checkpoint, if any, and are
+    not requested again by a later run over the same pairs and dates.
+
+    Args:
+        repository: Factory of the repository serving each pair's history.
+        max_workers: Maximum number of requests in flight.
+        max_rate: Maximum number of requests started per second.
+        checkpoint: Where finished jobs are recorded, for resuming.
+    """
+
+    def __init__(
+        self,
+        repository: Callable[[CurrencyObject], ICurrencyRepository] = CurrencyAPI,
+        max_workers: int = API.MAX_CONCURRENT_REQUESTS,
+        max_rate: float = API.RATE_LIMIT_PER_SECOND,
+        checkpoint: Optional[HistoryCheckpoint] = None,
+    ):
+        self.repository = repository
+        self.max_workers = max(1, max_workers)
+        self.rate_limiter = AdaptiveTokenBucket(
+            max_rate=max_rate,
+            burst=self.max_workers,
+            min_rate=max_rate,
+            max_wait_seconds=float("inf"),
+        )
+        self.checkpoint = checkpoint
+
+    def run(
+        self, currency_pairs: Iterable[str], reference_dates: Iterable[int]
+    ) -> HistoryMatrix:
+        """
+        Fetch every pair on every date.
+
+        Args:
+            currency_pairs: Validated pairs, e.g. ['USD-BRL', 'EUR-BRL'].
+            reference_dates: Dates as YYYYMMDD, each strictly before today.
+
+        Returns:
+            HistoryMatrix: The prices, NaN where there is no quote. Pairs with a
+                failed job are listed in ``errors``; run again to retry them.
+
+        Raises:
+            ValueError: If a date is malformed or not in the past.
+        """
+        matrix = HistoryMatrix(currency_pairs, reference_dates)
+        invalid = [
+            day for day in matrix.reference_dates if not is_valid_reference_date(day)
+        ]
+        if invalid:
+            raise ValueError(f"Invalid reference dates: {invalid}")
+
+        metrics = get_metrics()
+        finished = self.checkpoint.load() if self.checkpoint is not None else {}
+        jobs = plan_history_jobs(matrix.currency_pairs, matrix.reference_dates)
+        pending = []
+
+        for job in jobs:
+            if job in finished:
+                matrix.fill(job.currency_pair, finished[job])
+                metrics.increment(
+                    "currency_quote_history_jobs_total", outcome="resumed"
+                )
+            else:
+                pending.append(job)
+
+        logger.info(
+            "Fetching %d history jobs, %d resumed from the checkpoint",
+            len(pending),
+            len(jobs) - len(pending),
+        )
+
+        for job, rows, error in self._run_jobs(pending):
+            if error is not None:
+                logger.error(
+                    "Failed to fetch history of %s from %d to %d: %s",
+                    *job,
+                    error,
+                )
+                matrix.errors[job.currency_pair] = error
+                metrics.increment("currency_quote_history_jobs_total", outcome="error")
+                continue
+
+            matrix.fill(job.currency_pair, rows)
+            if self.checkpoint is not None:
+                self.checkpoint.record(job, rows)
+            metrics.increment("currency_quote_history_jobs_total", outcome="ok")
+
+        return matrix
+
+    def _run_jobs(self, jobs: List[HistoryJob]):
+        """Yield (job, rows, error) as jobs finish, ``max_workers`` at a time."""
+        if not jobs:
+            return
+
+        # Jobs are submitted as others finish rather than all at once, so an
+        # interrupted run only waits for the requests already in flight.
+        queued = iter(jobs)
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(jobs))
+        ) as executor:
+            running = {}
+            for job in queued:
+                running[executor.submit(self._fetch, job)] = job
+                if len(running) == self.max_workers:
+                    break
+
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job = running.pop(future)
+                    error = future.exception()
+                    yield job, None if error else future.result(), error
+
+                    following = next(queued, None)
+                    if following is not None:
+                        running[executor.submit(self._fetch, following)] = following
+
+    def _fetch(self, job: HistoryJob) -> List[PriceRow]:
+        self.rate_limiter.acquire()
+        quotes = self.repository(CurrencyObject([job.currency_pair])).get_history_range(
+            job.start_date, job.end_date
+        )
+        return [
+            (
+                timestamp_to_reference_date(quote.quote_timestamp),
+                quote.bid_price,
+                quote.ask_price,
+            )
+            for quote in quotes
+        ]
@@ -0,0 +1,272 @@
+import asyncio
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Optional
+
+from currency_quote.application.ports.outbound.http_transport import IHttpTransport
+from currency_quote.config.endpoints import API
+from currency_quote.utils.logger import get_logger
+from currency_quote.utils.metrics import get_metrics
+from currency_quote.utils.resilience import (
+    AdaptiveTokenBucket,
+    CircuitBreaker,
+    CircuitOpenError,
+    RateLimitedError,
+)
+
+if TYPE_CHECKING:
+    import requests
+
+logger = get_logger("http_transport")
+
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+def is_transient_error(exc: BaseException) -> bool:
+    """
+    Whether a failed request may succeed if it is sent again.
+
+    Connection errors, timeouts and the statuses in ``RETRYABLE_STATUS_CODES``
+    are transient, whether raised by requests or aiohttp. An open circuit or an
+    exhausted rate limit is not, nor is a body that could not be decoded.
+    """
+    if isinstance(exc, (CircuitOpenError, RateLimitedError, ValueError)):
+        return False
+
+    status_code = getattr(getattr(exc, "response", None), "status_code", None)
+    if status_code is None:
+        status_code = getattr(exc, "status", None)
+    if status_code is not None:
+        return status_code in RETRYABLE_STATUS_CODES
+
+    # aiohttp is optional: if it is not imported, none of its errors was raised.
+    aiohttp = sys.modules.get("aiohttp")
+    if aiohttp is not None and isinstance(exc, aiohttp.ClientConnectionError):
+        return True
+    return isinstance(exc, (OSError, asyncio.TimeoutError))
+
+
+def endpoint_label(url: str) -> str:
+    """Return the endpoint a URL calls, e.g. 'last', to label metrics by."""
+    for label, endpoint in (
+        ("last", API.ENDPOINT_LAST_COTATION),
+        ("daily", API.ENDPOINT_HISTORY_COTATION),
+        ("available", API.ENDPOINT_AVALIABLE_PARITIES),
+    ):
+        if url.startswith(endpoint):
+            return label
+    return "other"
+
+
+class RequestsTransport(IHttpTransport):
+    """
+    Keep-alive HTTP transport backed by a pooled ``requests.Session``.
+
+    One instance is meant to be shared by every outbound adapter in the process,
+    so TCP and TLS connections to the quote API are reused across calls.
+    Compressed responses are requested and decoded transparently. Calls go
+    through a circuit breaker, which fails fast while upstream is down, and an
+    adaptive rate limiter, which backs off when upstream answers 429.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        pool_connections: int = API.POOL_CONNECTIONS,
+        pool_maxsize: int = API.POOL_MAXSIZE,
+        connect_timeout: float = API.CONNECTION_TIMEOUT_SECONDS,
+        read_timeout: float = API.READ_TIMEOUT_SECONDS,
+        retry_attempts: int = API.RETRY_ATTEMPTS,
+        retry_time_seconds: float = API.RETRY_TIME_SECONDS,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        rate_limiter: Optional[AdaptiveTokenBucket] = None,
+    ):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.timeout = (connect_timeout, read_timeout)
+        self.retry_attempts = retry_attempts
+        self.retry_time_seconds = retry_time_seconds
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.rate_limiter = rate_limiter or AdaptiveTokenBucket()
+        self._session: Optional["requests.Session"] = None
+        self._lock = threading.Lock()
+
+    @property
+    def session(self) -> "requests.Session":
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self._build_session()
+
+        return self._session
+
+    def _build_session(self) -> "requests.Session":
+        # Imported here so that loading the package does not load the HTTP stack.
+        import requests  # pylint: disable=import-outside-toplevel
+        from requests.adapters import (  # pylint: disable=import-outside-toplevel
+            HTTPAdapter,
+        )
+        from requests.utils import (  # pylint: disable=import-outside-toplevel
+            DEFAULT_ACCEPT_ENCODING,
+        )
+
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=0,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update(
+            {"Accept": "application/json", "Accept-Encoding": DEFAULT_ACCEPT_ENCODING}
+        )
+        return session
+
+    @property
+    def state(self) -> dict:
+        """Current circuit state and allowed request rate, e.g. for health checks."""
+        return {
+            "circuit": self.circuit_breaker.state,
+            "consecutive_failures": self.circuit_breaker.failures,
+            "rate_per_second": self.rate_limiter.rate,
+        }
+
+    def get_json(self, url: str) -> Any:
+        """
+        Fetch a JSON document, retrying connection errors and retryable statuses.
+
+        Args:
+            url: The URL to fetch.
+
+        Returns:
+            The decoded JSON body.
+
+        Raises:
+            CircuitOpenError: If upstream is considered down; nothing is sent.
+            RateLimitedError: If the rate limiter cannot admit the call in time.
+            requests.RequestException: If the request still fails after every attempt.
+        """
+        import requests  # pylint: disable=import-outside-toplevel
+
+        metrics = get_metrics()
+        endpoint = endpoint_label(url) if metrics.enabled else ""
+        self.circuit_breaker.before_call()
+        attempt = 0
+
+        while True:
+            try:
+                self.rate_limiter.acquire()
+            except RateLimitedError:
+                self.circuit_breaker.cancel()
+                raise
+
+            try:
+                with metrics.timer(
+                    "currency_quote_http_request_seconds", endpoint=endpoint
+                ):
+                    response = self.session.get(url, timeout=self.timeout)
+                    response.raise_for_status()
+                    payload = response.json()
+            except requests.RequestException as exc:
+                metrics.increment(
+                    "currency_quote_http_requests_total",
+                    endpoint=endpoint,
+                    outcome=str(self._status_code(exc) or "error"),
+                )
+                if self._is_throttled(exc):
+                    self.rate_limiter.throttle(self._retry_after(exc))
+
+                attempt += 1
+                if attempt >= self.retry_attempts or not self._is_retryable(exc):
+                    logger.error("Request failed after %d attempts: %s", attempt, url)
+                    if self._is_upstream_failure(exc):
+                        self.circuit_breaker.record_failure()
+                    else:
+                        self.circuit_breaker.record_success()
+                    raise
+                metrics.increment(
+                    "currency_quote_http_retries_total", endpoint=endpoint
+                )
+                time.sleep(self.retry_time_seconds * attempt)
+            else:
+                metrics.increment(
+                    "currency_quote_http_requests_total",
+                    endpoint=endpoint,
+                    outcome="ok",
+                )
+                metrics.observe(
+                    "currency_quote_http_response_bytes",
+                    len(response.content),
+                    endpoint=endpoint,
+                )
+                self.rate_limiter.relax()
+                self.circuit_breaker.record_success()
+                return payload
+
+    @staticmethod
+    def _status_code(exc: "requests.RequestException") -> Optional[int]:
+        from requests import HTTPError  # pylint: disable=import-outside-toplevel
+
+        if isinstance(exc, HTTPError) and exc.response is not None:
+            return exc.response.status_code
+        return None
+
+    @classmethod
+    def _is_retryable(cls, exc: "requests.RequestException") -> bool:
+        status_code = cls._status_code(exc)
+        return status_code is None or status_code in RETRYABLE_STATUS_CODES
+
+    @classmethod
+    def _is_throttled(cls, exc: "requests.RequestException") -> bool:
+        return cls._status_code(exc) == 429
+
+    @classmethod
+    def _is_upstream_failure(cls, exc: "requests.RequestException") -> bool:
+        status_code = cls._status_code(exc)
+        return status_code is None or status_code >= 500 or status_code == 429
+
+    @staticmethod
+    def _retry_after(exc: "requests.RequestException") -> Optional[float]:
+        try:
+            return float(exc.response.headers["Retry-After"])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def close(self) -> None:
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+
+# Every adapter talks to the same upstream, so they share its health and budget.
+UPSTREAM_CIRCUIT_BREAKER = CircuitBreaker()
+UPSTREAM_RATE_LIMITER = AdaptiveTokenBucket()
+
+HTTP_TRANSPORT = RequestsTransport(
+    circuit_breaker=UPSTREAM_CIRCUIT_BREAKER, rate_limiter=UPSTREAM_RATE_LIMITER
+)
+
+_transport: IHttpTransport = HTTP_TRANSPORT
+
+
+def get_transport() -> IHttpTransport:
+    return _transport
+
+
+def set_transport(transport: Optional[IHttpTransport]) -> IHttpTransport:
+    """
+    Install the transport used by adapters that were not given one.
+
+    Args:
+        transport: The transport to use, e.g. a ``ReplayTransport``, or None to
+            go back to ``HTTP_TRANSPORT``.
+
+    Returns:
+        IHttpTransport: The previously installed transport.
+    """
+    global _transport  # pylint: disable=global-statement
+    previous = _transport
+    _transport = transport if transport is not None else HTTP_TRANSPORT
+    return previous
@@ -0,0 +1,127 @@
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Tuple
+
+from currency_quote.config.cache import Cache
+from currency_quote.domain.entities.currency import CurrencyQuote
+from currency_quote.utils.metrics import get_metrics
+
+
+class LastQuoteCache:
+    """
+    Thread-safe, per-pair cache of the most recent quotes.
+
+    Each pair is cached on its own, so overlapping pair sets share entries and
+    only the pairs that are missing or older than ``ttl_seconds`` need to be
+    fetched again. A ``ttl_seconds`` of zero disables caching.
+
+    Expired quotes can still be served by ``stale`` while upstream is down, for
+    up to ``stale_seconds`` past their TTL. Older entries are dropped as new
+    quotes are stored, so the cache only holds pairs requested recently.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = Cache.LAST_QUOTE_TTL_SECONDS,
+        stale_seconds: float = Cache.LAST_QUOTE_STALE_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Tuple[float, CurrencyQuote]] = {}
+        self._purged_at = clock()
+
+    def lookup(
+        self, currency_list: Iterable[str]
+    ) -> Tuple[Dict[str, CurrencyQuote], List[str]]:
+        """
+        Split the requested pairs into fresh cached quotes and pairs to fetch.
+
+        Args:
+            currency_list: The pair codes requested, e.g. ['USD-BRL', 'EUR-BRL'].
+
+        Returns:
+            tuple: (fresh quotes keyed by pair, missing or stale pairs without
+                duplicates, in the input order).
+        """
+        fresh: Dict[str, CurrencyQuote] = {}
+        missing: Dict[str, None] = {}
+        now = self.clock()
+
+        with self._lock:
+            for currency_pair in currency_list:
+                entry = self._entries.get(currency_pair)
+                if entry is not None and now - entry[0] < self.ttl_seconds:
+                    fresh[currency_pair] = entry[1]
+                else:
+                    missing[currency_pair] = None
+
+        _record_lookup(len(fresh), len(missing))
+        return fresh, list(missing)
+
+    def stale(self, currency_list: Iterable[str]) -> Dict[str, CurrencyQuote]:
+        """Return the cached quotes of the pairs, expired or not, up to the max age."""
+        max_age = self.ttl_seconds + self.stale_seconds
+        now = self.clock()
+
+        quotes: Dict[str, CurrencyQuote] = {}
+
+        with self._lock:
+            for currency_pair in currency_list:
+                entry = self._entries.get(currency_pair)
+                if entry is not None and now - entry[0] < max_age:
+                    quotes[currency_pair] = entry[1]
+
+        return quotes
+
+    def store(self, quotes: Iterable[CurrencyQuote]) -> None:
+        if self.ttl_seconds <= 0:
+            return
+
+        now = self.clock()
+
+        with self._lock:
+            for quote in quotes:
+                self._entries[quote.currency_pair] = (now, quote)
+            # A full scan at most once per TTL keeps stores cheap on the hot path.
+            if now - self._purged_at >= self.ttl_seconds:
+                self._purge(now)
+
+    def _purge(self, now: float) -> None:
+        max_age = self.ttl_seconds + self.stale_seconds
+        self._entries = {
+            currency_pair: entry
+            for currency_pair, entry in self._entries.items()
+            if now - entry[0] < max_age
+        }
+        self._purged_at = now
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _record_lookup(hits: int, misses: int) -> None:
+    metrics = get_metrics()
+    if hits:
+        metrics.increment(
+            "currency_quote_cache_requests_total",
+            hits,
+            cache="last_quote",
+            result="hit",
+        )
+    if misses:
+        metrics.increment(
+            "currency_quote_cache_requests_total",
+            misses,
+            cache="last_quote",
+            result="miss",
+        )
+
+
+LAST_QUOTE_CACHE = LastQuoteCache()
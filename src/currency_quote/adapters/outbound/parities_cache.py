@@ -0,0 +1,270 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Callable, Optional, Union
+
+from currency_quote.adapters.outbound.http_transport import get_transport
+from currency_quote.config.cache import Cache
+from currency_quote.config.endpoints import API
+from currency_quote.domain.entities.parity_index import ParityIndex
+from currency_quote.utils.logger import get_logger
+from currency_quote.utils.metrics import get_metrics
+
+logger = get_logger("parities_cache")
+
+
+def fetch_available_parities() -> Union[dict, list]:
+    return get_transport().get_json(API.ENDPOINT_AVALIABLE_PARITIES)
+
+
+class ParitiesCache:
+    """
+    Thread-safe cache for the available parities document.
+
+    Entries younger than ``ttl_seconds`` are served as they are. Entries older
+    than that but still inside ``stale_seconds`` are served immediately while a
+    single background thread refreshes them. Older entries are refreshed
+    synchronously, falling back to the stale copy if the upstream call fails.
+    When ``snapshot_path`` is set, every successful refresh is persisted there
+    and a cold process starts from that file instead of the network.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        loader: Callable[[], Union[dict, list]] = fetch_available_parities,
+        ttl_seconds: float = Cache.PARITIES_TTL_SECONDS,
+        stale_seconds: float = Cache.PARITIES_STALE_SECONDS,
+        snapshot_path: Optional[str] = Cache.PARITIES_SNAPSHOT_PATH,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.loader = loader
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.snapshot_path = snapshot_path
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._refreshing = False
+        self._snapshot_loaded = False
+        self._parities: Optional[dict] = None
+        self._fetched_at = 0.0
+        self._version = ""
+        self._index: Optional[ParityIndex] = None
+
+    @property
+    def fetched_at(self) -> float:
+        return self._fetched_at
+
+    @property
+    def version(self) -> str:
+        """Content hash of the cached parity list, empty until it is loaded."""
+        return self._version
+
+    def get(self, loader: Optional[Callable[[], Union[dict, list]]] = None) -> dict:
+        """
+        Return the available parities, mapping each pair code to its name.
+
+        Args:
+            loader: Loader to use if a blocking load is needed, instead of the
+                cache's own one (e.g. one bound to an injected transport).
+
+        Returns:
+            dict: The cached parities document.
+
+        Raises:
+            Exception: Whatever the loader raised, if there is no copy to fall back to.
+        """
+        loader = loader or self.loader
+        parities = self.peek(loader)
+
+        if parities is not None:
+            return parities
+
+        return self._refresh(self._fetched_at, loader)
+
+    def peek(
+        self, loader: Optional[Callable[[], Union[dict, list]]] = None
+    ) -> Optional[dict]:
+        """
+        Return the parities if they can be served without a blocking load.
+
+        A stale entry is returned as well, after scheduling a background refresh.
+
+        Args:
+            loader: Loader the background refresh uses, see ``get``.
+
+        Returns:
+            dict or None: The cached parities, or None when a load is required.
+        """
+        with self._lock:
+            if not self._snapshot_loaded:
+                self._snapshot_loaded = True
+                self._load_snapshot()
+
+            parities = self._parities
+            age = self.clock() - self._fetched_at
+
+            if parities is None or age >= self.ttl_seconds + self.stale_seconds:
+                result = "miss"
+            elif age >= self.ttl_seconds:
+                result = "stale"
+                self._start_background_refresh(loader or self.loader)
+            else:
+                result = "hit"
+
+        get_metrics().increment(
+            "currency_quote_cache_requests_total", cache="parities", result=result
+        )
+        return None if result == "miss" else parities
+
+    def put(self, data: Union[dict, list]) -> dict:
+        """
+        Store a parities document fetched by the caller, e.g. an async adapter.
+
+        Args:
+            data: The /json/available response, as a mapping or a list of pairs.
+
+        Returns:
+            dict: The stored parities.
+        """
+        return self._store(data)
+
+    def get_index(
+        self, loader: Optional[Callable[[], Union[dict, list]]] = None
+    ) -> ParityIndex:
+        """
+        Return the parity index for the current parity list.
+
+        The index is built once per parity-list version and shared afterwards.
+
+        Args:
+            loader: Optional loader override, see ``get``.
+
+        Returns:
+            ParityIndex: The index over the cached parities.
+        """
+        parities = self.get(loader)
+
+        # A refresh may have replaced the entry since; index what get returned.
+        with self._lock:
+            index, version = self._index, self._version
+            current = self._parities is parities
+        if not current:
+            version = self._hash(parities)
+
+        if index is not None and index.version == version:
+            return index
+
+        index = ParityIndex.from_parities(parities, version=version)
+
+        with self._lock:
+            if self._parities is parities:
+                self._index = index
+
+        return index
+
+    def clear(self) -> None:
+        with self._lock:
+            self._parities = None
+            self._fetched_at = 0.0
+            self._version = ""
+            self._index = None
+            self._snapshot_loaded = True
+
+    def _refresh(
+        self, observed_fetched_at: float, loader: Callable[[], Union[dict, list]]
+    ) -> dict:
+        with self._refresh_lock:
+            # Another caller may have refreshed the entry while we waited.
+            if self._parities is not None and self._fetched_at != observed_fetched_at:
+                return self._parities
+
+            try:
+                return self._store(loader())
+            except Exception:  # pylint: disable=broad-exception-caught
+                if self._parities is None:
+                    raise
+                logger.warning(
+                    "Could not refresh available parities, serving stale copy",
+                    exc_info=True,
+                )
+                return self._parities
+
+    def _start_background_refresh(
+        self, loader: Callable[[], Union[dict, list]]
+    ) -> None:
+        if self._refreshing:
+            return
+
+        self._refreshing = True
+        threading.Thread(
+            target=self._background_refresh,
+            args=(loader,),
+            name="parities-refresh",
+            daemon=True,
+        ).start()
+
+    def _background_refresh(self, loader: Callable[[], Union[dict, list]]) -> None:
+        try:
+            with self._refresh_lock:
+                self._store(loader())
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.warning(
+                "Background refresh of available parities failed", exc_info=True
+            )
+        finally:
+            self._refreshing = False
+
+    def _store(
+        self, data: Union[dict, list], fetched_at: Optional[float] = None
+    ) -> dict:
+        parities = data if isinstance(data, dict) else dict.fromkeys(data)
+        fetched_at = self.clock() if fetched_at is None else fetched_at
+        version = self._hash(parities)
+
+        with self._lock:
+            self._parities = parities
+            self._fetched_at = fetched_at
+            self._version = version
+
+        if self.snapshot_path:
+            self._write_snapshot(parities, fetched_at)
+
+        return parities
+
+    @staticmethod
+    def _hash(parities: dict) -> str:
+        return hashlib.sha1("\n".join(sorted(parities)).encode("utf-8")).hexdigest()
+
+    def _load_snapshot(self) -> None:
+        if not self.snapshot_path or not os.path.exists(self.snapshot_path):
+            return
+
+        try:
+            with open(self.snapshot_path, encoding="utf-8") as snapshot:
+                content = json.load(snapshot)
+            self._parities = content["parities"]
+            self._fetched_at = float(content["fetched_at"])
+            self._version = self._hash(self._parities)
+        except (OSError, ValueError, KeyError, TypeError):
+            logger.warning(
+                "Ignoring unreadable parities snapshot: %s", self.snapshot_path
+            )
+
+    def _write_snapshot(self, parities: dict, fetched_at: float) -> None:
+        directory = os.path.dirname(os.path.abspath(self.snapshot_path))
+
+        try:
+            os.makedirs(directory, exist_ok=True)
+            file_descriptor, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(file_descriptor, "w", encoding="utf-8") as snapshot:
+                json.dump({"fetched_at": fetched_at, "parities": parities}, snapshot)
+            os.replace(tmp_path, self.snapshot_path)
+        except OSError:
+            logger.warning("Could not write parities snapshot: %s", self.snapshot_path)
+
+
+PARITIES_CACHE = ParitiesCache()
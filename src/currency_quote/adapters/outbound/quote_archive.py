@@ -0,0 +1,150 @@
+import json
+import mmap
+import os
+import threading
+from typing import Any, Dict, List, NamedTuple, Optional
+from urllib.parse import urlsplit
+
+
+class ArchivedResponse(NamedTuple):
+    """One recorded answer: status 200 and the JSON body, or a failure and its text."""
+
+    status: int
+    elapsed_seconds: float
+    body: Any
+
+
+class _Entry(NamedTuple):
+    status: int
+    elapsed_seconds: float
+    start: int
+    end: int
+
+
+def archive_key(url: str) -> str:
+    """Key a URL by path and query only, so recordings replay under any API base URL."""
+    parts = urlsplit(url)
+    return f"{parts.path}?{parts.query}" if parts.query else parts.path
+
+
+class QuoteArchive:
+    """
+    Append-only archive of upstream responses, one line per response.
+
+    Each line is ``key<TAB>status<TAB>elapsed<TAB>json body``. The file is
+    memory-mapped for reading and indexed once by scanning the line headers
+    only, so opening a large archive does not decode any body; a body is decoded
+    when it is replayed. Responses recorded several times for the same URL are
+    replayed in recording order, then from the start again.
+
+    Args:
+        path: The archive file, created on first write.
+    """
+
+    def __init__(self, path: str):
+        self.path = os.path.expanduser(path)
+        self._lock = threading.Lock()
+        self._writer = None
+        self._file = None
+        self._map: Optional[mmap.mmap] = None
+        self._index: Optional[Dict[str, List[_Entry]]] = None
+        self._cursors: Dict[str, int] = {}
+
+    def append(self, url: str, status: int, elapsed_seconds: float, body: Any) -> None:
+        """
+        Record one response, flushed to disk before returning.
+
+        Args:
+            url: The requested URL.
+            status: 200 for a success, else the HTTP status or 0 for no response.
+            elapsed_seconds: How long the request took.
+            body: The decoded JSON body, or the error message of a failure.
+        """
+        line = "\t".join(
+            (archive_key(url), str(status), repr(elapsed_seconds), json.dumps(body))
+        )
+
+        with self._lock:
+            if self._writer is None:
+                directory = os.path.dirname(os.path.abspath(self.path))
+                os.makedirs(directory, exist_ok=True)
+                self._writer = open(
+                    self.path, "ab"
+                )  # pylint: disable=consider-using-with
+            self._writer.write(line.encode("utf-8") + b"\n")
+            self._writer.flush()
+            self._close_map()
+
+    def next_response(self, url: str) -> ArchivedResponse:
+        """
+        Return the next recorded response of a URL.
+
+        Raises:
+            KeyError: If the URL was never recorded.
+        """
+        key = archive_key(url)
+
+        with self._lock:
+            entries = self._load_index().get(key)
+            if not entries:
+                raise KeyError(f"No recorded response for {key}")
+            position = self._cursors.get(key, 0)
+            self._cursors[key] = (position + 1) % len(entries)
+            entry = entries[position]
+            raw = self._map[entry.start : entry.end]
+
+        return ArchivedResponse(entry.status, entry.elapsed_seconds, json.loads(raw))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(entries) for entries in self._load_index().values())
+
+    def rewind(self) -> None:
+        """Replay every URL from its first recorded response again."""
+        with self._lock:
+            self._cursors.clear()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+            self._close_map()
+
+    def _load_index(self) -> Dict[str, List[_Entry]]:
+        if self._index is not None:
+            return self._index
+
+        self._index = {}
+        if not os.path.exists(self.path) or not os.path.getsize(self.path):
+            return self._index
+
+        self._file = open(self.path, "rb")  # pylint: disable=consider-using-with
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        view, size, position = self._map, len(self._map), 0
+
+        while position < size:
+            end = view.find(b"\n", position)
+            if end == -1:
+                break  # a line cut short by an interrupted recording
+            key_end = view.find(b"\t", position, end)
+            status_end = view.find(b"\t", key_end + 1, end)
+            elapsed_end = view.find(b"\t", status_end + 1, end)
+            self._index.setdefault(view[position:key_end].decode("utf-8"), []).append(
+                _Entry(
+                    int(view[key_end + 1 : status_end]),
+                    float(view[status_end + 1 : elapsed_end]),
+                    elapsed_end + 1,
+                    end,
+                )
+            )
+            position = end + 1
+
+        return self._index
+
+    def _close_map(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._file.close()
+            self._map = self._file = None
+        self._index = None
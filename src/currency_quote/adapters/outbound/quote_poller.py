@@ -0,0 +1,283 @@
+import asyncio
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from currency_quote.adapters.outbound.currency_api import CurrencyAPI
+from currency_quote.adapters.outbound.last_quote_cache import (
+    LAST_QUOTE_CACHE,
+    LastQuoteCache,
+)
+from currency_quote.application.ports.outbound.currency_repository import (
+    ICurrencyRepository,
+)
+from currency_quote.domain.entities.currency import CurrencyObject, CurrencyQuote
+from currency_quote.utils.logger import get_logger
+
+logger = get_logger("quote_poller")
+
+_CLOSED = object()
+
+
+class QuoteSubscription:
+    """
+    Iterator over the quotes of a set of pairs, as they change upstream.
+
+    A quote is delivered the first time it is seen and then only when its
+    timestamp, bid or ask differ from the last one delivered for that pair.
+    Iteration blocks until the next change and ends once ``close`` is called.
+    """
+
+    def __init__(
+        self,
+        poller: "QuotePoller",
+        currency_list: Iterable[str],
+        interval: float,
+        transform: Optional[Callable[[CurrencyQuote], Any]] = None,
+    ):
+        self.currency_list = list(dict.fromkeys(currency_list))
+        self.interval = interval
+        self.transform = transform
+        self.closed = False
+        self._poller = poller
+        self._pairs = frozenset(self.currency_list)
+        self._last_seen: Dict[str, Tuple[int, float, float]] = {}
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+
+    def offer(self, quotes: Iterable[CurrencyQuote]) -> None:
+        """Deliver the quotes of this subscription's pairs that changed."""
+        for quote in quotes:
+            currency_pair = quote.currency_pair
+            if currency_pair not in self._pairs:
+                continue
+
+            key = (quote.quote_timestamp, quote.bid_price, quote.ask_price)
+            if self._last_seen.get(currency_pair) != key:
+                self._last_seen[currency_pair] = key
+                self._put(quote)
+
+    def close(self) -> None:
+        if self.closed:
+            return
+
+        self.closed = True
+        self._poller.unsubscribe(self)
+        self._put(_CLOSED)
+
+    def _put(self, item: Any) -> None:
+        self._queue.put(item)
+
+    def _present(self, item: Any) -> Any:
+        return self.transform(item) if self.transform else item
+
+    def __iter__(self) -> "QuoteSubscription":
+        return self
+
+    def __next__(self) -> Any:
+        item = self._queue.get()
+        if item is _CLOSED:
+            raise StopIteration
+        return self._present(item)
+
+    def __enter__(self) -> "QuoteSubscription":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class AsyncQuoteSubscription(QuoteSubscription):
+    """Async counterpart of QuoteSubscription, bound to the current event loop."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._loop = asyncio.get_running_loop()
+        self._async_queue: "asyncio.Queue[Any]" = asyncio.Queue()
+
+    def _put(self, item: Any) -> None:
+        try:
+            self._loop.call_soon_threadsafe(self._async_queue.put_nowait, item)
+        except RuntimeError:
+            # The event loop is already closed, nobody is left to read the quote.
+            pass
+
+    def __aiter__(self) -> "AsyncQuoteSubscription":
+        return self
+
+    async def __anext__(self) -> Any:
+        item = await self._async_queue.get()
+        if item is _CLOSED:
+            raise StopAsyncIteration
+        return self._present(item)
+
+    async def __aenter__(self) -> "AsyncQuoteSubscription":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _stream_repository(currency_obj: CurrencyObject) -> ICurrencyRepository:
+    # The poller must see every upstream change, so it bypasses the TTL cache.
+    return CurrencyAPI(currency_obj, quote_cache=LastQuoteCache(ttl_seconds=0))
+
+
+class QuotePoller:
+    """
+    Process-wide scheduler that polls /last/ on behalf of every subscription.
+
+    Subscriptions sharing an interval are served by a single request per tick
+    for the union of their pairs, however many there are. A subscription
+    joining a group gets the group's last quotes at once, and only its pairs
+    the group does not poll yet are fetched before the next tick. A daemon
+    thread runs while at least one subscription is open.
+    """
+
+    def __init__(
+        self,
+        repository: Callable[
+            [CurrencyObject], ICurrencyRepository
+        ] = _stream_repository,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.repository = repository
+        self.clock = clock
+        self._condition = threading.Condition()
+        self._subscriptions: Dict[float, List[QuoteSubscription]] = {}
+        self._next_due: Dict[float, float] = {}
+        self._polled_pairs: Dict[float, Set[str]] = {}
+        self._new_pairs: Dict[float, List[str]] = {}
+        self._last_quotes: Dict[float, Dict[str, CurrencyQuote]] = {}
+        self._thread: Optional[threading.Thread] = None
+
+    def subscribe(
+        self,
+        currency_list: Iterable[str],
+        interval: float,
+        transform: Optional[Callable[[CurrencyQuote], Any]] = None,
+        asynchronous: bool = False,
+    ) -> QuoteSubscription:
+        """
+        Start receiving the changes of the given pairs.
+
+        Args:
+            currency_list: The pairs to follow, e.g. ['USD-BRL', 'EUR-BRL'].
+            interval: Seconds between two upstream polls.
+            transform: Optional callable applied to each quote before delivery.
+            asynchronous: Return an async iterator bound to the running loop.
+
+        Returns:
+            QuoteSubscription: The subscription; close it to stop receiving.
+
+        Raises:
+            ValueError: If the interval is not positive.
+        """
+        if interval <= 0:
+            raise ValueError("Streaming interval must be greater than zero")
+
+        subscription_class = (
+            AsyncQuoteSubscription if asynchronous else QuoteSubscription
+        )
+        subscription = subscription_class(self, currency_list, interval, transform)
+
+        with self._condition:
+            group = self._subscriptions.setdefault(interval, [])
+            group.append(subscription)
+
+            if len(group) == 1:
+                self._next_due[interval] = self.clock()
+            elif interval in self._polled_pairs:
+                # Newcomers get the current quotes right away, not one interval
+                # later, without the rest of the group polling again.
+                subscription.offer(self._last_quotes.get(interval, {}).values())
+                polled = self._polled_pairs[interval]
+                new_pairs = [
+                    pair for pair in subscription.currency_list if pair not in polled
+                ]
+                if new_pairs:
+                    polled.update(new_pairs)
+                    self._new_pairs.setdefault(interval, []).extend(new_pairs)
+
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="quote-poller", daemon=True
+                )
+                self._thread.start()
+
+            self._condition.notify()
+
+        return subscription
+
+    def unsubscribe(self, subscription: QuoteSubscription) -> None:
+        with self._condition:
+            group = self._subscriptions.get(subscription.interval, [])
+            if subscription in group:
+                group.remove(subscription)
+            if not group:
+                self._subscriptions.pop(subscription.interval, None)
+                self._next_due.pop(subscription.interval, None)
+                self._polled_pairs.pop(subscription.interval, None)
+                self._new_pairs.pop(subscription.interval, None)
+                self._last_quotes.pop(subscription.interval, None)
+            self._condition.notify()
+
+    def subscriber_count(self) -> int:
+        with self._condition:
+            return sum(len(group) for group in self._subscriptions.values())
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if not self._subscriptions:
+                    self._thread = None
+                    return
+
+                if self._new_pairs:
+                    interval, currency_list = self._new_pairs.popitem()
+                else:
+                    interval, due = min(
+                        self._next_due.items(), key=lambda item: item[1]
+                    )
+                    now = self.clock()
+
+                    if due > now:
+                        self._condition.wait(due - now)
+                        continue
+
+                    currency_list = list(
+                        dict.fromkeys(
+                            currency_pair
+                            for subscription in self._subscriptions[interval]
+                            for currency_pair in subscription.currency_list
+                        )
+                    )
+                    self._polled_pairs[interval] = set(currency_list)
+                    next_due = due + interval
+                    self._next_due[interval] = (
+                        next_due if next_due > now else now + interval
+                    )
+
+            self._poll(interval, currency_list)
+
+    def _poll(self, interval: float, currency_list: List[str]) -> None:
+        try:
+            quotes = self.repository(CurrencyObject(currency_list)).get_last_quote()
+        except Exception:  # pylint: disable=broad-exception-caught
+            logger.warning("Polling last quotes failed", exc_info=True)
+            return
+
+        LAST_QUOTE_CACHE.store(quotes)
+
+        # Subscriptions that joined during the request are served as well.
+        with self._condition:
+            subscriptions = list(self._subscriptions.get(interval, []))
+            if subscriptions:
+                last_quotes = self._last_quotes.setdefault(interval, {})
+                last_quotes.update((quote.currency_pair, quote) for quote in quotes)
+
+        for subscription in subscriptions:
+            subscription.offer(quotes)
+
+
+QUOTE_POLLER = QuotePoller()
@@ -0,0 +1,103 @@
+import time
+from typing import Any, Optional
+
+from currency_quote.adapters.outbound.http_transport import HTTP_TRANSPORT
+from currency_quote.adapters.outbound.quote_archive import QuoteArchive
+from currency_quote.application.ports.outbound.http_transport import IHttpTransport
+from currency_quote.config.endpoints import API
+
+REPLAY_TIMINGS = ("fast", "recorded")
+
+
+class RecordingTransport(IHttpTransport):
+    """
+    Transport that forwards to another one and archives every response.
+
+    Failures are archived too, with their status, and raised as usual.
+
+    Args:
+        archive: Where responses are recorded.
+        transport: The transport doing the requests, the shared one by default.
+    """
+
+    def __init__(
+        self, archive: QuoteArchive, transport: Optional[IHttpTransport] = None
+    ):
+        self.archive = archive
+        self.transport = transport or HTTP_TRANSPORT
+
+    def get_json(self, url: str) -> Any:
+        started = time.perf_counter()
+        try:
+            payload = self.transport.get_json(url)
+        except Exception as exc:
+            response = getattr(exc, "response", None)
+            self.archive.append(
+                url,
+                getattr(response, "status_code", None) or 0,
+                time.perf_counter() - started,
+                str(exc),
+            )
+            raise
+
+        self.archive.append(url, 200, time.perf_counter() - started, payload)
+        return payload
+
+    def close(self) -> None:
+        self.archive.close()
+
+
+class ReplayTransport(IHttpTransport):
+    """
+    Transport answering from an archive, without any network access.
+
+    Recorded HTTP errors are raised as ``requests.HTTPError`` with their
+    status, like the live transport raises them, so they are retried or not
+    for the same reasons. In 'fast' timing, retries do not wait either.
+
+    Args:
+        archive: The recorded responses.
+        timing: 'fast' to answer immediately, or 'recorded' to take as long as
+            each request took when it was recorded.
+
+    Raises:
+        ValueError: If ``timing`` is unknown.
+    """
+
+    def __init__(self, archive: QuoteArchive, timing: str = "fast"):
+        if timing not in REPLAY_TIMINGS:
+            raise ValueError(f"timing must be one of {REPLAY_TIMINGS}, got {timing!r}")
+
+        self.archive = archive
+        self.timing = timing
+        self.retry_time_seconds = 0 if timing == "fast" else API.RETRY_TIME_SECONDS
+
+    def get_json(self, url: str) -> Any:
+        """
+        Return the next recorded response of a URL.
+
+        Raises:
+            KeyError: If the URL was never recorded.
+            requests.HTTPError: If the request was answered with an error status.
+            ConnectionError: If the request got no response at all.
+        """
+        import requests  # pylint: disable=import-outside-toplevel
+
+        response = self.archive.next_response(url)
+
+        if self.timing == "recorded":
+            time.sleep(response.elapsed_seconds)
+        if not response.status:
+            raise ConnectionError(f"Recorded failure (no response): {response.body}")
+        if response.status != 200:
+            http_response = requests.Response()
+            http_response.status_code = response.status
+            http_response.url = url
+            raise requests.HTTPError(
+                f"Recorded failure ({response.status}): {response.body}",
+                response=http_response,
+            )
+        return response.body
+
+    def close(self) -> None:
+        self.archive.close()
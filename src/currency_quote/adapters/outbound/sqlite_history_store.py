@@ -0,0 +1,139 @@
+import os
+import threading
+from typing import Iterable, List, Tuple
+
+from currency_quote.application.ports.outbound.history_store import IHistoryStore
+from currency_quote.domain.entities.currency import CurrencyQuote
+from currency_quote.utils.dates import date_range
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS quotes (
+    currency_pair TEXT NOT NULL,
+    reference_date INTEGER NOT NULL,
+    currency_pair_name TEXT NOT NULL,
+    base_currency_code TEXT NOT NULL,
+    quote_currency_code TEXT NOT NULL,
+    quote_timestamp INTEGER NOT NULL,
+    bid_price REAL NOT NULL,
+    ask_price REAL NOT NULL,
+    quote_extracted_at INTEGER NOT NULL,
+    PRIMARY KEY (currency_pair, reference_date)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS coverage (
+    currency_pair TEXT NOT NULL,
+    reference_date INTEGER NOT NULL,
+    PRIMARY KEY (currency_pair, reference_date)
+) WITHOUT ROWID;
+"""
+
+_SELECT_QUOTES = """
+SELECT currency_pair, currency_pair_name, base_currency_code, quote_currency_code,
+       quote_timestamp, bid_price, ask_price, quote_extracted_at
+FROM quotes
+WHERE currency_pair = ? AND reference_date BETWEEN ? AND ?
+ORDER BY reference_date
+"""
+
+_SELECT_COVERAGE = """
+SELECT reference_date FROM coverage
+WHERE currency_pair = ? AND reference_date BETWEEN ? AND ?
+"""
+
+
+class SQLiteHistoryStore(IHistoryStore):
+    """
+    History store kept in a single SQLite file.
+
+    Quotes and the dates already fetched are both keyed by (pair, date), so the
+    primary keys double as the date index used for range scans. Days without a
+    quote (weekends, holidays) are remembered as fetched too, and are never
+    requested again.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        if path != ":memory:":
+            path = os.path.expanduser(path)
+            directory = os.path.dirname(os.path.abspath(path))
+            os.makedirs(directory, exist_ok=True)
+
+        # Only clients configured with a store pay for loading sqlite3.
+        import sqlite3  # pylint: disable=import-outside-toplevel
+
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+
+        with self._lock, self._connection:
+            if path != ":memory:":
+                self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.executescript(_SCHEMA)
+
+    def lookup(
+        self, currency_pair: str, start_date: int, end_date: int
+    ) -> Tuple[List[CurrencyQuote], List[int]]:
+        """
+        Read a pair's stored quotes for a date range.
+
+        Args:
+            currency_pair: The pair code, e.g. 'USD-BRL'.
+            start_date: First date of the range, as YYYYMMDD.
+            end_date: Last date of the range, as YYYYMMDD.
+
+        Returns:
+            tuple: (stored quotes, oldest first; dates of the range never fetched).
+        """
+        params = (currency_pair, start_date, end_date)
+
+        with self._lock:
+            rows = self._connection.execute(_SELECT_QUOTES, params).fetchall()
+            covered = {
+                row[0] for row in self._connection.execute(_SELECT_COVERAGE, params)
+            }
+
+        quotes = [CurrencyQuote(*row) for row in rows]
+        missing = [
+            reference_date
+            for reference_date in date_range(start_date, end_date)
+            if reference_date not in covered
+        ]
+
+        return quotes, missing
+
+    def save(
+        self,
+        currency_pair: str,
+        start_date: int,
+        end_date: int,
+        quotes: Iterable[Tuple[int, CurrencyQuote]],
+    ) -> None:
+        rows = [
+            (
+                quote.currency_pair,
+                reference_date,
+                quote.currency_pair_name,
+                quote.base_currency_code,
+                quote.quote_currency_code,
+                quote.quote_timestamp,
+                quote.bid_price,
+                quote.ask_price,
+                quote.quote_extracted_at,
+            )
+            for reference_date, quote in quotes
+        ]
+        coverage = [
+            (currency_pair, reference_date)
+            for reference_date in date_range(start_date, end_date)
+        ]
+
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO quotes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO coverage VALUES (?, ?)", coverage
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterator
+
+
+class IAsyncController(ABC):
+    @abstractmethod
+    def __init__(self, currency_list: list):
+        pass
+
+    @abstractmethod
+    async def get_last_quote(self, columnar: bool = False) -> list:
+        pass
+
+    @abstractmethod
+    async def get_history_quote(
+        self, reference_date: int, columnar: bool = False
+    ) -> list:
+        pass
+
+    @abstractmethod
+    async def stream(self, interval: float) -> AsyncIterator[dict]:
+        pass
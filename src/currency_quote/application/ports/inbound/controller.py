@@ -1,4 +1,6 @@
 from abc import ABC, abstractmethod
+from typing import Iterable, Iterator, List, Optional, Union
+from currency_quote.domain.entities.history_matrix import HistoryMatrix
 
 
 class IController(ABC):
@@ -7,9 +9,31 @@ class IController(ABC):
         pass
 
     @abstractmethod
-    def get_last_quote(self) -> dict:
+    def get_last_quote(self, columnar: bool = False) -> dict:
         pass
 
     @abstractmethod
-    def get_history_quote(self, reference_date: int) -> dict:
+    def get_history_quote(self, reference_date: int, columnar: bool = False) -> dict:
+        pass
+
+    @abstractmethod
+    def get_history_range(self, start_date: int, end_date: int) -> Iterator[dict]:
+        pass
+
+    @abstractmethod
+    def get_history_matrix(
+        self, reference_dates: Iterable[int], checkpoint: Optional[str] = None
+    ) -> HistoryMatrix:
+        pass
+
+    @abstractmethod
+    def stream(self, interval: float) -> Iterator[dict]:
+        pass
+
+    @abstractmethod
+    def add_pairs(self, currency_list: Union[list, str]) -> List[str]:
+        pass
+
+    @abstractmethod
+    def remove_pairs(self, currency_list: Union[list, str]) -> List[str]:
         pass
@@ -0,0 +1,18 @@
+# src/currency_quote/application/ports/outbound/async_currency_repository.py
+from abc import ABC, abstractmethod
+from typing import List
+from currency_quote.domain.entities.currency import CurrencyQuote, CurrencyObject
+
+
+class IAsyncCurrencyRepository(ABC):
+    @abstractmethod
+    def __init__(self, currency_obj: CurrencyObject):
+        pass
+
+    @abstractmethod
+    async def get_last_quote(self) -> List[CurrencyQuote]:
+        pass
+
+    @abstractmethod
+    async def get_history_quote(self, reference_date: int) -> List[CurrencyQuote]:
+        pass
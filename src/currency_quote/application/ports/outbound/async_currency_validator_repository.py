@@ -0,0 +1,13 @@
+# src/currency_quote/application/ports/outbound/async_currency_validator_repository.py
+from abc import ABC, abstractmethod
+from currency_quote.domain.entities.currency import CurrencyObject
+
+
+class IAsyncCurrencyValidator(ABC):
+    @abstractmethod
+    def __init__(self, currency_quote: CurrencyObject):
+        pass
+
+    @abstractmethod
+    async def validate_currency_code(self) -> list:
+        pass
@@ -1,6 +1,6 @@
 # src/currency_quote/application/ports/outbound/currency_validator_port.py
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Iterator, List
 from currency_quote.domain.entities.currency import CurrencyQuote, CurrencyObject
 
 
@@ -16,3 +16,9 @@ class ICurrencyRepository(ABC):
     @abstractmethod
     def get_history_quote(self, reference_date: int) -> List[CurrencyQuote]:
         pass
+
+    @abstractmethod
+    def get_history_range(
+        self, start_date: int, end_date: int
+    ) -> Iterator[CurrencyQuote]:
+        pass
@@ -0,0 +1,26 @@
+# src/currency_quote/application/ports/outbound/history_store.py
+from abc import ABC, abstractmethod
+from typing import Iterable, List, Tuple
+from currency_quote.domain.entities.currency import CurrencyQuote
+
+
+class IHistoryStore(ABC):
+    @abstractmethod
+    def lookup(
+        self, currency_pair: str, start_date: int, end_date: int
+    ) -> Tuple[List[CurrencyQuote], List[int]]:
+        """Return the range's stored quotes, oldest first, and the dates not stored."""
+
+    @abstractmethod
+    def save(
+        self,
+        currency_pair: str,
+        start_date: int,
+        end_date: int,
+        quotes: Iterable[Tuple[int, CurrencyQuote]],
+    ) -> None:
+        """Store (date, quote) rows and mark the whole range as fetched."""
+
+    @abstractmethod
+    def close(self) -> None:
+        pass
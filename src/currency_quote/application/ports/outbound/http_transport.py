@@ -0,0 +1,13 @@
+# src/currency_quote/application/ports/outbound/http_transport.py
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class IHttpTransport(ABC):
+    @abstractmethod
+    def get_json(self, url: str) -> Any:
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        pass
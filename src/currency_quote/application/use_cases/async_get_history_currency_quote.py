@@ -0,0 +1,31 @@
+# src/currency_quote/application/use_cases/async_get_history_currency_quote.py
+from functools import partial
+from typing import List, Optional
+from currency_quote.adapters.outbound.async_currency_api import AsyncCurrencyAPI
+from currency_quote.adapters.outbound.async_currency_validator_api import (
+    AsyncCurrencyValidatorAPI,
+)
+from currency_quote.adapters.outbound.async_http import AsyncHttpClient
+from currency_quote.domain.services.async_get_currency_quote import (
+    AsyncGetCurrencyQuoteService,
+)
+from currency_quote.domain.entities.currency import CurrencyObject, CurrencyQuote
+from currency_quote.utils.metrics import instrument_use_case
+
+
+class AsyncGetHistCurrencyQuoteUseCase:
+    @staticmethod
+    @instrument_use_case("async_get_history_quote")
+    async def execute(
+        currency_obj: CurrencyObject,
+        reference_date: int,
+        http_client: Optional[AsyncHttpClient] = None,
+    ) -> List[CurrencyQuote]:
+        quote_service = AsyncGetCurrencyQuoteService(
+            currency=currency_obj,
+            currency_repository=partial(AsyncCurrencyAPI, http_client=http_client),
+            currency_validator=partial(
+                AsyncCurrencyValidatorAPI, http_client=http_client
+            ),
+        )
+        return await quote_service.history(reference_date=reference_date)
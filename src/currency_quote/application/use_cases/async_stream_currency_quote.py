@@ -0,0 +1,42 @@
+# src/currency_quote/application/use_cases/async_stream_currency_quote.py
+from functools import partial
+from typing import Any, Callable, Optional
+from currency_quote.adapters.outbound.async_currency_api import AsyncCurrencyAPI
+from currency_quote.adapters.outbound.async_currency_validator_api import (
+    AsyncCurrencyValidatorAPI,
+)
+from currency_quote.adapters.outbound.async_http import AsyncHttpClient
+from currency_quote.adapters.outbound.quote_poller import (
+    QUOTE_POLLER,
+    AsyncQuoteSubscription,
+)
+from currency_quote.domain.services.async_get_currency_quote import (
+    AsyncGetCurrencyQuoteService,
+)
+from currency_quote.domain.entities.currency import CurrencyObject, CurrencyQuote
+from currency_quote.utils.metrics import instrument_use_case
+
+
+class AsyncStreamCurrencyQuoteUseCase:
+    @staticmethod
+    @instrument_use_case("async_stream")
+    async def execute(
+        currency_obj: CurrencyObject,
+        interval: float,
+        http_client: Optional[AsyncHttpClient] = None,
+        transform: Optional[Callable[[CurrencyQuote], Any]] = None,
+    ) -> AsyncQuoteSubscription:
+        quote_service = AsyncGetCurrencyQuoteService(
+            currency=currency_obj,
+            currency_repository=partial(AsyncCurrencyAPI, http_client=http_client),
+            currency_validator=partial(
+                AsyncCurrencyValidatorAPI, http_client=http_client
+            ),
+        )
+        valid_currency = await quote_service.validate_currency_code()
+        return QUOTE_POLLER.subscribe(
+            valid_currency.get_currency_list(),
+            interval,
+            transform=transform,
+            asynchronous=True,
+        )
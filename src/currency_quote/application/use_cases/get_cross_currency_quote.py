@@ -0,0 +1,41 @@
+# src/currency_quote/application/use_cases/get_cross_currency_quote.py
+from typing import List, Optional
+from currency_quote.adapters.outbound.currency_api import CurrencyAPI
+from currency_quote.adapters.outbound.parities_cache import PARITIES_CACHE
+from currency_quote.domain.entities.cross_rate import RateMatrix
+from currency_quote.domain.entities.currency import CurrencyObject
+from currency_quote.domain.entities.quote_result import QuoteResult
+from currency_quote.domain.services.cross_rate_engine import CrossRateEngine
+from currency_quote.utils.metrics import instrument_use_case
+
+
+class GetCrossCurrencyQuoteUseCase:
+    @staticmethod
+    @instrument_use_case("get_cross_quote")
+    def execute(currency_obj: CurrencyObject) -> QuoteResult:
+        engine = CrossRateEngine.for_index(PARITIES_CACHE.get_index())
+        currency_list = currency_obj.get_currency_list()
+
+        legs = engine.required_pairs(currency_list)
+        quotes = CurrencyAPI(CurrencyObject(legs)).get_last_quote()
+
+        return engine.derive(currency_list, quotes).raise_if_empty()
+
+
+class GetRateMatrixUseCase:
+    @staticmethod
+    @instrument_use_case("get_rate_matrix")
+    def execute(currencies: List[str], pivot: Optional[str] = None) -> RateMatrix:
+        engine = CrossRateEngine.for_index(PARITIES_CACHE.get_index())
+        pivot = pivot or engine.choose_pivot(currencies)
+
+        legs = engine.pivot_legs(currencies, pivot)
+        quotes = (
+            CurrencyAPI(
+                CurrencyObject([leg.currency_pair for leg in legs.values()])
+            ).get_last_quote()
+            if legs
+            else []
+        )
+
+        return engine.rate_matrix(currencies, quotes, pivot)
@@ -1,16 +1,27 @@
 # src/currency_quote/application/use_cases/validate_currency.py
-from typing import List
-from currency_quote.adapters.outbound.currency_api import CurrencyAPI
+from typing import List, Optional
+from currency_quote.adapters.outbound.cached_history_repository import (
+    history_repository,
+)
+from currency_quote.application.ports.outbound.history_store import IHistoryStore
 from currency_quote.domain.services.get_currency_quote import GetCurrencyQuoteService
+from currency_quote.domain.services.validate_currency import ValidatedCurrencyList
 from currency_quote.domain.entities.currency import CurrencyObject, CurrencyQuote
+from currency_quote.utils.metrics import instrument_use_case
 
 
 class GetHistCurrencyQuoteUseCase:
     @staticmethod
+    @instrument_use_case("get_history_quote")
     def execute(
-        currency_obj: CurrencyObject, reference_date: int
+        currency_obj: CurrencyObject,
+        reference_date: int,
+        history_store: Optional[IHistoryStore] = None,
+        validated_currency: Optional[ValidatedCurrencyList] = None,
     ) -> List[CurrencyQuote]:
         quote_service = GetCurrencyQuoteService(
-            currency=currency_obj, currency_repository=CurrencyAPI
+            currency=currency_obj,
+            currency_repository=history_repository(history_store),
+            validated_currency=validated_currency,
         )
         return quote_service.history(reference_date=reference_date)
@@ -0,0 +1,48 @@
+# src/currency_quote/application/use_cases/get_history_matrix.py
+from typing import Iterable, Optional
+from currency_quote.adapters.outbound.cached_history_repository import (
+    history_repository,
+)
+from currency_quote.adapters.outbound.history_scheduler import (
+    HistoryCheckpoint,
+    HistoryJobScheduler,
+)
+from currency_quote.application.ports.outbound.history_store import IHistoryStore
+from currency_quote.config.endpoints import API
+from currency_quote.domain.entities.currency import CurrencyObject
+from currency_quote.domain.entities.history_matrix import HistoryMatrix
+from currency_quote.domain.services.get_currency_quote import GetCurrencyQuoteService
+from currency_quote.domain.services.validate_currency import ValidatedCurrencyList
+from currency_quote.utils.metrics import instrument_use_case
+
+
+class GetHistoryMatrixUseCase:
+    @staticmethod
+    @instrument_use_case("get_history_matrix")
+    def execute(  # pylint: disable=too-many-arguments
+        currency_obj: CurrencyObject,
+        reference_dates: Iterable[int],
+        history_store: Optional[IHistoryStore] = None,
+        validated_currency: Optional[ValidatedCurrencyList] = None,
+        checkpoint_path: Optional[str] = None,
+        max_workers: int = API.MAX_CONCURRENT_REQUESTS,
+        max_rate: float = API.RATE_LIMIT_PER_SECOND,
+    ) -> HistoryMatrix:
+        repository = history_repository(history_store)
+        valid_currency = GetCurrencyQuoteService(
+            currency=currency_obj,
+            currency_repository=repository,
+            validated_currency=validated_currency,
+        ).validate_currency_code()
+
+        scheduler = HistoryJobScheduler(
+            repository=repository,
+            max_workers=max_workers,
+            max_rate=max_rate,
+            checkpoint=(
+                HistoryCheckpoint(checkpoint_path)
+                if checkpoint_path is not None
+                else None
+            ),
+        )
+        return scheduler.run(valid_currency.get_currency_list(), reference_dates)
@@ -0,0 +1,28 @@
+# src/currency_quote/application/use_cases/get_history_range_currency_quote.py
+from typing import Iterator, Optional
+from currency_quote.adapters.outbound.cached_history_repository import (
+    history_repository,
+)
+from currency_quote.application.ports.outbound.history_store import IHistoryStore
+from currency_quote.domain.services.get_currency_quote import GetCurrencyQuoteService
+from currency_quote.domain.services.validate_currency import ValidatedCurrencyList
+from currency_quote.domain.entities.currency import CurrencyObject, CurrencyQuote
+from currency_quote.utils.metrics import instrument_use_case
+
+
+class GetHistRangeCurrencyQuoteUseCase:
+    @staticmethod
+    @instrument_use_case("get_history_range")
+    def execute(
+        currency_obj: CurrencyObject,
+        start_date: int,
+        end_date: int,
+        history_store: Optional[IHistoryStore] = None,
+        validated_currency: Optional[ValidatedCurrencyList] = None,
+    ) -> Iterator[CurrencyQuote]:
+        quote_service = GetCurrencyQuoteService(
+            currency=currency_obj,
+            currency_repository=history_repository(history_store),
+            validated_currency=validated_currency,
+        )
+        return quote_service.history_range(start_date=start_date, end_date=end_date)
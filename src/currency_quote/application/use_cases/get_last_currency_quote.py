@@ -1,14 +1,22 @@
 # src/currency_quote/application/use_cases/validate_currency.py
-from typing import List
+from typing import List, Optional
 from currency_quote.adapters.outbound.currency_api import CurrencyAPI
 from currency_quote.domain.services.get_currency_quote import GetCurrencyQuoteService
+from currency_quote.domain.services.validate_currency import ValidatedCurrencyList
 from currency_quote.domain.entities.currency import CurrencyQuote, CurrencyObject
+from currency_quote.utils.metrics import instrument_use_case
 
 
 class GetLastCurrencyQuoteUseCase:
     @staticmethod
-    def execute(currency_obj: CurrencyObject) -> List[CurrencyQuote]:
+    @instrument_use_case("get_last_quote")
+    def execute(
+        currency_obj: CurrencyObject,
+        validated_currency: Optional[ValidatedCurrencyList] = None,
+    ) -> List[CurrencyQuote]:
         quote_service = GetCurrencyQuoteService(
-            currency=currency_obj, currency_repository=CurrencyAPI
+            currency=currency_obj,
+            currency_repository=CurrencyAPI,
+            validated_currency=validated_currency,
         )
         return quote_service.last()
@@ -0,0 +1,25 @@
+# src/currency_quote/application/use_cases/prefetch_history.py
+from currency_quote.adapters.outbound.cached_history_repository import (
+    CachedHistoryRepository,
+)
+from currency_quote.application.ports.outbound.history_store import IHistoryStore
+from currency_quote.application.use_cases.validate_currency import (
+    ValidateCurrencyUseCase,
+)
+from currency_quote.domain.entities.currency import CurrencyObject
+from currency_quote.utils.metrics import instrument_use_case
+
+
+class PrefetchHistoryUseCase:
+    @staticmethod
+    @instrument_use_case("prefetch_history")
+    def execute(
+        currency_obj: CurrencyObject,
+        start_date: int,
+        end_date: int,
+        history_store: IHistoryStore,
+    ) -> int:
+        valid_currency = ValidateCurrencyUseCase.execute(currency_obj)
+        return CachedHistoryRepository(valid_currency, store=history_store).prefetch(
+            start_date=start_date, end_date=end_date
+        )
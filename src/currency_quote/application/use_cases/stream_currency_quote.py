@@ -0,0 +1,25 @@
+# src/currency_quote/application/use_cases/stream_currency_quote.py
+from typing import Any, Callable, Optional
+from currency_quote.adapters.outbound.quote_poller import (
+    QUOTE_POLLER,
+    QuoteSubscription,
+)
+from currency_quote.application.use_cases.validate_currency import (
+    ValidateCurrencyUseCase,
+)
+from currency_quote.domain.entities.currency import CurrencyObject, CurrencyQuote
+from currency_quote.utils.metrics import instrument_use_case
+
+
+class StreamCurrencyQuoteUseCase:
+    @staticmethod
+    @instrument_use_case("stream")
+    def execute(
+        currency_obj: CurrencyObject,
+        interval: float,
+        transform: Optional[Callable[[CurrencyQuote], Any]] = None,
+    ) -> QuoteSubscription:
+        valid_currency = ValidateCurrencyUseCase.execute(currency_obj)
+        return QUOTE_POLLER.subscribe(
+            valid_currency.get_currency_list(), interval, transform=transform
+        )
@@ -1,6 +1,10 @@
 # src/currency_quote/application/use_cases/validate_currency.py
-from currency_quote.domain.services.validate_currency import CurrencyValidatorService
+from currency_quote.domain.services.validate_currency import (
+    CurrencyValidatorService,
+    ValidatedCurrencyList,
+)
 from currency_quote.adapters.outbound.currency_validator_api import CurrencyValidatorAPI
+from currency_quote.adapters.outbound.parities_cache import PARITIES_CACHE
 from currency_quote.domain.entities.currency import CurrencyObject
 
 
@@ -11,3 +15,10 @@ class ValidateCurrencyUseCase:
             currency=currency_quote, currency_validator=CurrencyValidatorAPI
         )
         return validator_service.validate_currency_code()
+
+    @staticmethod
+    def session(currency_quote: CurrencyObject) -> ValidatedCurrencyList:
+        """Return a validation of the pairs, reused until the parity list changes."""
+        return ValidatedCurrencyList(
+            currency_quote, parity_index=PARITIES_CACHE.get_index
+        )
@@ -0,0 +1,10 @@
+import os
+
+
+class Cache:
+    PARITIES_TTL_SECONDS = 3600
+    PARITIES_STALE_SECONDS = 86400
+    PARITIES_SNAPSHOT_PATH = os.environ.get("CURRENCY_QUOTE_PARITIES_SNAPSHOT")
+    LAST_QUOTE_TTL_SECONDS = 5
+    LAST_QUOTE_STALE_SECONDS = 3600
+    HISTORY_STORE_PATH = os.environ.get("CURRENCY_QUOTE_HISTORY_STORE")
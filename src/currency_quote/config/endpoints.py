@@ -1,7 +1,29 @@
+import os
+
+
 class API:
-    __URL__ = "https://economia.awesomeapi.com.br"
+    __URL__ = os.environ.get(
+        "CURRENCY_QUOTE_API_URL", "https://economia.awesomeapi.com.br"
+    ).rstrip("/")
     ENDPOINT_AVALIABLE_PARITIES = __URL__ + "/json/available"
     ENDPOINT_LAST_COTATION = __URL__ + "/last/"
     ENDPOINT_HISTORY_COTATION = __URL__ + "/json/daily/"
+    HISTORY_MAX_DAYS_PER_REQUEST = 360
     RETRY_TIME_SECONDS = 2
     RETRY_ATTEMPTS = 3
+    PARTIAL_RETRY_ATTEMPTS = 1
+    CIRCUIT_FAILURE_THRESHOLD = 5
+    CIRCUIT_RESET_TIMEOUT_SECONDS = 30
+    RATE_LIMIT_PER_SECOND = 10
+    RATE_LIMIT_BURST = 20
+    RATE_LIMIT_MIN_PER_SECOND = 0.5
+    RATE_LIMIT_MAX_WAIT_SECONDS = 10
+    MAX_CONCURRENT_REQUESTS = 8
+    STREAM_INTERVAL_SECONDS = 1
+    MAX_ASYNC_CONNECTIONS = 100
+    POOL_CONNECTIONS = 4
+    POOL_MAXSIZE = 16
+    CONNECTION_TIMEOUT_SECONDS = 10
+    READ_TIMEOUT_SECONDS = 30
+    LAST_MAX_PAIRS_PER_REQUEST = 100
+    MAX_URL_LENGTH = 2048
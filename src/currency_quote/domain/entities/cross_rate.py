@@ -0,0 +1,70 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple
+
+
+@dataclass(frozen=True)
+class RateLeg:
+    """One quoted pair used by a derived rate, possibly traversed backwards."""
+
+    currency_pair: str
+    inverted: bool = False
+
+    @property
+    def source(self) -> str:
+        """Currency converted from when walking this leg."""
+        base_currency, _, quote_currency = self.currency_pair.partition("-")
+        return quote_currency if self.inverted else base_currency
+
+    @property
+    def target(self) -> str:
+        """Currency converted to when walking this leg."""
+        base_currency, _, quote_currency = self.currency_pair.partition("-")
+        return base_currency if self.inverted else quote_currency
+
+
+@dataclass(frozen=True)
+class CrossQuote:  # pylint: disable=too-many-instance-attributes
+    """
+    A bid/ask derived from one or more fetched quotes.
+
+    ``legs`` records the provenance: the quoted pairs multiplied together, in
+    path order. A single non-inverted leg is a directly quoted pair.
+    """
+
+    currency_pair: str
+    base_currency_code: str
+    quote_currency_code: str
+    quote_timestamp: int
+    bid_price: float
+    ask_price: float
+    quote_extracted_at: int
+    legs: Tuple[RateLeg, ...]
+
+    @property
+    def is_direct(self) -> bool:
+        return len(self.legs) == 1 and not self.legs[0].inverted
+
+
+@dataclass(frozen=True)
+class RateMatrix:
+    """
+    Bid and ask rates between every pair of currencies, derived via one pivot.
+
+    ``bid[i][j]`` is the bid of ``currencies[i]-currencies[j]``; both matrices
+    are NumPy arrays. Rates through a leg that could not be fetched are NaN,
+    and ``errors`` maps each such leg to its error.
+    """
+
+    currencies: List[str]
+    pivot: str
+    bid: Any
+    ask: Any
+    legs: Dict[str, RateLeg]
+    errors: Dict[str, Exception] = field(default_factory=dict)
+
+    def rate(self, currency_pair: str) -> Tuple[float, float]:
+        """Return the (bid, ask) of a pair such as 'EUR-JPY'."""
+        base_currency, _, quote_currency = currency_pair.partition("-")
+        row = self.currencies.index(base_currency)
+        column = self.currencies.index(quote_currency)
+        return float(self.bid[row, column]), float(self.ask[row, column])
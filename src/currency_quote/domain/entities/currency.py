@@ -1,9 +1,32 @@
-from typing import Union
-from dataclasses import dataclass
-from datetime import datetime
+import re
+import sys
+from typing import Iterable, List, Optional, Tuple, Union
+from dataclasses import dataclass, field
+from currency_quote.utils.clock import now_timestamp
+
+# Slotted dataclasses need Python 3.10+, older interpreters fall back to __dict__.
+_QUOTE_DATACLASS_OPTIONS = {"frozen": True}
+if sys.version_info >= (3, 10):
+    _QUOTE_DATACLASS_OPTIONS["slots"] = True
+
+
+# A whole list joined by new lines, upper-cased and without blanks: one regex
+# pass validates every entry at once.
+_PAIR_LINES = re.compile(r"(?:[^\s-]{3,4}-[^\s-]{3,4}\n)*[^\s-]{3,4}-[^\s-]{3,4}")
+_PAIR = re.compile(r"\s*([^\s-]+)\s*-\s*([^\s-]+)\s*")
+_BLANKS = re.compile(r"[^\S\n]")
+_WATCHLIST_SEPARATORS = re.compile(r"[\s,;]+")
 
 
 class CurrencyObject:
+    """
+    A list of currency pairs, normalized and without duplicates.
+
+    Codes are upper-cased and stripped, so 'usd-brl ' and 'USD-BRL' are the same
+    pair, and only the first occurrence of a pair is kept. The pair strings and
+    codes are interned, so large lists share their memory.
+    """
+
     def __init__(self, currency_list: Union[list, str]):
         if not isinstance(currency_list, list) and not isinstance(currency_list, str):
             raise TypeError(
@@ -16,26 +39,80 @@ class CurrencyObject:
         if len(currency_list) == 0:
             raise ValueError("Currency list is empty")
 
-        for currency in currency_list:
-            try:
-                base_currency, quote_currency = currency.split("-")
-            except ValueError as exc:
-                raise ValueError(
-                    "Currency pair must be in the format 'USD-BRL'"
-                ) from exc
-
-            if not len(base_currency) in (3, 4) or not len(quote_currency) in (3, 4):
-                raise ValueError(
-                    "Each currency code must have 3 characters, e.g. 'USD-BRL'"
+        self.currency_list = _parse_pairs(currency_list)
+        self._codes: Optional[List[Tuple[str, str]]] = None
+
+    @property
+    def codes(self) -> List[Tuple[str, str]]:
+        """The (base, quote) codes of every pair, e.g. [('USD', 'BRL')]."""
+        if self._codes is None:
+            intern = sys.intern
+            self._codes = [
+                (intern(base_currency), intern(quote_currency))
+                for base_currency, quote_currency in (
+                    currency_pair.split("-") for currency_pair in self.currency_list
                 )
+            ]
+        return self._codes
+
+    @classmethod
+    def from_file(cls, path: str) -> "CurrencyObject":
+        """
+        Load a watchlist file.
 
-        self.currency_list = currency_list
+        Pairs are separated by new lines, commas, semicolons or blanks, and
+        anything after a '#' on a line is ignored.
+
+        Args:
+            path: Path of the watchlist, e.g. 'pairs.txt'.
+
+        Returns:
+            CurrencyObject: The pairs of the file, in order, without duplicates.
+        """
+        with open(path, encoding="utf-8") as file:
+            text = "\n".join(line.split("#", 1)[0] for line in file)
+
+        return cls([item for item in _WATCHLIST_SEPARATORS.split(text) if item])
 
     def get_currency_list(self) -> list:
         return self.currency_list
 
 
-@dataclass
+def _parse_pairs(currency_list: List[str]) -> List[str]:
+    try:
+        text = "\n".join(currency_list)
+    except TypeError:
+        text = ""
+
+    if _BLANKS.search(text):
+        text = "\n".join(currency_pair.strip() for currency_pair in currency_list)
+
+    # The joined text is only trusted when it has one entry per line and every
+    # line is a pair; otherwise the slow path normalizes or reports each entry.
+    if text.count("\n") == len(currency_list) - 1:
+        unique_pairs = dict.fromkeys(text.upper().split("\n"))
+        if _PAIR_LINES.fullmatch("\n".join(unique_pairs)):
+            return list(map(sys.intern, unique_pairs))
+
+    unique_pairs = dict.fromkeys(
+        _parse_pair(currency_pair) for currency_pair in currency_list
+    )
+    return list(map(sys.intern, unique_pairs))
+
+
+def _parse_pair(currency_pair: str) -> str:
+    match = _PAIR.fullmatch(currency_pair) if isinstance(currency_pair, str) else None
+    if match is None:
+        raise ValueError("Currency pair must be in the format 'USD-BRL'")
+
+    base_currency, quote_currency = match.groups()
+    if not len(base_currency) in (3, 4) or not len(quote_currency) in (3, 4):
+        raise ValueError("Each currency code must have 3 characters, e.g. 'USD-BRL'")
+
+    return f"{base_currency}-{quote_currency}".upper()
+
+
+@dataclass(**_QUOTE_DATACLASS_OPTIONS)
 class CurrencyQuote:  # pylint: disable=too-many-instance-attributes
     currency_pair: str
     currency_pair_name: str
@@ -44,4 +121,59 @@ class CurrencyQuote:  # pylint: disable=too-many-instance-attributes
     quote_timestamp: int
     bid_price: float
     ask_price: float
-    quote_extracted_at: int = int(datetime.now().timestamp())
+    quote_extracted_at: int = field(default_factory=now_timestamp)
+
+    @classmethod
+    def from_api_payload(
+        cls,
+        payload: Union[dict, list],
+        currency_pairs: Optional[Iterable[str]] = None,
+        currency_pair: Optional[str] = None,
+        extracted_at: Optional[int] = None,
+    ) -> List["CurrencyQuote"]:
+        """
+        Parse a whole upstream response into quotes in one pass.
+
+        Args:
+            payload: A /last/ response (mapping keyed by e.g. 'USDBRL') or a
+                /json/daily/ response (list of rows).
+            currency_pairs: For /last/ responses, the pairs to extract, in order.
+                Defaults to every entry of the payload.
+            currency_pair: For /json/daily/ responses, the pair the rows belong
+                to. Defaults to the pair described by each row.
+            extracted_at: Extraction timestamp shared by the whole batch.
+                Defaults to one reading of the process-wide clock.
+
+        Returns:
+            list: The parsed quotes, with numeric prices and timestamps.
+
+        Raises:
+            KeyError: If a requested pair or a required field is missing.
+        """
+        if extracted_at is None:
+            extracted_at = now_timestamp()
+
+        if isinstance(payload, dict):
+            if currency_pairs is None:
+                rows = payload.values()
+                pairs = [f"{row['code']}-{row['codein']}" for row in rows]
+            else:
+                pairs = list(currency_pairs)
+                rows = [payload[pair.replace("-", "")] for pair in pairs]
+        else:
+            rows = payload
+            pairs = [currency_pair or f"{row['code']}-{row['codein']}" for row in rows]
+
+        return [
+            cls(
+                pair,
+                row["name"],
+                row["code"],
+                row["codein"],
+                int(row["timestamp"]),
+                float(row["bid"]),
+                float(row["ask"]),
+                extracted_at,
+            )
+            for pair, row in zip(pairs, rows)
+        ]
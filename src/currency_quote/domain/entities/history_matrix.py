@@ -0,0 +1,85 @@
+import math
+from array import array
+from typing import Dict, Iterable, List, Tuple
+
+from currency_quote.utils.optional import import_optional
+
+
+class HistoryMatrix:
+    """
+    Dense (pairs × dates) bid and ask history.
+
+    ``bid[i][j]`` is the bid of ``currency_pairs[i]`` on ``reference_dates[j]``.
+    Each row is a float64 ``array`` and days without a quote (weekends,
+    holidays, failed requests) hold NaN. Pairs whose requests failed are listed
+    in ``errors``.
+    """
+
+    def __init__(self, currency_pairs: Iterable[str], reference_dates: Iterable[int]):
+        self.currency_pairs: List[str] = list(dict.fromkeys(currency_pairs))
+        self.reference_dates: List[int] = sorted(set(reference_dates))
+        empty_row = array("d", [math.nan]) * len(self.reference_dates)
+        self.bid: List[array] = [array("d", empty_row) for _ in self.currency_pairs]
+        self.ask: List[array] = [array("d", empty_row) for _ in self.currency_pairs]
+        self.errors: Dict[str, BaseException] = {}
+        self._rows = {pair: index for index, pair in enumerate(self.currency_pairs)}
+        self._columns = {day: index for index, day in enumerate(self.reference_dates)}
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return len(self.currency_pairs), len(self.reference_dates)
+
+    def fill(self, currency_pair: str, rows: Iterable[Tuple[int, float, float]]) -> int:
+        """
+        Set a pair's prices from (date, bid, ask) rows.
+
+        Args:
+            currency_pair: The pair the rows belong to, e.g. 'USD-BRL'.
+            rows: (YYYYMMDD, bid, ask) tuples; dates outside the matrix are ignored.
+
+        Returns:
+            int: The number of cells set.
+        """
+        bid, ask = (
+            self.bid[self._rows[currency_pair]],
+            self.ask[self._rows[currency_pair]],
+        )
+        filled = 0
+
+        for reference_date, bid_price, ask_price in rows:
+            column = self._columns.get(reference_date)
+            if column is not None:
+                bid[column] = bid_price
+                ask[column] = ask_price
+                filled += 1
+
+        return filled
+
+    def rate(self, currency_pair: str, reference_date: int) -> Tuple[float, float]:
+        """Return the (bid, ask) of a pair on a date, NaN when there is no quote."""
+        row, column = self._rows[currency_pair], self._columns[reference_date]
+        return self.bid[row][column], self.ask[row][column]
+
+    def to_numpy(self) -> dict:
+        """
+        Return the bid and ask matrices as 2-D NumPy arrays.
+
+        Returns:
+            dict: 'bid' and 'ask' arrays of shape (pairs, dates).
+        """
+        np = import_optional("numpy", extra="columnar")
+        return {
+            name: np.frombuffer(
+                bytearray(b"".join(row.tobytes() for row in rows)), dtype="d"
+            ).reshape(self.shape)
+            for name, rows in (("bid", self.bid), ("ask", self.ask))
+        }
+
+    def to_pandas(self, price: str = "bid"):
+        """Return one price as a pandas DataFrame, a row per date, a column per pair."""
+        pd = import_optional("pandas", extra="columnar")
+        return pd.DataFrame(
+            self.to_numpy()[price].T,
+            index=self.reference_dates,
+            columns=self.currency_pairs,
+        )
@@ -0,0 +1,73 @@
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Tuple
+
+_EMPTY: FrozenSet[str] = frozenset()
+
+
+@dataclass(frozen=True)
+class ParityIndex:
+    """
+    Precomputed lookup structure over the available parities.
+
+    Holds the set of pair codes (e.g. 'USD-BRL') plus adjacency maps from each
+    base currency and each quote currency to the pairs that use it. An index is
+    immutable and built once per parity-list ``version``.
+    """
+
+    pairs: FrozenSet[str]
+    by_base: Mapping[str, FrozenSet[str]] = field(repr=False)
+    by_quote: Mapping[str, FrozenSet[str]] = field(repr=False)
+    version: str = ""
+
+    @classmethod
+    def from_parities(cls, parities: Iterable[str], version: str = "") -> "ParityIndex":
+        by_base: Dict[str, set] = {}
+        by_quote: Dict[str, set] = {}
+        pairs = []
+
+        for pair in parities:
+            base_currency, separator, quote_currency = pair.partition("-")
+            if not separator:
+                continue
+            pairs.append(pair)
+            by_base.setdefault(base_currency, set()).add(pair)
+            by_quote.setdefault(quote_currency, set()).add(pair)
+
+        return cls(
+            pairs=frozenset(pairs),
+            by_base={code: frozenset(items) for code, items in by_base.items()},
+            by_quote={code: frozenset(items) for code, items in by_quote.items()},
+            version=version,
+        )
+
+    def __contains__(self, currency_pair: object) -> bool:
+        return currency_pair in self.pairs
+
+    def __len__(self) -> int:
+        return len(self.pairs)
+
+    def split(self, currency_list: Iterable[str]) -> Tuple[List[str], List[str]]:
+        """
+        Partition currency pairs into valid and invalid ones in a single pass.
+
+        Args:
+            currency_list: The pair codes to check, e.g. ['USD-BRL', 'AAA-BBB'].
+
+        Returns:
+            tuple: (valid pairs, invalid pairs), both in the input order.
+        """
+        pairs = self.pairs
+        valid, invalid = [], []
+
+        for currency_pair in currency_list:
+            (valid if currency_pair in pairs else invalid).append(currency_pair)
+
+        return valid, invalid
+
+    def based_on(self, currency_code: str) -> FrozenSet[str]:
+        """Return every pair whose base currency is ``currency_code``."""
+        return self.by_base.get(currency_code, _EMPTY)
+
+    def quoted_in(self, currency_code: str) -> FrozenSet[str]:
+        """Return every pair quoted in ``currency_code``, e.g. all '*-BRL' pairs."""
+        return self.by_quote.get(currency_code, _EMPTY)
@@ -0,0 +1,182 @@
+from array import array
+from typing import Dict, Iterable, Iterator, List
+
+from currency_quote.domain.entities.currency import CurrencyQuote
+from currency_quote.utils.optional import import_optional
+
+STRING_FIELDS = (
+    "currency_pair",
+    "currency_pair_name",
+    "base_currency_code",
+    "quote_currency_code",
+)
+INTEGER_FIELDS = ("quote_timestamp", "quote_extracted_at")
+FLOAT_FIELDS = ("bid_price", "ask_price")
+QUOTE_FIELDS = (
+    "currency_pair",
+    "currency_pair_name",
+    "base_currency_code",
+    "quote_currency_code",
+    "quote_timestamp",
+    "bid_price",
+    "ask_price",
+    "quote_extracted_at",
+)
+
+
+class CategoricalColumn:
+    """Dictionary-encoded string column: each distinct value is stored once."""
+
+    __slots__ = ("categories", "codes", "_lookup")
+
+    def __init__(self):
+        self.categories: List[str] = []
+        self.codes = array("i")
+        self._lookup: Dict[str, int] = {}
+
+    def append(self, value: str) -> None:
+        code = self._lookup.get(value)
+        if code is None:
+            code = self._lookup[value] = len(self.categories)
+            self.categories.append(value)
+        self.codes.append(code)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, index: int) -> str:
+        return self.categories[self.codes[index]]
+
+    def __iter__(self) -> Iterator[str]:
+        categories = self.categories
+        return (categories[code] for code in self.codes)
+
+    def tolist(self) -> List[str]:
+        return list(self)
+
+
+class QuoteColumns:
+    """
+    Columnar representation of a batch of quotes.
+
+    Numeric fields are stored in typed ``array.array`` buffers and string fields
+    are dictionary-encoded, so a large history pull costs a few bytes per row
+    instead of one dict per quote. Columns can be exported to NumPy, pandas or
+    pyarrow without iterating over rows in Python. Pairs that could not be
+    fetched are listed in ``errors``.
+    """
+
+    __slots__ = QUOTE_FIELDS + ("errors",)
+
+    def __init__(self):
+        self.errors: Dict[str, Exception] = {}
+        for name in STRING_FIELDS:
+            setattr(self, name, CategoricalColumn())
+        for name in INTEGER_FIELDS:
+            setattr(self, name, array("q"))
+        for name in FLOAT_FIELDS:
+            setattr(self, name, array("d"))
+
+    @classmethod
+    def from_quotes(cls, quotes: Iterable[CurrencyQuote]) -> "QuoteColumns":
+        columns = cls()
+        for quote in quotes:
+            columns.append(quote)
+        return columns
+
+    def append(self, quote: CurrencyQuote) -> None:
+        self.currency_pair.append(quote.currency_pair)
+        self.currency_pair_name.append(quote.currency_pair_name)
+        self.base_currency_code.append(quote.base_currency_code)
+        self.quote_currency_code.append(quote.quote_currency_code)
+        self.quote_timestamp.append(int(quote.quote_timestamp))
+        self.bid_price.append(float(quote.bid_price))
+        self.ask_price.append(float(quote.ask_price))
+        self.quote_extracted_at.append(int(quote.quote_extracted_at))
+
+    def __len__(self) -> int:
+        return len(self.quote_timestamp)
+
+    def __getitem__(self, name: str):
+        if name not in QUOTE_FIELDS:
+            raise KeyError(name)
+        return getattr(self, name)
+
+    def keys(self) -> tuple:
+        return QUOTE_FIELDS
+
+    def to_records(self) -> List[dict]:
+        """Return the rows as dicts, in the same shape as the default client output."""
+        columns = [self[name] for name in QUOTE_FIELDS]
+        return [dict(zip(QUOTE_FIELDS, row)) for row in zip(*columns)]
+
+    def to_numpy(self) -> dict:
+        """
+        Return one NumPy array per field.
+
+        Numeric columns are copied from their buffers in a single operation and
+        string columns are decoded with one fancy-indexing step.
+
+        Returns:
+            dict: Field name to ``numpy.ndarray``.
+        """
+        np = import_optional("numpy", extra="columnar")
+        result = {}
+
+        for name in QUOTE_FIELDS:
+            column = self[name]
+            if name in STRING_FIELDS:
+                categories = np.array(column.categories, dtype=object)
+                result[name] = categories[self._codes_to_numpy(np, column)]
+            else:
+                result[name] = np.frombuffer(column, dtype=column.typecode).copy()
+
+        return result
+
+    def to_pandas(self):
+        """Return a pandas DataFrame, with string fields as categoricals."""
+        np = import_optional("numpy", extra="columnar")
+        pd = import_optional("pandas", extra="columnar")
+        data = {}
+
+        for name in QUOTE_FIELDS:
+            column = self[name]
+            if name in STRING_FIELDS:
+                data[name] = pd.Categorical.from_codes(
+                    self._codes_to_numpy(np, column), categories=column.categories
+                )
+            else:
+                data[name] = np.frombuffer(column, dtype=column.typecode).copy()
+
+        return pd.DataFrame(data, columns=list(QUOTE_FIELDS))
+
+    def to_arrow(self):
+        """Return a pyarrow Table, with string fields as dictionary arrays."""
+        pa = import_optional("pyarrow", extra="columnar")
+        data = {}
+
+        for name in QUOTE_FIELDS:
+            column = self[name]
+            if name in STRING_FIELDS:
+                data[name] = pa.DictionaryArray.from_arrays(
+                    self._buffer_to_arrow(pa, column.codes, pa.int32()),
+                    pa.array(column.categories, type=pa.string()),
+                )
+            elif name in FLOAT_FIELDS:
+                data[name] = self._buffer_to_arrow(pa, column, pa.float64())
+            else:
+                data[name] = self._buffer_to_arrow(pa, column, pa.int64())
+
+        return pa.table(data)
+
+    @staticmethod
+    def _codes_to_numpy(np, column: CategoricalColumn):
+        return np.frombuffer(column.codes, dtype=f"i{column.codes.itemsize}").copy()
+
+    @staticmethod
+    def _buffer_to_arrow(pa, column: array, arrow_type):
+        if column.itemsize * 8 != arrow_type.bit_width:
+            return pa.array(column.tolist(), type=arrow_type)
+        return pa.Array.from_buffers(
+            arrow_type, len(column), [None, pa.py_buffer(column.tobytes())]
+        )
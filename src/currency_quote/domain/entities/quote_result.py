@@ -0,0 +1,36 @@
+from typing import Dict, Iterable, List, Optional
+from currency_quote.domain.entities.currency import CurrencyQuote
+
+
+class QuoteResult(List[CurrencyQuote]):
+    """
+    The quotes of a batch that succeeded, plus the error of every pair that did not.
+
+    It is a plain list of the successful quotes, so callers that only iterate
+    keep working, while ``errors`` maps each failed pair code to its exception.
+    """
+
+    def __init__(
+        self,
+        quotes: Iterable[CurrencyQuote] = (),
+        errors: Optional[Dict[str, Exception]] = None,
+    ):
+        super().__init__(quotes)
+        self.errors: Dict[str, Exception] = errors or {}
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    @property
+    def failed_pairs(self) -> List[str]:
+        return list(self.errors)
+
+    def raise_if_empty(self) -> "QuoteResult":
+        """Raise the first error when every pair failed, otherwise return self."""
+        if self.errors and not self:
+            raise next(iter(self.errors.values()))
+        return self
+
+    def __repr__(self) -> str:
+        return f"QuoteResult({list.__repr__(self)}, errors={self.errors!r})"
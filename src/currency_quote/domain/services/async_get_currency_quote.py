@@ -0,0 +1,41 @@
+from typing import Callable, List
+from currency_quote.application.ports.outbound.async_currency_repository import (
+    IAsyncCurrencyRepository,
+)
+from currency_quote.application.ports.outbound.async_currency_validator_repository import (
+    IAsyncCurrencyValidator,
+)
+from currency_quote.domain.entities.currency import CurrencyQuote, CurrencyObject
+from currency_quote.domain.services.validate_currency import CurrencyValidatorService
+from currency_quote.utils.metrics import get_metrics
+
+
+class AsyncGetCurrencyQuoteService:
+    def __init__(
+        self,
+        currency: CurrencyObject,
+        currency_repository: Callable[[CurrencyObject], IAsyncCurrencyRepository],
+        currency_validator: Callable[[CurrencyObject], IAsyncCurrencyValidator],
+    ):
+        self.currency = currency
+        self.currency_repository = currency_repository
+        self.currency_validator = currency_validator
+
+    async def last(self) -> List[CurrencyQuote]:
+        valid_currency = await self.validate_currency_code()
+        return await self.currency_repository(valid_currency).get_last_quote()
+
+    async def history(self, reference_date: int) -> List[CurrencyQuote]:
+        valid_currency = await self.validate_currency_code()
+        return await self.currency_repository(valid_currency).get_history_quote(
+            reference_date=reference_date
+        )
+
+    async def validate_currency_code(self) -> CurrencyObject:
+        with get_metrics().timer("currency_quote_phase_seconds", phase="validate"):
+            validated_list = await self.currency_validator(
+                self.currency
+            ).validate_currency_code()
+        return CurrencyValidatorService.build_validated_currency(
+            self.currency.get_currency_list(), validated_list
+        )
@@ -0,0 +1,303 @@
+import threading
+from collections import deque
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+from currency_quote.domain.entities.cross_rate import CrossQuote, RateLeg, RateMatrix
+from currency_quote.domain.entities.currency import CurrencyQuote
+from currency_quote.domain.entities.parity_index import ParityIndex
+from currency_quote.domain.entities.quote_result import QuoteResult
+from currency_quote.utils.optional import import_optional
+
+
+class CrossRateEngine:
+    """
+    Derives rates for any pair from the quoted pairs of a parity list.
+
+    The parity list is seen as a graph whose nodes are currencies and whose
+    edges are quoted pairs, walkable both ways. A requested pair is priced along
+    the shortest path between its two currencies, so only the legs on that path
+    have to be fetched.
+    """
+
+    _shared: Optional["CrossRateEngine"] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, parity_index: ParityIndex):
+        self.parity_index = parity_index
+        self._edges: Dict[str, List[RateLeg]] = {}
+        self._paths: Dict[Tuple[str, str], Optional[Tuple[RateLeg, ...]]] = {}
+
+        for currency_pair in sorted(parity_index.pairs):
+            direct = RateLeg(currency_pair)
+            inverse = RateLeg(currency_pair, inverted=True)
+            self._edges.setdefault(direct.source, []).append(direct)
+            self._edges.setdefault(inverse.source, []).append(inverse)
+
+        # Direct legs are listed before inverse ones, so they win ties.
+        for legs in self._edges.values():
+            legs.sort(key=lambda leg: leg.inverted)
+
+    @classmethod
+    def for_index(cls, parity_index: ParityIndex) -> "CrossRateEngine":
+        """Return the engine for an index, reusing it while the version is unchanged."""
+        with cls._shared_lock:
+            engine = cls._shared
+            if engine is None or engine.parity_index.version != parity_index.version:
+                engine = cls._shared = cls(parity_index)
+            return engine
+
+    @property
+    def currencies(self) -> Set[str]:
+        return set(self._edges)
+
+    def path(self, currency_pair: str) -> Tuple[RateLeg, ...]:
+        """
+        Return the shortest chain of quoted legs that prices a pair.
+
+        Direct quotes are preferred, then the inverse of a quoted pair, then the
+        fewest hops through pivot currencies.
+
+        Args:
+            currency_pair: The pair to price, e.g. 'EUR-JPY'.
+
+        Returns:
+            tuple: The legs, from the pair's base currency to its quote currency.
+
+        Raises:
+            ValueError: If the pair is malformed or its currencies are not connected.
+        """
+        base_currency, separator, quote_currency = currency_pair.partition("-")
+        if not separator or base_currency == quote_currency:
+            raise ValueError(f"Invalid currency pair: {currency_pair}")
+
+        key = (base_currency, quote_currency)
+        if key not in self._paths:
+            self._paths[key] = self._shortest_path(base_currency, quote_currency)
+
+        legs = self._paths[key]
+        if legs is None:
+            raise ValueError(f"No conversion path for {currency_pair}")
+
+        return legs
+
+    def required_pairs(self, currency_list: Iterable[str]) -> List[str]:
+        """Return the quoted pairs needed to price every requested pair, in order."""
+        return list(
+            dict.fromkeys(
+                leg.currency_pair
+                for currency_pair in currency_list
+                for leg in self.path(currency_pair)
+            )
+        )
+
+    def derive(
+        self, currency_list: Iterable[str], quotes: Iterable[CurrencyQuote]
+    ) -> QuoteResult:
+        """
+        Price the requested pairs from already fetched quotes.
+
+        Walking a leg forwards multiplies by its bid (ask); walking it backwards
+        multiplies by the inverse of its ask (bid), so the derived spread is the
+        sum of the spreads crossed. Each leg's factors are computed once, however
+        many pairs cross it. Paths are one to a few legs long and this must work
+        without NumPy, so unlike ``rate_matrix`` the product is not vectorized.
+
+        Args:
+            currency_list: The pairs to price, e.g. ['EUR-JPY'].
+            quotes: Quotes covering ``required_pairs(currency_list)``, e.g. a
+                QuoteResult whose ``errors`` explain the missing ones.
+
+        Returns:
+            QuoteResult: One CrossQuote per priced pair, in order. A pair with a
+                leg missing from ``quotes`` is left out and its ``errors`` entry
+                is the leg's error.
+        """
+        by_pair = {quote.currency_pair: quote for quote in quotes}
+        leg_errors = getattr(quotes, "errors", {})
+        factors: Dict[RateLeg, Tuple[float, float]] = {}
+        result = QuoteResult()
+
+        for currency_pair in currency_list:
+            legs = self.path(currency_pair)
+            missing = [leg for leg in legs if leg.currency_pair not in by_pair]
+            if missing:
+                leg_pair = missing[0].currency_pair
+                result.errors[currency_pair] = leg_errors.get(leg_pair) or ValueError(
+                    f"Missing quote for {leg_pair}, a leg of {currency_pair}"
+                )
+                continue
+
+            leg_quotes = [by_pair[leg.currency_pair] for leg in legs]
+            bid_price = ask_price = 1.0
+
+            for leg, quote in zip(legs, leg_quotes):
+                if leg not in factors:
+                    factors[leg] = (
+                        (1.0 / quote.ask_price, 1.0 / quote.bid_price)
+                        if leg.inverted
+                        else (quote.bid_price, quote.ask_price)
+                    )
+                bid_factor, ask_factor = factors[leg]
+                bid_price *= bid_factor
+                ask_price *= ask_factor
+
+            base_currency, _, quote_currency = currency_pair.partition("-")
+            result.append(
+                CrossQuote(
+                    currency_pair=currency_pair,
+                    base_currency_code=base_currency,
+                    quote_currency_code=quote_currency,
+                    quote_timestamp=min(quote.quote_timestamp for quote in leg_quotes),
+                    bid_price=bid_price,
+                    ask_price=ask_price,
+                    quote_extracted_at=max(
+                        quote.quote_extracted_at for quote in leg_quotes
+                    ),
+                    legs=legs,
+                )
+            )
+
+        return result
+
+    def pivot_legs(self, currencies: Iterable[str], pivot: str) -> Dict[str, RateLeg]:
+        """
+        Return, for each currency, the single quoted leg that converts it to ``pivot``.
+
+        Raises:
+            ValueError: If a currency is not quoted against the pivot.
+        """
+        legs = {}
+
+        for currency in currencies:
+            if currency == pivot:
+                continue
+            direct = f"{currency}-{pivot}"
+            inverse = f"{pivot}-{currency}"
+            if direct in self.parity_index:
+                legs[currency] = RateLeg(direct)
+            elif inverse in self.parity_index:
+                legs[currency] = RateLeg(inverse, inverted=True)
+            else:
+                raise ValueError(f"{currency} is not quoted against {pivot}")
+
+        return legs
+
+    def choose_pivot(self, currencies: Iterable[str]) -> str:
+        """Return the currency quoted against the most of the others, ties by name."""
+        currencies = list(dict.fromkeys(currencies))
+
+        def coverage(pivot: str) -> Tuple[int, str]:
+            quoted = sum(
+                1
+                for currency in currencies
+                if currency != pivot
+                and (
+                    f"{currency}-{pivot}" in self.parity_index
+                    or f"{pivot}-{currency}" in self.parity_index
+                )
+            )
+            return -quoted, pivot
+
+        candidates = self.currencies | set(currencies)
+        return min(candidates, key=coverage)
+
+    def rate_matrix(
+        self,
+        currencies: Iterable[str],
+        quotes: Iterable[CurrencyQuote],
+        pivot: str,
+    ) -> RateMatrix:
+        """
+        Build the N×N bid/ask matrix from the N-1 legs against a pivot currency.
+
+        With ``b`` and ``a`` the bid and ask of each currency in pivot units,
+        ``bid[i][j] = b[i] / a[j]`` and ``ask[i][j] = a[i] / b[j]``, computed as
+        two outer products.
+
+        Args:
+            currencies: The currencies of the matrix, e.g. ['USD', 'EUR', 'JPY'].
+            quotes: Quotes covering ``pivot_legs(currencies, pivot)``.
+            pivot: The currency every other one is quoted against.
+
+        Returns:
+            RateMatrix: The matrices, with the legs they were derived from. The
+                row and column of a currency whose leg is missing from
+                ``quotes`` are NaN, and the leg's error is in ``errors``.
+        """
+        np = import_optional("numpy", extra="columnar")
+        currencies = list(dict.fromkeys(currencies))
+        legs = self.pivot_legs(currencies, pivot)
+        by_pair: Mapping[str, CurrencyQuote] = {
+            quote.currency_pair: quote for quote in quotes
+        }
+
+        leg_errors = getattr(quotes, "errors", {})
+        errors = {}
+
+        leg_bid = np.ones(len(currencies))
+        leg_ask = np.ones(len(currencies))
+        inverted = np.zeros(len(currencies), dtype=bool)
+
+        for position, currency in enumerate(currencies):
+            leg = legs.get(currency)
+            if leg is None:
+                continue
+            quote = by_pair.get(leg.currency_pair)
+            if quote is None:
+                error = leg_errors.get(leg.currency_pair)
+                errors[leg.currency_pair] = error or ValueError(
+                    f"Missing quote for {leg.currency_pair}"
+                )
+                leg_bid[position] = leg_ask[position] = np.nan
+            else:
+                leg_bid[position] = quote.bid_price
+                leg_ask[position] = quote.ask_price
+                inverted[position] = leg.inverted
+
+        # An inverted leg quotes pivot-X: X's bid in pivot units is 1 / ask.
+        bid = np.where(inverted, 1.0 / leg_ask, leg_bid)
+        ask = np.where(inverted, 1.0 / leg_bid, leg_ask)
+
+        bid_matrix = np.outer(bid, 1.0 / ask)
+        ask_matrix = np.outer(ask, 1.0 / bid)
+        np.fill_diagonal(bid_matrix, 1.0)
+        np.fill_diagonal(ask_matrix, 1.0)
+
+        return RateMatrix(
+            currencies=currencies,
+            pivot=pivot,
+            bid=bid_matrix,
+            ask=ask_matrix,
+            legs=legs,
+            errors=errors,
+        )
+
+    def _shortest_path(
+        self, base_currency: str, quote_currency: str
+    ) -> Optional[Tuple[RateLeg, ...]]:
+        if base_currency not in self._edges or quote_currency not in self._edges:
+            return None
+
+        previous: Dict[str, Optional[RateLeg]] = {base_currency: None}
+        pending = deque([base_currency])
+
+        while pending:
+            currency = pending.popleft()
+            if currency == quote_currency:
+                break
+            for leg in self._edges[currency]:
+                if leg.target not in previous:
+                    previous[leg.target] = leg
+                    pending.append(leg.target)
+
+        if quote_currency not in previous:
+            return None
+
+        legs = []
+        currency = quote_currency
+        while previous[currency] is not None:
+            leg = previous[currency]
+            legs.append(leg)
+            currency = leg.source
+
+        return tuple(reversed(legs))
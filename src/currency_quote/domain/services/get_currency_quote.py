@@ -1,4 +1,4 @@
-from typing import Type, List
+from typing import Iterator, Optional, Type, List
 from currency_quote.application.ports.outbound.currency_repository import (
     ICurrencyRepository,
 )
@@ -6,15 +6,21 @@ from currency_quote.application.use_cases.validate_currency import (
     ValidateCurrencyUseCase,
 )
 from currency_quote.domain.entities.currency import CurrencyQuote, CurrencyObject
+from currency_quote.domain.services.validate_currency import ValidatedCurrencyList
+from currency_quote.utils.metrics import get_metrics
 
 
 class GetCurrencyQuoteService:
     def __init__(
-        self, currency: CurrencyObject, currency_repository: Type[ICurrencyRepository]
+        self,
+        currency: CurrencyObject,
+        currency_repository: Type[ICurrencyRepository],
+        validated_currency: Optional[ValidatedCurrencyList] = None,
     ):
         self.currency = currency
         self.currency_repository = currency_repository
-    
+        self.validated_currency = validated_currency
+
     def last(self) -> List[CurrencyQuote]:
         valid_currency = self.validate_currency_code()
         last_quote = self.currency_repository(valid_currency).get_last_quote()
@@ -25,6 +31,14 @@ class GetCurrencyQuoteService:
             self.validate_currency_code()
         ).get_history_quote(reference_date=reference_date)
 
+    def history_range(self, start_date: int, end_date: int) -> Iterator[CurrencyQuote]:
+        return self.currency_repository(
+            self.validate_currency_code()
+        ).get_history_range(start_date=start_date, end_date=end_date)
+
     def validate_currency_code(self) -> CurrencyObject:
-        currency_valid_obj = ValidateCurrencyUseCase.execute(self.currency)
+        with get_metrics().timer("currency_quote_phase_seconds", phase="validate"):
+            if self.validated_currency is not None:
+                return self.validated_currency.get()
+            currency_valid_obj = ValidateCurrencyUseCase.execute(self.currency)
         return currency_valid_obj
@@ -0,0 +1,314 @@
+import math
+from collections import deque
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
+
+from currency_quote.domain.entities.quote_columns import QuoteColumns
+from currency_quote.utils.dates import UPSTREAM_TIMEZONE
+from currency_quote.utils.optional import import_optional
+
+_SECONDS_PER_DAY = 86400
+_UTC_OFFSET_SECONDS = int(UPSTREAM_TIMEZONE.utcoffset(None).total_seconds())
+
+
+def _numpy():
+    return import_optional("numpy", extra="columnar")
+
+
+def pair_series(columns: QuoteColumns, currency_pair: str) -> Dict[str, "object"]:
+    """
+    Extract one pair's quotes from a QuoteColumns batch, oldest first.
+
+    Args:
+        columns: Quotes of one or more pairs, in any order.
+        currency_pair: The pair to extract, e.g. 'USD-BRL'.
+
+    Returns:
+        dict: ``timestamp``, ``bid`` and ``ask`` NumPy arrays.
+    """
+    np = _numpy()
+    pair_column = columns.currency_pair
+
+    try:
+        code = pair_column.categories.index(currency_pair)
+    except ValueError:
+        code = -1
+
+    mask = (
+        np.frombuffer(pair_column.codes, dtype=f"i{pair_column.codes.itemsize}") == code
+    )
+    timestamp = np.frombuffer(columns.quote_timestamp, dtype="q")[mask]
+    order = np.argsort(timestamp, kind="stable")
+
+    return {
+        "timestamp": timestamp[order],
+        "bid": np.frombuffer(columns.bid_price, dtype="d")[mask][order],
+        "ask": np.frombuffer(columns.ask_price, dtype="d")[mask][order],
+    }
+
+
+def mid_price(bid, ask):
+    np = _numpy()
+    return (np.asarray(bid, dtype=float) + np.asarray(ask, dtype=float)) / 2
+
+
+def spread(bid, ask, relative: bool = False):
+    """Return ask - bid, or that spread divided by the mid price when ``relative``."""
+    np = _numpy()
+    bid, ask = np.asarray(bid, dtype=float), np.asarray(ask, dtype=float)
+    absolute = ask - bid
+    return absolute / ((ask + bid) / 2) if relative else absolute
+
+
+def returns(prices, log: bool = False):
+    """Return the n-1 period-over-period simple (or log) returns of a price series."""
+    np = _numpy()
+    prices = np.asarray(prices, dtype=float)
+    if log:
+        return np.diff(np.log(prices))
+    return prices[1:] / prices[:-1] - 1
+
+
+def _windows(values, window: int):
+    np = _numpy()
+    values = np.asarray(values, dtype=float)
+    if window < 1:
+        raise ValueError("Window must be at least 1")
+    if len(values) < window:
+        return np.empty((0, window))
+    return np.lib.stride_tricks.sliding_window_view(values, window)
+
+
+def rolling_mean(values, window: int):
+    """Return the mean of every full window; the result has n - window + 1 items."""
+    return _windows(values, window).mean(axis=1)
+
+
+def rolling_std(values, window: int):
+    """Return the sample standard deviation of every full window."""
+    return _windows(values, window).std(axis=1, ddof=1)
+
+
+def rolling_volatility(prices, window: int, periods_per_year: Optional[int] = None):
+    """
+    Return the rolling standard deviation of log returns.
+
+    Args:
+        prices: Price series, oldest first.
+        window: Number of returns per window.
+        periods_per_year: Annualise by ``sqrt(periods_per_year)`` when given,
+            e.g. 252 for daily quotes.
+
+    Returns:
+        numpy.ndarray: One volatility per full window of returns.
+    """
+    volatility = rolling_std(returns(prices, log=True), window)
+    if periods_per_year:
+        volatility = volatility * math.sqrt(periods_per_year)
+    return volatility
+
+
+def rolling_correlation(first, second, window: int):
+    """Return the Pearson correlation of two aligned series over every full window."""
+    np = _numpy()
+    first_windows = _windows(first, window)
+    second_windows = _windows(second, window)
+
+    first_centered = first_windows - first_windows.mean(axis=1, keepdims=True)
+    second_centered = second_windows - second_windows.mean(axis=1, keepdims=True)
+    covariance = (first_centered * second_centered).sum(axis=1)
+    scale = np.sqrt(
+        (first_centered**2).sum(axis=1) * (second_centered**2).sum(axis=1)
+    )
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return covariance / scale
+
+
+def resample_ohlc(timestamps, prices, period_seconds: int = _SECONDS_PER_DAY):
+    """
+    Aggregate a price series into open/high/low/close bars.
+
+    Bars are aligned on upstream (Brasília) days, or multiples of them for
+    longer periods, and only periods that contain quotes are returned.
+
+    Args:
+        timestamps: Unix timestamps, oldest first.
+        prices: Prices at those timestamps.
+        period_seconds: Bar length, one day by default.
+
+    Returns:
+        dict: ``period_start`` timestamps and ``open``, ``high``, ``low`` and
+            ``close`` arrays, one entry per bar.
+    """
+    np = _numpy()
+    timestamps = np.asarray(timestamps, dtype="int64")
+    prices = np.asarray(prices, dtype=float)
+
+    if len(timestamps) == 0:
+        empty = np.empty(0)
+        return {
+            "period_start": np.empty(0, dtype="int64"),
+            "open": empty,
+            "high": empty,
+            "low": empty,
+            "close": empty,
+        }
+
+    periods = (timestamps + _UTC_OFFSET_SECONDS) // period_seconds
+    starts = np.flatnonzero(np.r_[True, periods[1:] != periods[:-1]])
+    ends = np.r_[starts[1:], len(prices)] - 1
+
+    return {
+        "period_start": periods[starts] * period_seconds - _UTC_OFFSET_SECONDS,
+        "open": prices[starts],
+        "high": np.maximum.reduceat(prices, starts),
+        "low": np.minimum.reduceat(prices, starts),
+        "close": prices[ends],
+    }
+
+
+def align_mid_prices(
+    columns: QuoteColumns, currency_pairs: Sequence[str]
+) -> Tuple["object", "object"]:
+    """
+    Line up the daily mid prices of several pairs on the days they all have.
+
+    Args:
+        columns: History quotes of the pairs.
+        currency_pairs: The pairs to align, e.g. ['USD-BRL', 'EUR-BRL'].
+
+    Returns:
+        tuple: (day numbers since the epoch in upstream time, matrix with one
+            column of mid prices per pair).
+    """
+    np = _numpy()
+    days = None
+    by_pair = []
+
+    for currency_pair in currency_pairs:
+        series = pair_series(columns, currency_pair)
+        pair_days = (series["timestamp"] + _UTC_OFFSET_SECONDS) // _SECONDS_PER_DAY
+        # Keep the last quote of each day.
+        last = np.append(pair_days[1:] != pair_days[:-1], True)[: len(pair_days)]
+        pair_days = pair_days[last]
+        by_pair.append((pair_days, mid_price(series["bid"], series["ask"])[last]))
+        days = pair_days if days is None else np.intersect1d(days, pair_days)
+
+    matrix = np.column_stack(
+        [prices[np.searchsorted(pair_days, days)] for pair_days, prices in by_pair]
+    )
+    return days, matrix
+
+
+class RollingStats:
+    """
+    Mean, variance and standard deviation of the last ``window`` values.
+
+    Each ``push`` updates the statistics in O(1) with Welford's algorithm, adding
+    the new value and removing the one leaving the window, so appending a day
+    never recomputes the window.
+    """
+
+    def __init__(self, window: int):
+        if window < 2:
+            raise ValueError("Window must be at least 2")
+        self.window = window
+        self._values: Deque[float] = deque()
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def push(self, value: float) -> None:
+        value = float(value)
+        self._values.append(value)
+
+        if len(self._values) > self.window:
+            removed = self._values.popleft()
+            count = len(self._values)
+            old_mean = self._mean
+            self._mean += (value - removed) / count
+            self._m2 += (value - removed) * (value - self._mean + removed - old_mean)
+        else:
+            count = len(self._values)
+            delta = value - self._mean
+            self._mean += delta / count
+            self._m2 += delta * (value - self._mean)
+
+    def extend(self, values) -> None:
+        for value in values:
+            self.push(value)
+
+    @property
+    def count(self) -> int:
+        return len(self._values)
+
+    @property
+    def full(self) -> bool:
+        return len(self._values) == self.window
+
+    @property
+    def mean(self) -> float:
+        return self._mean if self._values else math.nan
+
+    @property
+    def variance(self) -> float:
+        if len(self._values) < 2:
+            return math.nan
+        return max(self._m2, 0.0) / (len(self._values) - 1)
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+
+class RollingCorrelation:
+    """
+    Pearson correlation of the last ``window`` pairs of values, updated in O(1).
+
+    Running sums are kept on values shifted by the first observation, which
+    keeps the sums small for price-like series.
+    """
+
+    def __init__(self, window: int):
+        if window < 2:
+            raise ValueError("Window must be at least 2")
+        self.window = window
+        self._pairs: Deque[Tuple[float, float]] = deque()
+        self._shift: Optional[Tuple[float, float]] = None
+        self._sums: List[float] = [0.0] * 5
+
+    def push(self, first: float, second: float) -> None:
+        if self._shift is None:
+            self._shift = (float(first), float(second))
+
+        pair = (float(first) - self._shift[0], float(second) - self._shift[1])
+        self._pairs.append(pair)
+        self._add(pair, 1)
+
+        if len(self._pairs) > self.window:
+            self._add(self._pairs.popleft(), -1)
+
+    def _add(self, pair: Tuple[float, float], sign: int) -> None:
+        first, second = pair
+        for position, term in enumerate(
+            (first, second, first * first, second * second, first * second)
+        ):
+            self._sums[position] += sign * term
+
+    @property
+    def count(self) -> int:
+        return len(self._pairs)
+
+    @property
+    def value(self) -> float:
+        count = len(self._pairs)
+        if count < 2:
+            return math.nan
+
+        sum_first, sum_second, sum_first2, sum_second2, sum_product = self._sums
+        covariance = sum_product - sum_first * sum_second / count
+        first_variance = sum_first2 - sum_first * sum_first / count
+        second_variance = sum_second2 - sum_second * sum_second / count
+
+        if first_variance <= 0 or second_variance <= 0:
+            return math.nan
+        return covariance / math.sqrt(first_variance * second_variance)
@@ -1,6 +1,8 @@
 # src/currency_quote/application/services/currency_validator_service.py
-from typing import Type
+import threading
+from typing import Callable, List, Optional, Type, Union
 from currency_quote.domain.entities.currency import CurrencyObject
+from currency_quote.domain.entities.parity_index import ParityIndex
 from currency_quote.application.ports.outbound.currency_validator_repository import (
     ICurrencyValidator,
 )
@@ -33,12 +35,146 @@ class CurrencyValidatorService:
             self.currency_quote
         ).validate_currency_code()
 
+        return self.build_validated_currency(self.currency_list, validated_list)
+
+    @staticmethod
+    def build_validated_currency(
+        currency_list: List[str], validated_list: List[str]
+    ) -> CurrencyObject:
+        """
+        Build the validated CurrencyObject from the pairs accepted by a validator.
+
+        Args:
+            currency_list: The requested currency pairs.
+            validated_list: The pairs the validator accepted.
+
+        Returns:
+            CurrencyObject: A new CurrencyObject containing only valid currency pairs.
+
+        Raises:
+            ValueError: If all provided currency pairs are invalid.
+        """
         if len(validated_list) == 0:
-            logger.error("All currency params are invalid: %s", self.currency_list)
-            raise ValueError(f"All params: {self.currency_list} are invalid.")
+            logger.error("All currency params are invalid: %s", currency_list)
+            raise ValueError(f"All params: {currency_list} are invalid.")
 
-        if len(validated_list) < len(self.currency_list):
-            invalid_currencies = set(self.currency_list) - set(validated_list)
+        if len(validated_list) < len(currency_list):
+            validated_set = set(validated_list)
+            invalid_currencies = [
+                currency for currency in currency_list if currency not in validated_set
+            ]
             logger.warning("Invalid currency params: %s", invalid_currencies)
 
         return CurrencyObject(validated_list)
+
+
+class ValidatedCurrencyList:
+    """
+    Long-lived validation of a pair list against the available parities.
+
+    The pairs are checked once and the result is kept together with the version
+    of the parity list it was checked against. It is reused for as long as that
+    version is current, and pairs added later are checked against the same
+    list, so only a change of upstream availability triggers a full validation.
+    """
+
+    def __init__(
+        self, currency: CurrencyObject, parity_index: Callable[[], ParityIndex]
+    ):
+        self.parity_index = parity_index
+        self._lock = threading.Lock()
+        self._requested: List[str] = list(dict.fromkeys(currency.get_currency_list()))
+        self._index: Optional[ParityIndex] = None
+        self._valid: List[str] = []
+        self._validated: Optional[CurrencyObject] = None
+
+    @property
+    def currency_list(self) -> List[str]:
+        """The requested pairs, valid or not, in the order they were added."""
+        with self._lock:
+            return list(self._requested)
+
+    @property
+    def version(self) -> Optional[str]:
+        """Version of the parity list of the last validation, None before the first."""
+        index = self._index
+        return None if index is None else index.version
+
+    def get(self) -> CurrencyObject:
+        """
+        Return the valid pairs, validating only if the parity list changed.
+
+        Returns:
+            CurrencyObject: The requested pairs that are available upstream.
+
+        Raises:
+            ValueError: If none of the requested pairs is available.
+        """
+        index = self.parity_index()
+
+        with self._lock:
+            if self._index is None or self._index.version != index.version:
+                self._valid, _ = index.split(self._requested)
+                self._index = index
+                self._validated = None
+
+            if self._validated is None:
+                self._validated = CurrencyValidatorService.build_validated_currency(
+                    self._requested, self._valid
+                )
+
+            return self._validated
+
+    def add(self, currency_list: Union[list, str]) -> List[str]:
+        """
+        Add pairs, checking only those against the remembered parity list.
+
+        Args:
+            currency_list: The pairs to add, e.g. ['GBP-BRL'] or 'GBP-BRL'.
+
+        Returns:
+            list: The pairs that were not requested yet.
+
+        Raises:
+            ValueError: If a pair is malformed.
+        """
+        added = CurrencyObject(currency_list).get_currency_list()
+
+        with self._lock:
+            known = set(self._requested)
+            added = [pair for pair in dict.fromkeys(added) if pair not in known]
+            self._requested.extend(added)
+
+            if self._index is not None and added:
+                self._valid.extend(self._index.split(added)[0])
+                self._validated = None
+
+        return added
+
+    def remove(self, currency_list: Union[list, str]) -> List[str]:
+        """
+        Stop tracking pairs; the remaining ones are not validated again.
+
+        Args:
+            currency_list: The pairs to remove, e.g. ['GBP-BRL'] or 'GBP-BRL'.
+
+        Returns:
+            list: The pairs that were removed.
+
+        Raises:
+            ValueError: If a pair is malformed or no pair would be left.
+        """
+        removed = set(CurrencyObject(currency_list).get_currency_list())
+
+        with self._lock:
+            remaining = [pair for pair in self._requested if pair not in removed]
+            if not remaining:
+                raise ValueError("Currency list is empty")
+
+            dropped = [pair for pair in self._requested if pair in removed]
+            self._requested = remaining
+            self._valid = [pair for pair in self._valid if pair not in removed]
+            if dropped:
+                self._validated = None
+
+        return dropped
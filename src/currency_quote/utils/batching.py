@@ -0,0 +1,50 @@
+from typing import Iterable, List
+
+
+def plan_batches(
+    items: Iterable[str],
+    prefix_length: int,
+    max_length: int,
+    max_items: int,
+    separator: str = ",",
+) -> List[List[str]]:
+    """
+    Pack items into the fewest in-order batches that fit a joined-URL budget.
+
+    Each batch holds at most ``max_items`` items, and ``prefix_length`` plus the
+    items joined by ``separator`` never exceeds ``max_length`` characters.
+
+    Args:
+        items: The items to pack, e.g. currency pair codes.
+        prefix_length: Length of the fixed part of the URL before the items.
+        max_length: Maximum length of a whole URL.
+        max_items: Maximum number of items per batch.
+        separator: String placed between the items of a batch.
+
+    Returns:
+        list: The batches, in the input order.
+
+    Raises:
+        ValueError: If a single item does not fit in an empty batch.
+    """
+    batches: List[List[str]] = []
+    batch: List[str] = []
+    length = prefix_length
+
+    for item in items:
+        added = len(item) + (len(separator) if batch else 0)
+
+        if batch and (len(batch) >= max_items or length + added > max_length):
+            batches.append(batch)
+            batch, length, added = [], prefix_length, len(item)
+
+        if length + added > max_length:
+            raise ValueError(f"Item does not fit in a URL of {max_length} characters")
+
+        batch.append(item)
+        length += added
+
+    if batch:
+        batches.append(batch)
+
+    return batches
@@ -0,0 +1,66 @@
+import time
+from abc import ABC, abstractmethod
+
+
+class Clock(ABC):
+    @abstractmethod
+    def time(self) -> float:
+        pass
+
+    def timestamp(self) -> int:
+        return int(self.time())
+
+
+class MonotonicClock(Clock):
+    """
+    Wall clock anchored to ``time.time()`` once and advanced with ``time.monotonic()``.
+
+    Readings never go backwards when the system clock is adjusted, so durations
+    computed from two extraction timestamps stay meaningful.
+    """
+
+    def __init__(self):
+        self._anchor_wall = time.time()
+        self._anchor_monotonic = time.monotonic()
+
+    def time(self) -> float:
+        return self._anchor_wall + (time.monotonic() - self._anchor_monotonic)
+
+
+class FixedClock(Clock):
+    """Manually driven clock for tests and deterministic replays."""
+
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def time(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+_clock: Clock = MonotonicClock()
+
+
+def get_clock() -> Clock:
+    return _clock
+
+
+def set_clock(clock: Clock) -> Clock:
+    """
+    Replace the process-wide clock used to stamp extracted quotes.
+
+    Args:
+        clock: The new clock.
+
+    Returns:
+        Clock: The previous clock, so callers can restore it.
+    """
+    global _clock  # pylint: disable=global-statement
+    previous, _clock = _clock, clock
+    return previous
+
+
+def now_timestamp() -> int:
+    return _clock.timestamp()
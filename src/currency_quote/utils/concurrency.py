@@ -0,0 +1,38 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+Outcome = Tuple[Optional[R], Optional[BaseException]]
+
+
+def _capture(func: Callable[[T], R], item: T) -> Outcome:
+    try:
+        return func(item), None
+    except Exception as exc:  # pylint: disable=broad-exception-caught
+        return None, exc
+
+
+def run_concurrently(
+    func: Callable[[T], R], items: Iterable[T], max_workers: int
+) -> List[Outcome]:
+    """
+    Call ``func`` for every item with at most ``max_workers`` calls in flight.
+
+    Args:
+        func: The callable to run for each item.
+        items: The items to process.
+        max_workers: Maximum number of concurrent calls.
+
+    Returns:
+        list: One (result, error) tuple per item, in the input order. Exactly one
+        of the two values is set.
+    """
+    items = list(items)
+
+    if len(items) <= 1 or max_workers <= 1:
+        return [_capture(func, item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(lambda item: _capture(func, item), items))
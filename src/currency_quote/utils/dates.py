@@ -0,0 +1,96 @@
+from datetime import date, datetime, timedelta, timezone
+from typing import Iterable, Iterator, Tuple
+
+# Upstream reference dates follow Brasília time (UTC-3, no daylight saving).
+UPSTREAM_TIMEZONE = timezone(timedelta(hours=-3))
+
+
+def to_date(reference_date: int) -> date:
+    return datetime.strptime(str(reference_date), "%Y%m%d").date()
+
+
+def to_reference_date(value: date) -> int:
+    return value.year * 10000 + value.month * 100 + value.day
+
+
+def today_reference_date() -> int:
+    return int(datetime.today().strftime("%Y%m%d"))
+
+
+def timestamp_to_reference_date(timestamp: int) -> int:
+    return to_reference_date(
+        datetime.fromtimestamp(timestamp, tz=UPSTREAM_TIMEZONE).date()
+    )
+
+
+def is_valid_reference_date(reference_date: int) -> bool:
+    """Return True for a well-formed YYYYMMDD date strictly before today."""
+    if len(str(reference_date)) != 8 or reference_date >= today_reference_date():
+        return False
+
+    try:
+        to_date(reference_date)
+    except ValueError:
+        return False
+
+    return True
+
+
+def date_windows(
+    start_date: int, end_date: int, max_days: int
+) -> Iterator[Tuple[int, int]]:
+    """
+    Split an inclusive date range into consecutive windows of at most ``max_days``.
+
+    Args:
+        start_date: First date of the range, as YYYYMMDD.
+        end_date: Last date of the range, as YYYYMMDD.
+        max_days: Maximum number of days per window.
+
+    Yields:
+        tuple: (window start, window end), both inclusive, as YYYYMMDD.
+    """
+    current, last = to_date(start_date), to_date(end_date)
+
+    while current <= last:
+        window_end = min(current + timedelta(days=max_days - 1), last)
+        yield to_reference_date(current), to_reference_date(window_end)
+        current = window_end + timedelta(days=1)
+
+
+def days_between(start_date: int, end_date: int) -> int:
+    """Return the number of days in the inclusive range."""
+    return (to_date(end_date) - to_date(start_date)).days + 1
+
+
+def date_range(start_date: int, end_date: int) -> Iterator[int]:
+    """Yield every date of the inclusive range, as YYYYMMDD."""
+    current, last = to_date(start_date), to_date(end_date)
+
+    while current <= last:
+        yield to_reference_date(current)
+        current += timedelta(days=1)
+
+
+def contiguous_ranges(reference_dates: Iterable[int]) -> Iterator[Tuple[int, int]]:
+    """
+    Merge dates into the fewest inclusive ranges of consecutive days.
+
+    Args:
+        reference_dates: Dates as YYYYMMDD, in any order; duplicates are ignored.
+
+    Yields:
+        tuple: (range start, range end), both inclusive, as YYYYMMDD, in order.
+    """
+    days = sorted({to_date(reference_date) for reference_date in reference_dates})
+    if not days:
+        return
+
+    start = previous = days[0]
+    for day in days[1:]:
+        if day - previous > timedelta(days=1):
+            yield to_reference_date(start), to_reference_date(previous)
+            start = day
+        previous = day
+
+    yield to_reference_date(start), to_reference_date(previous)
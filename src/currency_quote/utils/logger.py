@@ -1,5 +1,6 @@
 import logging
 
+
 # Configure the root logger
 def setup_logging(level=logging.INFO):
     """
@@ -11,15 +12,20 @@ def setup_logging(level=logging.INFO):
     logger = logging.getLogger("currency_quote")
     logger.setLevel(level)
 
-    # Avoid adding handlers multiple times
-    if not logger.handlers:
+    # Avoid adding handlers multiple times; the package's NullHandler doesn't count.
+    if not any(
+        not isinstance(handler, logging.NullHandler) for handler in logger.handlers
+    ):
         handler = logging.StreamHandler()
-        formatter = logging.Formatter('[%(asctime)s] %(levelname)s - %(name)s - %(message)s')
+        formatter = logging.Formatter(
+            "[%(asctime)s] %(levelname)s - %(name)s - %(message)s"
+        )
         handler.setFormatter(formatter)
         logger.addHandler(handler)
 
     return logger
 
+
 # Get a named logger
 def get_logger(name):
     """
@@ -32,4 +38,3 @@ def get_logger(name):
         A logger instance.
     """
     return logging.getLogger(f"currency_quote.{name}")
-
@@ -0,0 +1,413 @@
+import asyncio
+import bisect
+import functools
+import inspect
+import math
+import threading
+import time
+from contextlib import nullcontext
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+SECONDS_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+BYTES_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+_DISABLED_TIMER = nullcontext()
+
+
+class MetricsRecorder:
+    """
+    Instrumentation hooks called from the use cases, adapters and caches.
+
+    This base class records nothing and is the default, so instrumentation
+    costs a method call per hook until a real recorder is installed with
+    ``set_metrics``. Call sites that need extra work to build a measurement,
+    such as one observation per pair, check ``enabled`` first.
+    """
+
+    enabled = False
+
+    def increment(self, name: str, value: float = 1, **labels: str) -> None:
+        """Add ``value`` to a counter."""
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        """Record one value, e.g. a duration in seconds, in a histogram."""
+
+    def timer(self, name: str, **labels: str):
+        """Return a context manager that observes its own duration under ``name``."""
+        if not self.enabled:
+            return _DISABLED_TIMER
+        return _Timer(self, name, labels)
+
+
+class _Timer:
+    __slots__ = ("recorder", "name", "labels", "started")
+
+    def __init__(self, recorder: MetricsRecorder, name: str, labels: Dict[str, str]):
+        self.recorder = recorder
+        self.name = name
+        self.labels = labels
+        self.started = 0.0
+
+    def __enter__(self) -> "_Timer":
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.recorder.observe(
+            self.name, time.perf_counter() - self.started, **self.labels
+        )
+
+
+class Histogram:
+    """Bucketed distribution of observed values, with exact count, sum, min and max."""
+
+    def __init__(self, bounds: Sequence[float]):
+        self.bounds = tuple(sorted(bounds))
+        self.bucket_counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        self.bucket_counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else math.nan
+
+    def quantile(self, fraction: float) -> float:
+        """
+        Estimate a quantile by interpolating inside its bucket.
+
+        Args:
+            fraction: The quantile, e.g. 0.99.
+
+        Returns:
+            float: The estimate, clamped to the observed min and max.
+        """
+        if not self.count:
+            return math.nan
+
+        rank = fraction * self.count
+        seen = 0
+
+        for position, bucket_count in enumerate(self.bucket_counts):
+            if bucket_count and seen + bucket_count >= rank:
+                lower = self.bounds[position - 1] if position else self.min
+                upper = (
+                    self.bounds[position] if position < len(self.bounds) else self.max
+                )
+                estimate = lower + (upper - lower) * (rank - seen) / bucket_count
+                return min(max(estimate, self.min), self.max)
+            seen += bucket_count
+
+        return self.max
+
+
+class InMemoryMetrics(MetricsRecorder):
+    """
+    Thread-safe recorder that aggregates counters and histograms in memory.
+
+    Read values back with ``counter``, ``histogram`` or ``snapshot``, or serve
+    ``to_prometheus()`` from a scrape endpoint. Histograms whose name ends in
+    ``_bytes`` use byte-sized buckets, the others second-sized ones.
+
+    Args:
+        buckets: Optional bucket bounds per histogram name.
+    """
+
+    enabled = True
+
+    def __init__(self, buckets: Optional[Dict[str, Sequence[float]]] = None):
+        self.buckets = dict(buckets or {})
+        self._lock = threading.Lock()
+        self._counters: Dict[Tuple[str, LabelKey], float] = {}
+        self._histograms: Dict[Tuple[str, LabelKey], Histogram] = {}
+
+    def increment(self, name: str, value: float = 1, **labels: str) -> None:
+        key = (name, _label_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        key = (name, _label_key(labels))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram(self._bounds(name))
+            histogram.add(value)
+
+    def counter(self, name: str, **labels: str) -> float:
+        with self._lock:
+            return self._counters.get((name, _label_key(labels)), 0)
+
+    def histogram(self, name: str, **labels: str) -> Optional[Histogram]:
+        with self._lock:
+            return self._histograms.get((name, _label_key(labels)))
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Return every series, keyed like ``name{label="value"}``.
+
+        Returns:
+            dict: ``counters`` with their values and ``histograms`` with their
+                count, sum, min, max, mean, p50 and p99.
+        """
+        with self._lock:
+            return {
+                "counters": {
+                    _series(name, labels): value
+                    for (name, labels), value in sorted(self._counters.items())
+                },
+                "histograms": {
+                    _series(name, labels): {
+                        "count": histogram.count,
+                        "sum": histogram.sum,
+                        "min": histogram.min,
+                        "max": histogram.max,
+                        "mean": histogram.mean,
+                        "p50": histogram.quantile(0.5),
+                        "p99": histogram.quantile(0.99),
+                    }
+                    for (name, labels), histogram in sorted(
+                        self._histograms.items(), key=lambda item: item[0]
+                    )
+                },
+            }
+
+    def to_prometheus(self) -> str:
+        """Render every series in the Prometheus text exposition format."""
+        lines: List[str] = []
+
+        with self._lock:
+            for name, series in _group(self._counters.items()):
+                lines.append(f"# TYPE {name} counter")
+                for labels, value in series:
+                    lines.append(f"{_series(name, labels)} {_format(value)}")
+
+            for name, series in _group(self._histograms.items()):
+                lines.append(f"# TYPE {name} histogram")
+                for labels, histogram in series:
+                    lines.extend(_histogram_lines(name, labels, histogram))
+
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def _bounds(self, name: str) -> Sequence[float]:
+        if name in self.buckets:
+            return self.buckets[name]
+        return BYTES_BUCKETS if name.endswith("_bytes") else SECONDS_BUCKETS
+
+
+class OpenTelemetryMetrics(MetricsRecorder):
+    """
+    Recorder forwarding to an OpenTelemetry meter.
+
+    Instruments are created on first use, a counter per ``increment`` name and
+    a histogram per ``observe`` name, with the labels as attributes.
+
+    Args:
+        meter: An OpenTelemetry ``Meter``, e.g. ``metrics.get_meter("currency_quote")``.
+    """
+
+    enabled = True
+
+    def __init__(self, meter: Any):
+        self.meter = meter
+        self._lock = threading.Lock()
+        self._instruments: Dict[str, Any] = {}
+
+    def increment(self, name: str, value: float = 1, **labels: str) -> None:
+        self._instrument(name, self.meter.create_counter).add(value, attributes=labels)
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        self._instrument(name, self.meter.create_histogram).record(
+            value, attributes=labels
+        )
+
+    def _instrument(self, name: str, create: Callable[..., Any]) -> Any:
+        instrument = self._instruments.get(name)
+        if instrument is None:
+            with self._lock:
+                instrument = self._instruments.get(name)
+                if instrument is None:
+                    unit = "s" if name.endswith("_seconds") else ""
+                    unit = "By" if name.endswith("_bytes") else unit
+                    instrument = self._instruments[name] = create(name, unit=unit)
+        return instrument
+
+
+_recorder: MetricsRecorder = MetricsRecorder()
+
+
+def get_metrics() -> MetricsRecorder:
+    return _recorder
+
+
+def set_metrics(recorder: Optional[MetricsRecorder]) -> MetricsRecorder:
+    """
+    Install the process-wide metrics recorder.
+
+    Args:
+        recorder: The recorder to use, or None to disable instrumentation.
+
+    Returns:
+        MetricsRecorder: The previously installed recorder.
+    """
+    global _recorder  # pylint: disable=global-statement
+    previous = _recorder
+    _recorder = recorder if recorder is not None else MetricsRecorder()
+    return previous
+
+
+def instrument_use_case(use_case: str):
+    """
+    Time every call of a use case, sync or async, and count those that raise.
+
+    Records ``currency_quote_use_case_seconds`` and
+    ``currency_quote_use_case_errors_total``, labelled with ``use_case``. When
+    a call returns a generator, the work happens as it is consumed, so the
+    call is timed until the iteration ends or is closed.
+    """
+
+    def decorator(func):
+        if asyncio.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                metrics = get_metrics()
+                if not metrics.enabled:
+                    return await func(*args, **kwargs)
+                with _UseCaseTimer(metrics, use_case):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            metrics = get_metrics()
+            if not metrics.enabled:
+                return func(*args, **kwargs)
+
+            timer = _UseCaseTimer(metrics, use_case)
+            try:
+                result = func(*args, **kwargs)
+            except BaseException:
+                timer.record(failed=True)
+                raise
+
+            if inspect.isgenerator(result):
+                return timer.iterate(result)
+            timer.record(failed=False)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+class _UseCaseTimer:
+    __slots__ = ("metrics", "use_case", "started")
+
+    def __init__(self, metrics: MetricsRecorder, use_case: str):
+        self.metrics = metrics
+        self.use_case = use_case
+        self.started = time.perf_counter()
+
+    def __enter__(self) -> None:
+        self.started = time.perf_counter()
+
+    def __exit__(self, exc_type, *exc_info) -> None:
+        self.record(failed=exc_type is not None)
+
+    def record(self, failed: bool) -> None:
+        self.metrics.observe(
+            "currency_quote_use_case_seconds",
+            time.perf_counter() - self.started,
+            use_case=self.use_case,
+        )
+        if failed:
+            self.metrics.increment(
+                "currency_quote_use_case_errors_total", use_case=self.use_case
+            )
+
+    def iterate(self, iterator: Iterator) -> Iterator:
+        failed = False
+        try:
+            yield from iterator
+        except GeneratorExit:
+            raise
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            self.record(failed)
+
+
+def _label_key(labels: Dict[str, Any]) -> LabelKey:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+def _series(name: str, labels: LabelKey) -> str:
+    if not labels:
+        return name
+    rendered = ",".join(f'{key}="{_escape(value)}"' for key, value in labels)
+    return f"{name}{{{rendered}}}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _group(items):
+    grouped: Dict[str, list] = {}
+    for (name, labels), value in sorted(items, key=lambda item: item[0]):
+        grouped.setdefault(name, []).append((labels, value))
+    return grouped.items()
+
+
+def _histogram_lines(name: str, labels: LabelKey, histogram: Histogram) -> List[str]:
+    lines = []
+    cumulative = 0
+
+    for bound, bucket_count in zip(
+        histogram.bounds + (math.inf,), histogram.bucket_counts
+    ):
+        cumulative += bucket_count
+        bucket_labels = labels + (("le", _format(bound)),)
+        lines.append(f"{_series(name + '_bucket', bucket_labels)} {cumulative}")
+
+    lines.append(f"{_series(name + '_sum', labels)} {_format(histogram.sum)}")
+    lines.append(f"{_series(name + '_count', labels)} {histogram.count}")
+    return lines
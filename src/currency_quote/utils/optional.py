@@ -0,0 +1,25 @@
+import importlib
+from types import ModuleType
+
+
+def import_optional(module: str, extra: str) -> ModuleType:
+    """
+    Import an optional dependency, pointing to the extra that provides it.
+
+    Args:
+        module: The module to import, e.g. 'numpy'.
+        extra: The currency-quote extra that installs it, e.g. 'columnar'.
+
+    Returns:
+        The imported module.
+
+    Raises:
+        ImportError: If the module is not installed.
+    """
+    try:
+        return importlib.import_module(module)
+    except ImportError as exc:
+        raise ImportError(
+            f"{module} is required for this feature, install it with "
+            f"pip install 'currency-quote[{extra}]'"
+        ) from exc
@@ -0,0 +1,207 @@
+import threading
+import time
+from typing import Callable, Optional
+
+from currency_quote.config.endpoints import API
+from currency_quote.utils.logger import get_logger
+
+logger = get_logger("resilience")
+
+
+class CircuitOpenError(ConnectionError):
+    """Raised without calling upstream while the circuit breaker is open."""
+
+
+class RateLimitedError(ConnectionError):
+    """Raised when the rate limiter would make a call wait longer than allowed."""
+
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker shared by every caller of one upstream.
+
+    After ``failure_threshold`` consecutive failures the circuit opens and calls
+    fail fast with ``CircuitOpenError``. Once ``reset_timeout_seconds`` have
+    passed it turns half-open and lets a single probe call through: a success
+    closes the circuit again, a failure re-opens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = API.CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout_seconds: float = API.CIRCUIT_RESET_TIMEOUT_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_seconds = reset_timeout_seconds
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    @property
+    def failures(self) -> int:
+        return self._failures
+
+    def before_call(self) -> None:
+        """
+        Check that a call may go upstream now.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with a probe
+                call already in flight.
+        """
+        with self._lock:
+            state = self._current_state()
+
+            if state == self.CLOSED:
+                return
+
+            if state == self.HALF_OPEN and not self._probing:
+                self._probing = True
+                return
+
+        raise CircuitOpenError("Upstream circuit is open, failing fast")
+
+    def cancel(self) -> None:
+        """Release a call admitted by ``before_call`` that never reached upstream."""
+        with self._lock:
+            self._probing = False
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._state != self.CLOSED:
+                logger.info("Upstream recovered, closing circuit")
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._probing = False
+
+            if self._state == self.OPEN:
+                return
+
+            if (
+                self._state == self.HALF_OPEN
+                or self._failures >= self.failure_threshold
+            ):
+                logger.warning(
+                    "Opening upstream circuit after %d failures", self._failures
+                )
+                self._state = self.OPEN
+                self._opened_at = self.clock()
+
+    def reset(self) -> None:
+        self.record_success()
+
+    def _current_state(self) -> str:
+        if (
+            self._state == self.OPEN
+            and self.clock() - self._opened_at >= self.reset_timeout_seconds
+        ):
+            self._state = self.HALF_OPEN
+
+        return self._state
+
+
+class AdaptiveTokenBucket:
+    """
+    Token-bucket rate limiter that slows down when upstream answers 429.
+
+    Tokens refill at ``rate`` per second up to ``burst``. Every throttling signal
+    halves the rate (down to ``min_rate``) and can pause all callers until the
+    upstream's ``Retry-After``; every success then raises it back step by step
+    towards ``max_rate``.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        max_rate: float = API.RATE_LIMIT_PER_SECOND,
+        burst: int = API.RATE_LIMIT_BURST,
+        min_rate: float = API.RATE_LIMIT_MIN_PER_SECOND,
+        max_wait_seconds: float = API.RATE_LIMIT_MAX_WAIT_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_rate = max_rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_wait_seconds = max_wait_seconds
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._rate = max_rate
+        self._tokens = float(burst)
+        self._updated_at = clock()
+        self._paused_until = 0.0
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    def reserve(self) -> float:
+        """
+        Take one token and return how long the caller must wait before using it.
+
+        Returns:
+            float: Seconds to wait, zero when a token is available right away.
+
+        Raises:
+            RateLimitedError: If the wait would exceed ``max_wait_seconds``.
+        """
+        with self._lock:
+            now = self._refill()
+            wait = max(-(self._tokens - 1) / self._rate, self._paused_until - now, 0.0)
+
+            if wait > self.max_wait_seconds:
+                raise RateLimitedError(
+                    f"Upstream rate limit would delay the call by {wait:.1f}s"
+                )
+
+            self._tokens -= 1
+            return wait
+
+    def acquire(self) -> None:
+        """Block until a token is available."""
+        wait = self.reserve()
+        if wait:
+            time.sleep(wait)
+
+    def throttle(self, retry_after: Optional[float] = None) -> None:
+        """Record a 429: halve the rate and honour the upstream's Retry-After."""
+        with self._lock:
+            now = self._refill()
+            self._rate = max(self.min_rate, self._rate / 2)
+            self._tokens = min(self._tokens, 0.0)
+            if retry_after:
+                self._paused_until = max(self._paused_until, now + retry_after)
+
+        logger.warning("Upstream is throttling, lowering rate to %.2f/s", self._rate)
+
+    def relax(self) -> None:
+        """Record a success: raise the rate by a step towards ``max_rate``."""
+        if self._rate >= self.max_rate:
+            return
+
+        with self._lock:
+            self._refill()
+            self._rate = min(self.max_rate, self._rate + self.max_rate / 20)
+
+    def _refill(self) -> float:
+        now = self.clock()
+        elapsed = max(now - self._updated_at, 0.0)
+        self._tokens = min(float(self.burst), self._tokens + elapsed * self._rate)
+        self._updated_at = now
+        return now
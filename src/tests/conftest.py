@@ -1,5 +1,11 @@
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 import pytest
 from unittest.mock import Mock, patch
+from currency_quote.adapters.outbound.last_quote_cache import LAST_QUOTE_CACHE
+
 
 @pytest.fixture
 def mock_currency_api_response():
@@ -16,7 +22,7 @@ def mock_currency_api_response():
             "bid": "5.0876",
             "ask": "5.0891",
             "timestamp": "1614024000",
-            "create_date": "2023-01-01 13:00:00"
+            "create_date": "2023-01-01 13:00:00",
         },
         "EURBRL": {
             "code": "EUR",
@@ -29,10 +35,11 @@ def mock_currency_api_response():
             "bid": "6.0876",
             "ask": "6.0891",
             "timestamp": "1614024000",
-            "create_date": "2023-01-01 13:00:00"
-        }
+            "create_date": "2023-01-01 13:00:00",
+        },
     }
 
+
 @pytest.fixture
 def mock_currency_history_api_response():
     """Mock response for currency history API."""
@@ -48,11 +55,55 @@ def mock_currency_history_api_response():
             "bid": "5.0876",
             "ask": "5.0891",
             "timestamp": "1614024000",
-            "create_date": "2022-06-21 13:00:00"
+            "create_date": "2022-06-21 13:00:00",
         }
     ]
 
+
 @pytest.fixture
 def mock_validator_api_response():
     """Mock response for currency validator API."""
-    return ["USD-BRL", "EUR-BRL", "USD-BRLT"]
\ No newline at end of file
+    return ["USD-BRL", "EUR-BRL", "USD-BRLT"]
+
+
+@pytest.fixture(autouse=True)
+def clear_last_quote_cache():
+    """Keep the shared last-quote cache from leaking quotes between tests."""
+    LAST_QUOTE_CACHE.clear()
+    yield
+    LAST_QUOTE_CACHE.clear()
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        server = self.server
+        server.requests.append((self.path, self.client_address))
+        status = server.statuses.pop(0) if server.statuses else 200
+        body = json.dumps({"path": self.path}).encode("utf-8")
+        compressed = "gzip" in self.headers.get("Accept-Encoding", "")
+        if compressed:
+            body = gzip.compress(body)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        if compressed:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.requests = []
+    server.statuses = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,136 @@
+import asyncio
+import pytest
+from currency_quote import AsyncClientBuilder
+from currency_quote.adapters.outbound.async_currency_api import AsyncCurrencyAPI
+from currency_quote.adapters.outbound.parities_cache import PARITIES_CACHE
+from currency_quote.config.endpoints import API
+from currency_quote.domain.entities.currency import CurrencyObject
+from currency_quote.utils.resilience import CircuitOpenError
+
+
+class FakeAsyncHttpClient:
+    """Serves canned payloads by URL and records every request."""
+
+    def __init__(self, last_response, history_response, parities):
+        self.last_response = last_response
+        self.history_response = history_response
+        self.parities = parities
+        self.requested = []
+
+    async def get_json(self, url):
+        self.requested.append(url)
+        await asyncio.sleep(0)
+        if url == API.ENDPOINT_AVALIABLE_PARITIES:
+            return self.parities
+        if url.startswith(API.ENDPOINT_LAST_COTATION):
+            return self.last_response
+        return self.history_response
+
+
+@pytest.fixture
+def http_client(
+    mock_currency_api_response,
+    mock_currency_history_api_response,
+    mock_validator_api_response,
+):
+    PARITIES_CACHE.clear()
+    yield FakeAsyncHttpClient(
+        mock_currency_api_response,
+        mock_currency_history_api_response,
+        mock_validator_api_response,
+    )
+    PARITIES_CACHE.clear()
+
+
+def test_async_get_last_quote(http_client):
+    """Test fetching last quotes through the async client."""
+    client = AsyncClientBuilder(
+        ["USD-BRL", "EUR-BRL", "AAA-BBB"], http_client=http_client
+    )
+
+    result = asyncio.run(client.get_last_quote())
+
+    assert [item["currency_pair"] for item in result] == ["USD-BRL", "EUR-BRL"]
+    assert result[0]["bid_price"] == 5.0876
+    assert result.errors == {}
+
+
+def test_async_get_history_quote(http_client):
+    """Test fetching a history quote through the async client."""
+    client = AsyncClientBuilder("USD-BRL", http_client=http_client)
+
+    result = asyncio.run(client.get_history_quote(reference_date=20220621))
+
+    assert len(result) == 1
+    assert result[0]["bid_price"] == 5.0876
+    assert (
+        f"{API.ENDPOINT_HISTORY_COTATION}USD-BRL?start_date=20220621&end_date=20220621"
+        in http_client.requested
+    )
+
+
+def test_async_invalid_reference_date(http_client):
+    """Test that an invalid reference date returns no quotes and no history request."""
+    client = AsyncClientBuilder("USD-BRL", http_client=http_client)
+
+    assert asyncio.run(client.get_history_quote(reference_date=220621)) == []
+    assert not any("/json/daily/" in url for url in http_client.requested)
+
+
+def test_async_all_invalid_currencies(http_client):
+    """Test that validation errors are raised by the async client."""
+    client = AsyncClientBuilder(["AAA-BBB"], http_client=http_client)
+
+    with pytest.raises(ValueError, match="All params: .* are invalid."):
+        asyncio.run(client.get_last_quote())
+
+
+def test_concurrent_requests_share_one_parities_load(http_client):
+    """Test that many concurrent quotes on one loop load the parities list once."""
+
+    async def run():
+        clients = [
+            AsyncClientBuilder("USD-BRL", http_client=http_client) for _ in range(50)
+        ]
+        return await asyncio.gather(*(client.get_last_quote() for client in clients))
+
+    results = asyncio.run(run())
+
+    assert len(results) == 50
+    assert http_client.requested.count(API.ENDPOINT_AVALIABLE_PARITIES) == 1
+
+
+def test_async_last_quote_retries_only_transient_failures(mock_currency_api_response):
+    """Test that a missing pair is retried while an open circuit is not."""
+
+    class FlakyHttpClient:
+        retry_time_seconds = 0
+
+        def __init__(self, failure):
+            self.failure = failure
+            self.requested = []
+
+        async def get_json(self, url):
+            self.requested.append(url)
+            if isinstance(self.failure, Exception):
+                raise self.failure
+            payload = dict(mock_currency_api_response)
+            if len(self.requested) == 1:
+                payload.pop(self.failure)
+            return payload
+
+    missing = FlakyHttpClient("EURBRL")
+    open_circuit = FlakyHttpClient(CircuitOpenError("Upstream circuit is open"))
+    currency_obj = CurrencyObject(["USD-BRL", "EUR-BRL"])
+
+    result = asyncio.run(
+        AsyncCurrencyAPI(currency_obj, http_client=missing).get_last_quote()
+    )
+    with pytest.raises(CircuitOpenError):
+        asyncio.run(
+            AsyncCurrencyAPI(currency_obj, http_client=open_circuit).get_last_quote()
+        )
+
+    assert [quote.currency_pair for quote in result] == ["USD-BRL", "EUR-BRL"]
+    assert result.ok and len(missing.requested) == 2
+    assert len(open_circuit.requested) == 1
@@ -0,0 +1,33 @@
+import pytest
+from currency_quote.utils.batching import plan_batches
+
+
+def test_plan_batches_respects_item_limit():
+    """Test that batches never hold more than max_items, in input order."""
+    items = ["USD-BRL", "EUR-BRL", "GBP-BRL", "JPY-BRL", "ARS-BRL"]
+
+    assert plan_batches(items, prefix_length=10, max_length=1000, max_items=2) == [
+        ["USD-BRL", "EUR-BRL"],
+        ["GBP-BRL", "JPY-BRL"],
+        ["ARS-BRL"],
+    ]
+
+
+def test_plan_batches_respects_url_length():
+    """Test that prefix plus joined items stays within max_length."""
+    items = ["USD-BRL", "EUR-BRL", "GBP-BRL"]
+    batches = plan_batches(items, prefix_length=10, max_length=25, max_items=100)
+
+    assert batches == [["USD-BRL", "EUR-BRL"], ["GBP-BRL"]]
+    assert all(10 + len(",".join(batch)) <= 25 for batch in batches)
+
+
+def test_plan_batches_empty():
+    """Test that no items produce no batches."""
+    assert plan_batches([], prefix_length=10, max_length=25, max_items=2) == []
+
+
+def test_plan_batches_rejects_oversized_item():
+    """Test that an item longer than the whole budget is reported."""
+    with pytest.raises(ValueError, match="does not fit"):
+        plan_batches(["USD-BRL"], prefix_length=20, max_length=25, max_items=2)
@@ -0,0 +1,50 @@
+import pytest
+from currency_quote.domain.entities.currency import CurrencyQuote
+from currency_quote.utils.clock import FixedClock, MonotonicClock, set_clock
+
+
+@pytest.fixture
+def fixed_clock():
+    clock = FixedClock(now=1700000000)
+    previous = set_clock(clock)
+    yield clock
+    set_clock(previous)
+
+
+def test_default_extraction_time_follows_clock(fixed_clock):
+    """Test that quote_extracted_at is read at construction, not at import."""
+    quote = ("USD-BRL", "Dólar", "USD", "BRL", 1614024000, 5.0876, 5.0891)
+    first = CurrencyQuote(*quote)
+    fixed_clock.advance(60)
+    second = CurrencyQuote(*quote)
+
+    assert first.quote_extracted_at == 1700000000
+    assert second.quote_extracted_at == 1700000060
+
+
+def test_batch_shares_one_extraction_time(fixed_clock, mock_currency_api_response):
+    """Test that a parsed payload is stamped once for the whole batch."""
+    quotes = CurrencyQuote.from_api_payload(mock_currency_api_response)
+
+    assert {quote.quote_extracted_at for quote in quotes} == {1700000000}
+
+
+def test_explicit_extraction_time(mock_currency_history_api_response):
+    """Test that a replay can pass its own extraction time."""
+    quotes = CurrencyQuote.from_api_payload(
+        mock_currency_history_api_response, currency_pair="USD-BRL", extracted_at=42
+    )
+
+    assert quotes[0].quote_extracted_at == 42
+
+
+def test_monotonic_clock_tracks_wall_time():
+    """Test that the monotonic clock starts at wall time and never goes back."""
+    import time
+
+    clock = MonotonicClock()
+    first = clock.time()
+    second = clock.time()
+
+    assert abs(first - time.time()) < 1
+    assert second >= first
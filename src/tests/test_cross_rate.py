@@ -0,0 +1,149 @@
+from unittest.mock import MagicMock, patch
+import pytest
+from currency_quote import ClientBuilder
+from currency_quote.domain.entities.cross_rate import RateLeg
+from currency_quote.domain.entities.currency import CurrencyQuote
+from currency_quote.domain.entities.parity_index import ParityIndex
+from currency_quote.domain.entities.quote_result import QuoteResult
+from currency_quote.domain.services.cross_rate_engine import CrossRateEngine
+
+PARITIES = ["USD-BRL", "EUR-BRL", "JPY-BRL", "EUR-USD", "BRL-ARS"]
+PRICES = {
+    "USD-BRL": (5.0, 5.1),
+    "EUR-BRL": (6.0, 6.2),
+    "JPY-BRL": (0.04, 0.041),
+    "EUR-USD": (1.1, 1.11),
+    "BRL-ARS": (200.0, 201.0),
+}
+
+
+def quotes_for(pairs):
+    return [
+        CurrencyQuote(pair, pair, pair[:3], pair[4:], 1000 + index, *PRICES[pair], 2000)
+        for index, pair in enumerate(pairs)
+    ]
+
+
+@pytest.fixture
+def engine():
+    return CrossRateEngine(ParityIndex.from_parities(PARITIES, version="v1"))
+
+
+def test_path_prefers_direct_then_inverse_then_fewest_hops(engine):
+    """Test shortest-path selection over the parity graph."""
+    assert engine.path("EUR-USD") == (RateLeg("EUR-USD"),)
+    assert engine.path("BRL-USD") == (RateLeg("USD-BRL", inverted=True),)
+    assert engine.path("EUR-JPY") == (
+        RateLeg("EUR-BRL"),
+        RateLeg("JPY-BRL", inverted=True),
+    )
+    assert len(engine.path("JPY-ARS")) == 2
+
+
+def test_path_rejects_unconnected_pairs(engine):
+    """Test that unknown currencies have no conversion path."""
+    with pytest.raises(ValueError, match="No conversion path"):
+        engine.path("EUR-XYZ")
+    with pytest.raises(ValueError, match="Invalid currency pair"):
+        engine.path("EUR-EUR")
+
+
+def test_derive_triangulates_bid_and_ask(engine):
+    """Test cross bid/ask and provenance of a derived pair."""
+    pairs = engine.required_pairs(["EUR-JPY", "BRL-USD"])
+    assert pairs == ["EUR-BRL", "JPY-BRL", "USD-BRL"]
+
+    eur_jpy, brl_usd = engine.derive(["EUR-JPY", "BRL-USD"], quotes_for(pairs))
+
+    assert eur_jpy.bid_price == pytest.approx(6.0 / 0.041)
+    assert eur_jpy.ask_price == pytest.approx(6.2 / 0.04)
+    assert eur_jpy.quote_timestamp == 1000
+    assert not eur_jpy.is_direct
+    assert brl_usd.bid_price == pytest.approx(1 / 5.1)
+    assert brl_usd.ask_price == pytest.approx(1 / 5.0)
+
+
+def test_rate_matrix_matches_triangulation(engine):
+    """Test the N×N matrix built from legs against the pivot."""
+    pytest.importorskip("numpy")
+    currencies = ["USD", "EUR", "JPY", "BRL"]
+    pivot = engine.choose_pivot(currencies)
+    legs = engine.pivot_legs(currencies, pivot)
+
+    matrix = engine.rate_matrix(
+        currencies, quotes_for([leg.currency_pair for leg in legs.values()]), pivot
+    )
+
+    assert pivot == "BRL"
+    assert matrix.bid.shape == (4, 4)
+    assert matrix.rate("USD-USD") == (1.0, 1.0)
+    derived = engine.derive(["EUR-JPY"], quotes_for(["EUR-BRL", "JPY-BRL"]))[0]
+    assert matrix.rate("EUR-JPY") == pytest.approx(
+        (derived.bid_price, derived.ask_price)
+    )
+    assert matrix.rate("BRL-USD") == pytest.approx((1 / 5.1, 1 / 5.0))
+
+
+def test_client_fetches_only_legs_in_one_request():
+    """Test that ClientBuilder prices cross pairs from a single leg fetch."""
+    pytest.importorskip("numpy")
+    repository = MagicMock(
+        side_effect=lambda currency_obj: MagicMock(
+            get_last_quote=MagicMock(
+                return_value=quotes_for(currency_obj.get_currency_list())
+            )
+        )
+    )
+    index = ParityIndex.from_parities(PARITIES, version="v2")
+
+    with patch(
+        "currency_quote.application.use_cases.get_cross_currency_quote.PARITIES_CACHE"
+    ) as cache, patch(
+        "currency_quote.application.use_cases.get_cross_currency_quote.CurrencyAPI",
+        repository,
+    ):
+        cache.get_index.return_value = index
+        result = ClientBuilder(["EUR-JPY", "USD-BRL"]).get_cross_quote()
+        matrix = ClientBuilder(["EUR-JPY", "USD-BRL"]).get_rate_matrix(pivot="BRL")
+
+    assert [item["currency_pair"] for item in result] == ["EUR-JPY", "USD-BRL"]
+    assert result[0]["legs"] == [
+        {"currency_pair": "EUR-BRL", "inverted": False},
+        {"currency_pair": "JPY-BRL", "inverted": True},
+    ]
+    assert repository.call_count == 2
+    assert matrix.currencies == ["EUR", "JPY", "USD", "BRL"]
+
+
+def test_derive_reports_pairs_whose_legs_failed(engine):
+    """Test that a failed leg only drops the pairs crossing it, with the leg's error."""
+    pairs = engine.required_pairs(["EUR-JPY", "BRL-USD"])
+    error = ConnectionError("upstream down")
+    quotes = QuoteResult(quotes_for(["EUR-BRL", "USD-BRL"]), {"JPY-BRL": error})
+
+    result = engine.derive(["EUR-JPY", "BRL-USD"], quotes)
+    partial = engine.derive(["EUR-JPY"], quotes_for(["EUR-BRL"]))
+
+    assert pairs == ["EUR-BRL", "JPY-BRL", "USD-BRL"]
+    assert [quote.currency_pair for quote in result] == ["BRL-USD"]
+    assert result.errors == {"EUR-JPY": error}
+    assert not partial and "JPY-BRL" in str(partial.errors["EUR-JPY"])
+    with pytest.raises(ValueError, match="Missing quote for JPY-BRL"):
+        partial.raise_if_empty()
+
+
+def test_rate_matrix_marks_currencies_whose_leg_failed(engine):
+    """Test that a failed pivot leg yields NaN rates and is reported, not a KeyError."""
+    np = pytest.importorskip("numpy")
+    error = ConnectionError("upstream down")
+    quotes = QuoteResult(quotes_for(["USD-BRL", "EUR-BRL"]), {"JPY-BRL": error})
+
+    matrix = engine.rate_matrix(["USD", "EUR", "JPY", "BRL"], quotes, "BRL")
+
+    assert matrix.errors == {"JPY-BRL": error}
+    assert (
+        np.isnan(matrix.rate("EUR-JPY")).all()
+        and np.isnan(matrix.rate("JPY-USD")).all()
+    )
+    assert matrix.rate("JPY-JPY") == (1.0, 1.0)
+    assert matrix.rate("EUR-USD") == pytest.approx((6.0 / 5.1, 6.2 / 5.0))
@@ -1,3 +1,4 @@
+import sys
 import pytest
 from currency_quote.domain.entities.currency import CurrencyObject, CurrencyQuote
 from datetime import datetime
@@ -66,6 +67,58 @@ def test_currency_object_with_mixed_valid_invalid():
         CurrencyObject(currency_list=["USD-BRL", "INVALID"])
 
 
+def test_currency_object_normalizes_and_deduplicates():
+    """Test that case and blanks are normalized and only first occurrences are kept."""
+    client = CurrencyObject(["usd-brl", "EUR-BRL", "USD-BRL ", " eur - brl", "JPY-USD"])
+
+    assert client.get_currency_list() == ["USD-BRL", "EUR-BRL", "JPY-USD"]
+    assert client.codes == [("USD", "BRL"), ("EUR", "BRL"), ("JPY", "USD")]
+
+
+def test_currency_object_interns_pairs():
+    """Test that equal pairs from different lists share one string."""
+    first = CurrencyObject(["usd-brl"]).get_currency_list()[0]
+    second = CurrencyObject(["EUR-BRL", "USD-" + "BRL"]).get_currency_list()[1]
+
+    assert first is second
+
+
+def test_currency_object_rejects_non_string_pairs():
+    """Test that entries that are not strings are reported as badly formatted."""
+    with pytest.raises(ValueError, match="Currency pair must be in the format"):
+        CurrencyObject(["USD-BRL", 1])
+    with pytest.raises(ValueError, match="Currency pair must be in the format"):
+        CurrencyObject(["USD-BRL", "US D-BRL"])
+
+
+def test_currency_object_from_file(tmp_path):
+    """Test loading a watchlist with comments, commas and duplicates."""
+    watchlist = tmp_path / "pairs.txt"
+    watchlist.write_text(
+        "# majors\nusd-brl, EUR-BRL; GBP-BRL\n\nUSD-BRL  # again\nJPY-BRL\n",
+        encoding="utf-8",
+    )
+
+    client = CurrencyObject.from_file(str(watchlist))
+
+    assert client.get_currency_list() == ["USD-BRL", "EUR-BRL", "GBP-BRL", "JPY-BRL"]
+
+
+def test_currency_object_with_large_list():
+    """Test that a large list with repeated pairs keeps each pair once, in order."""
+    codes = [
+        f"{first}{second}{third}"
+        for first in "ABCDEFGHIJ"
+        for second in "ABCDEFGHIJ"
+        for third in "ABCDEFGHIJ"
+    ]
+    currency_list = [f"{code}-BRL" for code in codes] * 10
+
+    client = CurrencyObject(currency_list)
+
+    assert client.get_currency_list() == currency_list[:1000]
+
+
 def test_currency_quote_creation():
     """Test creation of CurrencyQuote object with valid data."""
     quote = CurrencyQuote(
@@ -75,9 +128,9 @@ def test_currency_quote_creation():
         quote_currency_code="BRL",
         quote_timestamp=1614024000,
         bid_price=5.0876,
-        ask_price=5.0891
+        ask_price=5.0891,
     )
-    
+
     # Verify all attributes are set correctly
     assert quote.currency_pair == "USD-BRL"
     assert quote.currency_pair_name == "Dólar Americano/Real Brasileiro"
@@ -87,3 +140,65 @@ def test_currency_quote_creation():
     assert quote.bid_price == 5.0876
     assert quote.ask_price == 5.0891
     assert quote.quote_extracted_at <= int(datetime.now().timestamp())
+
+
+def test_currency_quote_is_immutable():
+    """Test that CurrencyQuote instances cannot be modified."""
+    from dataclasses import FrozenInstanceError
+
+    quote = CurrencyQuote(
+        currency_pair="USD-BRL",
+        currency_pair_name="Dólar Americano/Real Brasileiro",
+        base_currency_code="USD",
+        quote_currency_code="BRL",
+        quote_timestamp=1614024000,
+        bid_price=5.0876,
+        ask_price=5.0891,
+    )
+
+    with pytest.raises(FrozenInstanceError):
+        quote.bid_price = 1.0
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="slotted dataclasses need 3.10+")
+def test_currency_quote_is_slotted():
+    """Test that CurrencyQuote has no per-instance __dict__."""
+    quote = CurrencyQuote("USD-BRL", "Dólar", "USD", "BRL", 1614024000, 5.0876, 5.0891)
+    assert not hasattr(quote, "__dict__")
+
+
+def test_currency_quote_from_last_payload(mock_currency_api_response):
+    """Test bulk parsing of a /last/ payload in the requested order."""
+    quotes = CurrencyQuote.from_api_payload(
+        mock_currency_api_response, currency_pairs=["EUR-BRL", "USD-BRL"]
+    )
+
+    assert [quote.currency_pair for quote in quotes] == ["EUR-BRL", "USD-BRL"]
+    assert quotes[1].bid_price == 5.0876
+    assert quotes[1].quote_timestamp == 1614024000
+
+
+def test_currency_quote_from_last_payload_without_pairs(mock_currency_api_response):
+    """Test that every entry is parsed when no pairs are given."""
+    quotes = CurrencyQuote.from_api_payload(mock_currency_api_response)
+
+    assert {quote.currency_pair for quote in quotes} == {"USD-BRL", "EUR-BRL"}
+
+
+def test_currency_quote_from_history_payload(mock_currency_history_api_response):
+    """Test bulk parsing of a /json/daily/ payload."""
+    quotes = CurrencyQuote.from_api_payload(
+        mock_currency_history_api_response, currency_pair="USD-BRL"
+    )
+
+    assert len(quotes) == 1
+    assert quotes[0].ask_price == 5.0891
+    assert isinstance(quotes[0].ask_price, float)
+
+
+def test_currency_quote_from_payload_missing_pair(mock_currency_api_response):
+    """Test that a requested pair missing from the payload raises KeyError."""
+    with pytest.raises(KeyError):
+        CurrencyQuote.from_api_payload(
+            mock_currency_api_response, currency_pairs=["JPY-BRL"]
+        )
@@ -0,0 +1,399 @@
+import threading
+from itertools import product
+from string import ascii_uppercase
+import time
+import pytest
+from currency_quote.adapters.outbound.currency_api import CurrencyAPI
+from currency_quote.adapters.outbound.last_quote_cache import LastQuoteCache
+from currency_quote.config.endpoints import API
+from currency_quote.domain.entities.currency import CurrencyObject, CurrencyQuote
+from currency_quote.utils.resilience import CircuitOpenError
+
+
+def history_row(code, codein, bid):
+    return [
+        {
+            "code": code,
+            "codein": codein,
+            "name": f"{code}/{codein}",
+            "bid": str(bid),
+            "ask": str(bid + 0.001),
+            "timestamp": "1614024000",
+        }
+    ]
+
+
+class FakeHistoryTransport:
+    """Stand-in transport that answers /json/daily/ by pair."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+        self.delays = {}
+        self.failures = set()
+
+    def get_json(self, url):
+        pair = url.split("/json/daily/")[1].split("?")[0]
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delays.get(pair, 0.01))
+            if pair in self.failures:
+                raise ConnectionError(f"{pair} timed out")
+            code, codein = pair.split("-")
+            return history_row(code, codein, 1.0)
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def transport():
+    return FakeHistoryTransport()
+
+
+def test_history_quote_preserves_order(transport):
+    """Test that concurrent fetching returns quotes in the requested order."""
+    pairs = ["USD-BRL", "EUR-BRL", "JPY-BRL", "GBP-BRL"]
+    transport.delays = {"USD-BRL": 0.05, "EUR-BRL": 0.0}
+
+    repository = CurrencyAPI(CurrencyObject(pairs), max_workers=4, transport=transport)
+
+    result = repository.get_history_quote(20220621)
+
+    assert [quote.currency_pair for quote in result] == pairs
+
+
+def test_history_quote_bounds_in_flight_requests(transport):
+    """Test that no more than max_workers requests run at the same time."""
+    pairs = [f"US{chr(65 + i)}-BRL" for i in range(10)]
+
+    repository = CurrencyAPI(CurrencyObject(pairs), max_workers=3, transport=transport)
+
+    repository.get_history_quote(20220621)
+
+    assert 1 < transport.max_in_flight <= 3
+
+
+def test_history_quote_reports_partial_failures(transport, caplog):
+    """Test that one failing pair is logged and does not discard the others."""
+    transport.failures = {"EUR-BRL"}
+
+    result = CurrencyAPI(
+        CurrencyObject(["USD-BRL", "EUR-BRL", "JPY-BRL"]), transport=transport
+    ).get_history_quote(20220621)
+
+    assert [quote.currency_pair for quote in result] == ["USD-BRL", "JPY-BRL"]
+    assert "EUR-BRL" in caplog.text
+
+
+def test_history_quote_raises_when_every_pair_fails(transport):
+    """Test that the error is propagated when no pair could be fetched."""
+    transport.failures = {"USD-BRL"}
+
+    with pytest.raises(ConnectionError, match="USD-BRL timed out"):
+        CurrencyAPI(CurrencyObject(["USD-BRL"]), transport=transport).get_history_quote(
+            20220621
+        )
+
+
+class FakeRangeTransport:
+    """Answers ranged /json/daily/ requests with one row per day, newest first."""
+
+    def __init__(self):
+        self.requested = []
+
+    def get_json(self, url):
+        self.requested.append(url)
+        query = dict(part.split("=") for part in url.split("?")[1].split("&"))
+        start, end = int(query["start_date"]), int(query["end_date"])
+        days = [day for day in range(start, end + 1) if 1 <= day % 100 <= 31]
+        return [
+            {
+                "code": "USD",
+                "codein": "BRL",
+                "name": "Dólar Americano/Real Brasileiro",
+                "bid": str(day % 100),
+                "ask": str(day % 100),
+                "timestamp": str(day),
+            }
+            for day in reversed(days)
+        ]
+
+    def close(self):
+        pass
+
+
+def test_history_range_pages_and_orders_quotes(monkeypatch):
+    """Test that a range is split into pages and yielded oldest first."""
+    monkeypatch.setattr(
+        "currency_quote.config.endpoints.API.HISTORY_MAX_DAYS_PER_REQUEST", 10
+    )
+    transport = FakeRangeTransport()
+    repository = CurrencyAPI(CurrencyObject(["USD-BRL"]), transport=transport)
+
+    quotes = list(repository.get_history_range(20220101, 20220125))
+
+    assert [quote.quote_timestamp for quote in quotes] == list(
+        range(20220101, 20220126)
+    )
+    assert len(transport.requested) == 3
+    assert transport.requested[0].endswith(
+        "/USD-BRL/10?start_date=20220101&end_date=20220110"
+    )
+    assert transport.requested[2].endswith(
+        "/USD-BRL/5?start_date=20220121&end_date=20220125"
+    )
+
+
+def test_history_range_is_lazy():
+    """Test that pages are only requested as the generator is consumed."""
+    transport = FakeRangeTransport()
+    repository = CurrencyAPI(
+        CurrencyObject(["USD-BRL", "EUR-BRL"]), transport=transport
+    )
+
+    quotes = repository.get_history_range(20220101, 20220103)
+    assert transport.requested == []
+
+    next(quotes)
+    assert len(transport.requested) == 1
+
+
+def test_history_range_rejects_invalid_ranges():
+    """Test that reversed or future ranges yield nothing and request nothing."""
+    transport = FakeRangeTransport()
+    repository = CurrencyAPI(CurrencyObject(["USD-BRL"]), transport=transport)
+
+    assert list(repository.get_history_range(20220110, 20220101)) == []
+    assert list(repository.get_history_range(20220101, 20301231)) == []
+    assert transport.requested == []
+
+
+class FakeLastTransport:
+    """Stand-in transport that answers /last/ for whichever pairs are requested."""
+
+    retry_time_seconds = 0
+
+    def __init__(self):
+        self.requested = []
+
+    def get_json(self, url):
+        pairs = url.split("/last/")[1].split(",")
+        self.requested.append(pairs)
+        return {
+            pair.replace("-", ""): history_row(*pair.split("-"), 1.0)[0]
+            for pair in pairs
+        }
+
+    def close(self):
+        pass
+
+
+class FakeMonotonic:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_last_quote_fetches_only_missing_pairs():
+    """Test that cached pairs are served locally and the rest in one request."""
+    transport = FakeLastTransport()
+    cache = LastQuoteCache(ttl_seconds=5, clock=FakeMonotonic())
+
+    CurrencyAPI(
+        CurrencyObject(["USD-BRL", "EUR-BRL"]), transport=transport, quote_cache=cache
+    ).get_last_quote()
+    result = CurrencyAPI(
+        CurrencyObject(["JPY-BRL", "EUR-BRL", "GBP-BRL", "USD-BRL"]),
+        transport=transport,
+        quote_cache=cache,
+    ).get_last_quote()
+
+    assert transport.requested == [["EUR-BRL", "USD-BRL"], ["GBP-BRL", "JPY-BRL"]]
+    assert [quote.currency_pair for quote in result] == [
+        "JPY-BRL",
+        "EUR-BRL",
+        "GBP-BRL",
+        "USD-BRL",
+    ]
+
+
+def test_last_quote_refetches_stale_pairs():
+    """Test that entries older than the TTL are fetched again."""
+    transport = FakeLastTransport()
+    clock = FakeMonotonic()
+    cache = LastQuoteCache(ttl_seconds=5, clock=clock)
+    repository = CurrencyAPI(
+        CurrencyObject(["USD-BRL"]), transport=transport, quote_cache=cache
+    )
+
+    first = repository.get_last_quote()
+    clock.now += 4
+    assert repository.get_last_quote() == first
+    clock.now += 1
+    repository.get_last_quote()
+
+    assert transport.requested == [["USD-BRL"], ["USD-BRL"]]
+
+
+def test_last_quote_cache_evicts_entries_past_stale_age():
+    """Test that stale quotes are served up to a max age and then dropped."""
+    clock = FakeMonotonic()
+    cache = LastQuoteCache(ttl_seconds=5, stale_seconds=60, clock=clock)
+    usd = CurrencyQuote("USD-BRL", "Dólar", "USD", "BRL", 1, 5.0, 5.1, 1)
+    eur = CurrencyQuote("EUR-BRL", "Euro", "EUR", "BRL", 1, 6.0, 6.1, 1)
+
+    cache.store([usd])
+    clock.now += 30
+    assert cache.stale(["USD-BRL"]) == {"USD-BRL": usd}
+
+    clock.now += 35
+    assert cache.stale(["USD-BRL"]) == {}
+    cache.store([eur])
+    assert len(cache) == 1
+
+
+def test_last_quote_cache_disabled_with_zero_ttl():
+    """Test that a zero TTL sends every call upstream."""
+    transport = FakeLastTransport()
+    repository = CurrencyAPI(
+        CurrencyObject(["USD-BRL"]),
+        transport=transport,
+        quote_cache=LastQuoteCache(ttl_seconds=0),
+    )
+
+    repository.get_last_quote()
+    repository.get_last_quote()
+
+    assert len(transport.requested) == 2
+
+
+def test_last_quote_splits_large_watchlists(monkeypatch):
+    """Test that a long pair list is fetched in capped chunks and merged in order."""
+    monkeypatch.setattr(API, "LAST_MAX_PAIRS_PER_REQUEST", 100)
+    codes = ["".join(letters) for letters in product(ascii_uppercase, repeat=3)][:250]
+    pairs = [f"{code}-BRL" for code in codes][::-1]
+    transport = FakeLastTransport()
+
+    result = CurrencyAPI(
+        CurrencyObject(pairs),
+        transport=transport,
+        quote_cache=LastQuoteCache(ttl_seconds=0),
+    ).get_last_quote()
+
+    assert sorted(len(batch) for batch in transport.requested) == [50, 100, 100]
+    assert [quote.currency_pair for quote in result] == pairs
+
+
+class FlakyLastTransport(FakeLastTransport):
+    """Omits some pairs from the payload, for a number of calls or for good."""
+
+    def __init__(self, dropped, drop_calls=None):
+        super().__init__()
+        self.dropped = set(dropped)
+        self.drop_calls = drop_calls
+
+    def get_json(self, url):
+        payload = super().get_json(url)
+        if self.drop_calls is None or len(self.requested) <= self.drop_calls:
+            for pair in self.dropped:
+                payload.pop(pair.replace("-", ""), None)
+        return payload
+
+
+def test_last_quote_keeps_batch_when_a_pair_is_missing():
+    """Test that a missing pair is reported without discarding the others."""
+    transport = FlakyLastTransport(["EUR-BRL"])
+
+    result = CurrencyAPI(
+        CurrencyObject(["USD-BRL", "EUR-BRL", "GBP-BRL"]),
+        transport=transport,
+        quote_cache=LastQuoteCache(ttl_seconds=0),
+    ).get_last_quote()
+
+    assert [quote.currency_pair for quote in result] == ["USD-BRL", "GBP-BRL"]
+    assert result.failed_pairs == ["EUR-BRL"]
+    assert "EUR-BRL" in str(result.errors["EUR-BRL"])
+    assert transport.requested == [["EUR-BRL", "GBP-BRL", "USD-BRL"], ["EUR-BRL"]]
+
+
+def test_last_quote_retries_only_failed_pairs():
+    """Test that a transiently missing pair is recovered by a targeted retry."""
+    transport = FlakyLastTransport(["EUR-BRL"], drop_calls=1)
+
+    result = CurrencyAPI(
+        CurrencyObject(["USD-BRL", "EUR-BRL"]),
+        transport=transport,
+        quote_cache=LastQuoteCache(ttl_seconds=0),
+    ).get_last_quote()
+
+    assert result.ok
+    assert [quote.currency_pair for quote in result] == ["USD-BRL", "EUR-BRL"]
+    assert transport.requested[1] == ["EUR-BRL"]
+
+
+def test_last_quote_does_not_retry_permanent_failures():
+    """Test that a malformed quote or an open circuit is reported without a retry."""
+
+    class MalformedTransport(FakeLastTransport):
+        def get_json(self, url):
+            payload = super().get_json(url)
+            payload["EURBRL"]["bid"] = None
+            return payload
+
+    class OpenCircuitTransport(FakeLastTransport):
+        def get_json(self, url):
+            super().get_json(url)
+            raise CircuitOpenError("upstream circuit is open")
+
+    malformed, open_circuit = MalformedTransport(), OpenCircuitTransport()
+    cache = LastQuoteCache(ttl_seconds=0)
+
+    result = CurrencyAPI(
+        CurrencyObject(["USD-BRL", "EUR-BRL"]), transport=malformed, quote_cache=cache
+    ).get_last_quote()
+    with pytest.raises(CircuitOpenError):
+        CurrencyAPI(
+            CurrencyObject(["USD-BRL"]), transport=open_circuit, quote_cache=cache
+        ).get_last_quote()
+
+    assert [quote.currency_pair for quote in result] == ["USD-BRL"]
+    assert result.failed_pairs == ["EUR-BRL"]
+    assert len(malformed.requested) == len(open_circuit.requested) == 1
+
+
+def test_last_quote_raises_when_every_pair_fails():
+    """Test that an entirely failed batch still raises."""
+    transport = FlakyLastTransport(["USD-BRL"])
+
+    with pytest.raises(ValueError, match="Missing quote for USD-BRL"):
+        CurrencyAPI(
+            CurrencyObject(["USD-BRL"]),
+            transport=transport,
+            quote_cache=LastQuoteCache(ttl_seconds=0),
+        ).get_last_quote()
+
+
+def test_history_quote_reports_empty_days(transport, monkeypatch):
+    """Test that a pair without a quote for the date is recorded as an error."""
+    original = transport.get_json
+    monkeypatch.setattr(
+        transport,
+        "get_json",
+        lambda url: [] if "EUR-BRL" in url else original(url),
+    )
+
+    result = CurrencyAPI(
+        CurrencyObject(["USD-BRL", "EUR-BRL"]), transport=transport
+    ).get_history_quote(20220621)
+
+    assert [quote.currency_pair for quote in result] == ["USD-BRL"]
+    assert isinstance(result.errors["EUR-BRL"], ValueError)
@@ -0,0 +1,61 @@
+from currency_quote.utils.dates import (
+    contiguous_ranges,
+    date_range,
+    date_windows,
+    days_between,
+    is_valid_reference_date,
+    timestamp_to_reference_date,
+)
+
+
+def test_date_windows_split_range():
+    """Test splitting an inclusive range into capped windows across month ends."""
+    assert list(date_windows(20220125, 20220210, 10)) == [
+        (20220125, 20220203),
+        (20220204, 20220210),
+    ]
+
+
+def test_date_windows_single_day():
+    """Test that a single-day range yields a single window."""
+    assert list(date_windows(20220621, 20220621, 360)) == [(20220621, 20220621)]
+
+
+def test_days_between_is_inclusive():
+    """Test the inclusive day count across a leap day."""
+    assert days_between(20240228, 20240301) == 3
+
+
+def test_is_valid_reference_date():
+    """Test reference date validation."""
+    assert is_valid_reference_date(20220621)
+    assert not is_valid_reference_date(220621)
+    assert not is_valid_reference_date(20221340)
+    assert not is_valid_reference_date(20301231)
+
+
+def test_timestamp_to_reference_date_uses_upstream_timezone():
+    """Test that timestamps are mapped to Brasília dates."""
+    # 2022-06-22 01:00 UTC is still 2022-06-21 in Brasília.
+    assert timestamp_to_reference_date(1655859600) == 20220621
+
+
+def test_contiguous_ranges_merge_consecutive_days():
+    """Test merging unordered dates into ranges across a month end."""
+    dates = [20220203, 20220131, 20220201, 20220205, 20220201]
+    assert list(contiguous_ranges(dates)) == [
+        (20220131, 20220201),
+        (20220203, 20220203),
+        (20220205, 20220205),
+    ]
+    assert list(contiguous_ranges([])) == []
+
+
+def test_date_range_is_inclusive():
+    """Test iterating every day of a range across a month end."""
+    assert list(date_range(20220130, 20220202)) == [
+        20220130,
+        20220131,
+        20220201,
+        20220202,
+    ]
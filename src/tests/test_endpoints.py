@@ -0,0 +1,43 @@
+import os
+import subprocess
+import sys
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def endpoints_with(environ):
+    env = {
+        key: value
+        for key, value in os.environ.items()
+        if key != "CURRENCY_QUOTE_API_URL"
+    }
+    env.update(environ, PYTHONPATH=SRC_DIR)
+    return subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "from currency_quote.config.endpoints import API\n"
+            "print(API.ENDPOINT_AVALIABLE_PARITIES)\n"
+            "print(API.ENDPOINT_LAST_COTATION)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    ).stdout.splitlines()
+
+
+def test_endpoints_default_to_public_api():
+    """Test that endpoints point to the public API by default."""
+    assert endpoints_with({}) == [
+        "https://economia.awesomeapi.com.br/json/available",
+        "https://economia.awesomeapi.com.br/last/",
+    ]
+
+
+def test_base_url_from_environment():
+    """Test that CURRENCY_QUOTE_API_URL replaces the base URL, trailing slash or not."""
+    assert endpoints_with({"CURRENCY_QUOTE_API_URL": "http://127.0.0.1:8000/"}) == [
+        "http://127.0.0.1:8000/json/available",
+        "http://127.0.0.1:8000/last/",
+    ]
@@ -0,0 +1,170 @@
+import math
+import threading
+from unittest.mock import patch
+import pytest
+from currency_quote import ClientBuilder
+from currency_quote.adapters.outbound.history_scheduler import (
+    HistoryCheckpoint,
+    HistoryJob,
+    HistoryJobScheduler,
+    plan_history_jobs,
+)
+from currency_quote.adapters.outbound.parities_cache import PARITIES_CACHE
+from currency_quote.domain.entities.currency import CurrencyQuote
+from currency_quote.domain.entities.history_matrix import HistoryMatrix
+from currency_quote.domain.entities.parity_index import ParityIndex
+from currency_quote.utils.dates import date_range, to_date
+
+
+def make_quote(pair, reference_date):
+    base, quote = pair.split("-")
+    # Noon in Brasília time, so the quote falls on its reference date.
+    timestamp = (to_date(reference_date) - to_date(19700101)).days * 86400 + 15 * 3600
+    price = reference_date % 100
+    return CurrencyQuote(pair, pair, base, quote, timestamp, price, price + 0.5, 1)
+
+
+class FakeRepository:
+    """Upstream stand-in serving one quote per weekday and recording every range."""
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __call__(self, currency_obj):
+        (pair,) = currency_obj.get_currency_list()
+        repository = self
+
+        class PairRepository:
+            def get_history_range(self, start_date, end_date):
+                with repository.lock:
+                    repository.calls.append(HistoryJob(pair, start_date, end_date))
+                if pair in repository.failing:
+                    raise ConnectionError("upstream down")
+                for reference_date in date_range(start_date, end_date):
+                    if to_date(reference_date).weekday() < 5:
+                        yield make_quote(pair, reference_date)
+
+        return PairRepository()
+
+
+def test_plan_merges_contiguous_dates_and_splits_long_ranges():
+    """Test that consecutive dates share a request and ranges respect the page limit."""
+    dates = [20220105, 20220103, 20220104, 20220110, 20220111, 20220103]
+
+    assert plan_history_jobs(["USD-BRL", "EUR-BRL"], dates) == [
+        HistoryJob("USD-BRL", 20220103, 20220105),
+        HistoryJob("USD-BRL", 20220110, 20220111),
+        HistoryJob("EUR-BRL", 20220103, 20220105),
+        HistoryJob("EUR-BRL", 20220110, 20220111),
+    ]
+    assert plan_history_jobs(
+        ["USD-BRL"], date_range(20220101, 20220110), max_days=4
+    ) == [
+        HistoryJob("USD-BRL", 20220101, 20220104),
+        HistoryJob("USD-BRL", 20220105, 20220108),
+        HistoryJob("USD-BRL", 20220109, 20220110),
+    ]
+
+
+def test_scheduler_builds_dense_matrix():
+    """Test that every (pair, date) cell is filled, with NaN for days without quotes."""
+    repository = FakeRepository()
+    scheduler = HistoryJobScheduler(repository=repository, max_workers=4, max_rate=1000)
+
+    matrix = scheduler.run(["USD-BRL", "EUR-BRL"], date_range(20220106, 20220110))
+
+    assert len(repository.calls) == 2
+    assert matrix.shape == (2, 5)
+    assert matrix.reference_dates == [20220106, 20220107, 20220108, 20220109, 20220110]
+    assert matrix.rate("EUR-BRL", 20220107) == (7, 7.5)
+    assert all(math.isnan(price) for price in matrix.rate("USD-BRL", 20220108))
+    assert matrix.errors == {}
+
+
+def test_scheduler_resumes_from_checkpoint(tmp_path):
+    """Test that finished jobs are not requested again and failed ones are retried."""
+    checkpoint = HistoryCheckpoint(str(tmp_path / "backfill.jsonl"))
+    dates = [20220103, 20220104, 20220110]
+    failing = FakeRepository(failing=["EUR-BRL"])
+
+    first = HistoryJobScheduler(
+        repository=failing, checkpoint=checkpoint, max_rate=1000
+    )
+    partial = first.run(["USD-BRL", "EUR-BRL"], dates)
+
+    assert set(partial.errors) == {"EUR-BRL"}
+    assert math.isnan(partial.rate("EUR-BRL", 20220103)[0])
+
+    with open(checkpoint.path, "a", encoding="utf-8") as file:
+        file.write('{"currency_pair": "GBP-')  # interrupted mid-write
+
+    repository = FakeRepository()
+    second = HistoryJobScheduler(
+        repository=repository, checkpoint=checkpoint, max_rate=1000
+    )
+    matrix = second.run(["USD-BRL", "EUR-BRL"], dates)
+
+    assert sorted(repository.calls) == [
+        HistoryJob("EUR-BRL", 20220103, 20220104),
+        HistoryJob("EUR-BRL", 20220110, 20220110),
+    ]
+    assert matrix.errors == {}
+    assert matrix.rate("USD-BRL", 20220110) == (10, 10.5)
+    assert matrix.rate("EUR-BRL", 20220104) == (4, 4.5)
+
+
+def test_checkpoint_appends_after_a_truncated_line(tmp_path):
+    """Test that a job recorded after an interrupted write is not lost."""
+    checkpoint = HistoryCheckpoint(str(tmp_path / "backfill.jsonl"))
+    with open(checkpoint.path, "w", encoding="utf-8") as file:
+        file.write('{"currency_pair": "GBP-')  # interrupted mid-write
+
+    job = HistoryJob("USD-BRL", 20220103, 20220104)
+    checkpoint.record(job, [(20220103, 3, 3.5)])
+
+    assert checkpoint.load() == {job: [(20220103, 3, 3.5)]}
+
+
+def test_scheduler_rejects_dates_not_in_the_past():
+    """Test that dates that cannot be fetched are reported before any request."""
+    repository = FakeRepository()
+
+    with pytest.raises(ValueError, match="Invalid reference dates"):
+        HistoryJobScheduler(repository=repository).run(
+            ["USD-BRL"], [20220103, 99991231]
+        )
+    assert repository.calls == []
+
+
+def test_history_matrix_to_numpy():
+    """Test that the matrix converts to (pairs, dates) arrays."""
+    np = pytest.importorskip("numpy")
+    matrix = HistoryMatrix(["USD-BRL", "EUR-BRL"], [20220104, 20220103])
+    matrix.fill("EUR-BRL", [(20220104, 6.0, 6.1), (20220105, 9.0, 9.1)])
+
+    arrays = matrix.to_numpy()
+
+    assert arrays["bid"].shape == (2, 2)
+    assert arrays["ask"][1].tolist() == [pytest.approx(np.nan, nan_ok=True), 6.1]
+    assert np.isnan(arrays["bid"][0]).all()
+
+
+def test_client_fetches_matrix_of_available_pairs():
+    """Test that the client drops unavailable pairs and delegates to the scheduler."""
+    index = ParityIndex.from_parities(["USD-BRL", "EUR-BRL"], version="v1")
+    repository = FakeRepository()
+
+    with patch.object(PARITIES_CACHE, "get_index", return_value=index), patch(
+        "currency_quote.application.use_cases.get_history_matrix.history_repository",
+        return_value=repository,
+    ):
+        client = ClientBuilder(["USD-BRL", "GBP-BRL", "EUR-BRL"], history_store=None)
+        matrix = client.get_history_matrix(
+            date_range(20220103, 20220104), max_rate=1000
+        )
+
+    assert matrix.currency_pairs == ["USD-BRL", "EUR-BRL"]
+    assert matrix.rate("USD-BRL", 20220104) == (4, 4.5)
+    assert len(repository.calls) == 2
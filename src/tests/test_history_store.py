@@ -0,0 +1,193 @@
+from functools import partial
+from unittest.mock import patch
+import pytest
+from currency_quote import ClientBuilder
+from currency_quote.adapters.outbound.cached_history_repository import (
+    CachedHistoryRepository,
+)
+from currency_quote.adapters.outbound.currency_api import NoHistoryQuoteError
+from currency_quote.adapters.outbound.sqlite_history_store import SQLiteHistoryStore
+from currency_quote.domain.entities.currency import CurrencyObject, CurrencyQuote
+from currency_quote.domain.entities.quote_result import QuoteResult
+from currency_quote.utils.dates import date_range, to_date
+
+
+def make_quote(pair, reference_date):
+    base, quote = pair.split("-")
+    # Noon in Brasília time, so the quote falls on its reference date.
+    day = to_date(reference_date)
+    timestamp = int((day - to_date(19700101)).days * 86400 + 15 * 3600)
+    return CurrencyQuote(pair, pair, base, quote, timestamp, 5.0, 5.1, 1)
+
+
+class FakeRepository:
+    """Upstream stand-in serving one quote per weekday and recording every call."""
+
+    calls = []
+
+    def __init__(self, currency_obj):
+        self.currency_list = currency_obj.get_currency_list()
+
+    def get_last_quote(self):
+        return []
+
+    def get_history_quote(self, reference_date):
+        self.calls.append(("quote", tuple(self.currency_list), reference_date))
+        return [make_quote(pair, reference_date) for pair in self.currency_list]
+
+    def get_history_range(self, start_date, end_date):
+        self.calls.append(("range", tuple(self.currency_list), start_date, end_date))
+        for pair in self.currency_list:
+            for reference_date in date_range(start_date, end_date):
+                if to_date(reference_date).weekday() < 5:
+                    yield make_quote(pair, reference_date)
+
+
+@pytest.fixture
+def store():
+    FakeRepository.calls = []
+    history_store = SQLiteHistoryStore()
+    yield history_store
+    history_store.close()
+
+
+def make_repository(store, pairs):
+    return CachedHistoryRepository(
+        CurrencyObject(pairs), store=store, repository=FakeRepository
+    )
+
+
+def test_store_tracks_fetched_dates(store):
+    """Test that lookups return stored quotes and the dates never fetched."""
+    store.save(
+        "USD-BRL", 20220103, 20220105, [(20220104, make_quote("USD-BRL", 20220104))]
+    )
+
+    quotes, missing = store.lookup("USD-BRL", 20220101, 20220106)
+
+    assert [quote.currency_pair for quote in quotes] == ["USD-BRL"]
+    assert missing == [20220101, 20220102, 20220106]
+
+
+def test_history_quote_fetched_once(store):
+    """Test that a closed date is requested upstream only the first time."""
+    repository = make_repository(store, ["USD-BRL", "EUR-BRL"])
+
+    first = repository.get_history_quote(20220103)
+    second = make_repository(store, ["EUR-BRL", "USD-BRL"]).get_history_quote(20220103)
+
+    assert FakeRepository.calls == [("quote", ("USD-BRL", "EUR-BRL"), 20220103)]
+    assert first == second[::-1]
+
+
+def test_history_quote_fetches_only_missing_pairs(store):
+    """Test that stored pairs are served locally and the rest fetched together."""
+    make_repository(store, ["USD-BRL"]).get_history_quote(20220103)
+    result = make_repository(store, ["EUR-BRL", "USD-BRL"]).get_history_quote(20220103)
+
+    assert FakeRepository.calls[-1] == ("quote", ("EUR-BRL",), 20220103)
+    assert [quote.currency_pair for quote in result] == ["EUR-BRL", "USD-BRL"]
+
+
+def test_history_quote_keeps_stored_pairs_when_upstream_fails(store):
+    """Test that a failed fetch reports the missing pairs and keeps stored ones."""
+    make_repository(store, ["USD-BRL"]).get_history_quote(20220103)
+
+    with patch.object(
+        FakeRepository,
+        "get_history_quote",
+        side_effect=ConnectionError("upstream down"),
+    ):
+        result = make_repository(store, ["EUR-BRL", "USD-BRL"]).get_history_quote(
+            20220103
+        )
+
+        with pytest.raises(ConnectionError, match="upstream down"):
+            make_repository(store, ["EUR-BRL"]).get_history_quote(20220103)
+
+    assert [quote.currency_pair for quote in result] == ["USD-BRL"]
+    assert list(result.errors) == ["EUR-BRL"]
+
+
+def test_history_quote_remembers_days_without_quote(store):
+    """Test that a day upstream has no quote for is fetched once and then reported."""
+    make_repository(store, ["USD-BRL"]).get_history_quote(20220103)
+    no_quote = QuoteResult(
+        errors={"EUR-BRL": NoHistoryQuoteError("No history quote returned for EUR-BRL")}
+    )
+
+    with patch.object(
+        FakeRepository, "get_history_quote", return_value=no_quote
+    ) as fetch:
+        first = make_repository(store, ["EUR-BRL", "USD-BRL"]).get_history_quote(
+            20220103
+        )
+        second = make_repository(store, ["EUR-BRL", "USD-BRL"]).get_history_quote(
+            20220103
+        )
+
+    assert fetch.call_count == 1
+    for result in (first, second):
+        assert [quote.currency_pair for quote in result] == ["USD-BRL"]
+        assert isinstance(result.errors["EUR-BRL"], NoHistoryQuoteError)
+
+
+def test_history_range_backfills_only_gaps(store):
+    """Test that overlapping ranges fetch just the uncovered windows."""
+    make_repository(store, ["USD-BRL"]).prefetch(20220110, 20220116)
+    result = list(
+        make_repository(store, ["USD-BRL"]).get_history_range(20220103, 20220121)
+    )
+
+    assert FakeRepository.calls == [
+        ("range", ("USD-BRL",), 20220110, 20220116),
+        ("range", ("USD-BRL",), 20220103, 20220109),
+        ("range", ("USD-BRL",), 20220117, 20220121),
+    ]
+    assert len(result) == 15
+    assert result == sorted(result, key=lambda quote: quote.quote_timestamp)
+
+    list(make_repository(store, ["USD-BRL"]).get_history_range(20220103, 20220121))
+    assert len(FakeRepository.calls) == 3
+
+
+def test_store_survives_reopening(tmp_path):
+    """Test that a file-backed store serves history to a new process."""
+    FakeRepository.calls = []
+    path = str(tmp_path / "history" / "quotes.db")
+
+    first = SQLiteHistoryStore(path)
+    make_repository(first, ["USD-BRL"]).get_history_quote(20220103)
+    first.close()
+
+    reopened = SQLiteHistoryStore(path)
+    result = make_repository(reopened, ["USD-BRL"]).get_history_quote(20220103)
+    reopened.close()
+
+    assert len(FakeRepository.calls) == 1
+    assert result[0].bid_price == 5.0
+
+
+def test_client_prefetch_history(store):
+    """Test the ClientBuilder backfill command against the history store."""
+    client = ClientBuilder(["USD-BRL"], history_store=store)
+
+    with patch(
+        "currency_quote.application.use_cases.prefetch_history.ValidateCurrencyUseCase.execute",
+        side_effect=lambda currency_obj: currency_obj,
+    ), patch(
+        "currency_quote.application.use_cases.prefetch_history.CachedHistoryRepository",
+        partial(CachedHistoryRepository, repository=FakeRepository),
+    ):
+        assert client.prefetch_history(20220103, 20220109) == 5
+        assert client.prefetch_history(20220103, 20220109) == 5
+
+    assert len(FakeRepository.calls) == 1
+
+
+def test_client_prefetch_requires_store():
+    """Test that prefetching without a history store is rejected."""
+    with pytest.raises(ValueError, match="history_store"):
+        ClientBuilder(["USD-BRL"], history_store=None).prefetch_history(
+            20220103, 20220109
+        )
@@ -0,0 +1,133 @@
+import asyncio
+from unittest.mock import MagicMock, patch
+import pytest
+import requests
+from currency_quote.adapters.outbound.http_transport import RequestsTransport
+
+
+def url(server, path):
+    return f"http://127.0.0.1:{server.server_port}{path}"
+
+
+def test_reuses_keep_alive_connection(stub_server):
+    """Test that consecutive requests go through a single pooled connection."""
+    transport = RequestsTransport()
+
+    for index in range(5):
+        assert transport.get_json(url(stub_server, f"/last/{index}")) == {
+            "path": f"/last/{index}"
+        }
+
+    client_ports = {client_address[1] for _, client_address in stub_server.requests}
+    assert len(client_ports) == 1
+    transport.close()
+
+
+def test_decodes_compressed_responses(stub_server):
+    """Test that gzip-encoded bodies are requested and decoded."""
+    transport = RequestsTransport()
+
+    assert transport.get_json(url(stub_server, "/json/available")) == {
+        "path": "/json/available"
+    }
+    transport.close()
+
+
+def test_retries_retryable_status(stub_server):
+    """Test that a 503 is retried until the upstream recovers."""
+    stub_server.statuses = [503, 503]
+    transport = RequestsTransport(retry_attempts=3, retry_time_seconds=0)
+
+    assert transport.get_json(url(stub_server, "/last/USD-BRL")) == {
+        "path": "/last/USD-BRL"
+    }
+    assert len(stub_server.requests) == 3
+    transport.close()
+
+
+def test_does_not_retry_client_errors(stub_server):
+    """Test that a 404 fails immediately without further attempts."""
+    stub_server.statuses = [404]
+    transport = RequestsTransport(retry_attempts=3, retry_time_seconds=0)
+
+    with pytest.raises(requests.HTTPError):
+        transport.get_json(url(stub_server, "/last/AAA-BBB"))
+    assert len(stub_server.requests) == 1
+    transport.close()
+
+
+def test_async_client_does_not_retry_client_errors(stub_server):
+    """Test that the async client fails a 404 immediately but retries a 503."""
+    aiohttp = pytest.importorskip("aiohttp")
+    from currency_quote.adapters.outbound.async_http import AsyncHttpClient
+
+    async def fetch(path):
+        client = AsyncHttpClient(retry_attempts=3, retry_time_seconds=0)
+        try:
+            return await client.get_json(url(stub_server, path))
+        finally:
+            await client.close()
+
+    stub_server.statuses = [404]
+    with pytest.raises(aiohttp.ClientResponseError):
+        asyncio.run(fetch("/last/AAA-BBB"))
+    assert len(stub_server.requests) == 1
+
+    stub_server.statuses = [503]
+    assert asyncio.run(fetch("/last/USD-BRL")) == {"path": "/last/USD-BRL"}
+    assert len(stub_server.requests) == 3
+
+
+class FakeAsyncResponse:
+    def __init__(self, read):
+        self.read = read
+
+    async def json(self, content_type=None):
+        raise ValueError("Expecting value: line 1 column 1 (char 0)")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+def half_open_breaker():
+    from currency_quote.utils.resilience import CircuitBreaker
+
+    clock = [0.0]
+    breaker = CircuitBreaker(
+        failure_threshold=1, reset_timeout_seconds=10, clock=lambda: clock[0]
+    )
+    breaker.record_failure()
+    clock[0] += 10
+    return breaker, clock
+
+
+@pytest.mark.parametrize("outcome", ["cancelled", "malformed"])
+def test_async_probe_is_released_when_it_does_not_complete(outcome):
+    """Test that a cancelled or undecodable probe does not wedge the circuit."""
+    pytest.importorskip("aiohttp")
+    from currency_quote.adapters.outbound.async_http import AsyncHttpClient
+
+    async def read():
+        if outcome == "cancelled":
+            await asyncio.sleep(10)
+        return b"<html>"
+
+    breaker, clock = half_open_breaker()
+    client = AsyncHttpClient(retry_attempts=1, circuit_breaker=breaker)
+    session = MagicMock()
+    session.get.return_value = FakeAsyncResponse(read)
+
+    with patch.object(client, "_get_session", return_value=session):
+        with pytest.raises((asyncio.TimeoutError, ValueError)):
+            asyncio.run(
+                asyncio.wait_for(client.get_json("http://a/last/USD-BRL"), 0.05)
+            )
+
+    if outcome == "malformed":
+        assert breaker.state == breaker.OPEN
+        clock[0] += 10
+    breaker.before_call()
+    assert breaker.state == breaker.HALF_OPEN
@@ -0,0 +1,95 @@
+import json
+import os
+import subprocess
+import sys
+import pytest
+import currency_quote
+
+# Cumulative `-X importtime` budget for `import currency_quote`. Importing the
+# package used to load requests eagerly and took well over 100ms.
+IMPORT_TIME_BUDGET_US = 50_000
+
+HEAVY_MODULES = [
+    "requests",
+    "urllib3",
+    "aiohttp",
+    "numpy",
+    "pandas",
+    "pyarrow",
+    "sqlite3",
+]
+
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_python(code, *options):
+    env = dict(os.environ, PYTHONPATH=SRC_DIR)
+    return subprocess.run(
+        [sys.executable, *options, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+
+
+def loaded_modules(code):
+    result = run_python(
+        f"import sys\n{code}\nimport json\n"
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    )
+    return json.loads(result.stdout)
+
+
+def test_import_does_not_load_heavy_dependencies():
+    """Test that importing the package loads no HTTP stack or optional dependency."""
+    assert loaded_modules("import currency_quote") == []
+
+
+def test_client_builder_defers_heavy_dependencies_until_first_call():
+    """Test that resolving the builders still loads nothing heavy."""
+    code = (
+        "import currency_quote\n"
+        "currency_quote.ClientBuilder\n"
+        "currency_quote.AsyncClientBuilder"
+    )
+    assert loaded_modules(code) == []
+
+
+def test_import_time_within_budget():
+    """Test that `import currency_quote` stays within its import-time budget."""
+    result = run_python("import currency_quote", "-X", "importtime")
+
+    cumulative = None
+    for line in result.stderr.splitlines():
+        fields = [field.strip() for field in line.split("|")]
+        if len(fields) == 3 and fields[2] == "currency_quote":
+            cumulative = int(fields[1])
+
+    assert cumulative is not None
+    assert cumulative < IMPORT_TIME_BUDGET_US
+
+
+def test_lazy_attributes_resolve():
+    """Test that public names resolve on first access and unknown ones fail."""
+    from currency_quote.adapters.inbound.lib_controller import ClientBuilder
+
+    assert currency_quote.ClientBuilder is ClientBuilder
+    assert "AsyncClientBuilder" in dir(currency_quote)
+
+    with pytest.raises(AttributeError):
+        currency_quote.Missing  # pylint: disable=pointless-statement
+
+
+def test_logging_is_opt_in():
+    """Test that the package logs nowhere until setup_logging is called."""
+    result = run_python(
+        "import logging, currency_quote\n"
+        "logger = logging.getLogger('currency_quote')\n"
+        "print(sorted(type(h).__name__ for h in logger.handlers))\n"
+        "currency_quote.setup_logging()\n"
+        "print(sorted(type(h).__name__ for h in logger.handlers))"
+    )
+    before, after = result.stdout.splitlines()
+    assert before == "['NullHandler']"
+    assert after == "['NullHandler', 'StreamHandler']"
@@ -1,7 +1,12 @@
 import pytest
 from unittest.mock import patch, MagicMock
 from currency_quote import ClientBuilder
+from currency_quote.adapters.outbound.currency_api import CurrencyAPI
+from currency_quote.adapters.outbound.currency_validator_api import CurrencyValidatorAPI
+from currency_quote.adapters.outbound.parities_cache import PARITIES_CACHE
+from currency_quote.domain.entities.parity_index import ParityIndex
 from currency_quote.domain.entities.currency import CurrencyQuote, CurrencyObject
+from currency_quote.domain.entities.quote_result import QuoteResult
 
 
 @pytest.fixture
@@ -20,13 +25,13 @@ def test_client_methods_simple():
     """Test basic functionality of client methods without mocking."""
     # Create client with direct approaches to avoid complex mocking
     client = ClientBuilder(currency_list=["USD-BRL"])
-    
+
     # Check that the methods exist and return the right types
-    assert hasattr(client, 'get_last_quote')
-    assert hasattr(client, 'get_history_quote')
-    
+    assert hasattr(client, "get_last_quote")
+    assert hasattr(client, "get_history_quote")
+
     # Simple validation of signatures
-    assert 'reference_date' in client.get_history_quote.__code__.co_varnames
+    assert "reference_date" in client.get_history_quote.__code__.co_varnames
 
 
 def test_instantiate_with_different_inputs():
@@ -36,7 +41,7 @@ def test_instantiate_with_different_inputs():
     assert client1.currency_list == "USD-BRL"
     assert isinstance(client1.currency_obj, CurrencyObject)
     assert client1.currency_obj.get_currency_list() == ["USD-BRL"]
-    
+
     # Test with list
     client2 = ClientBuilder(currency_list=["USD-BRL", "EUR-BRL"])
     assert client2.currency_list == ["USD-BRL", "EUR-BRL"]
@@ -48,15 +53,74 @@ def test_instantiate_with_different_inputs():
 
 def test_invalid_reference_date():
     """Test get_history_quote with invalid reference date."""
-    with patch('currency_quote.application.use_cases.validate_currency.ValidateCurrencyUseCase.execute') as mock_validate:
-        with patch('currency_quote.application.use_cases.get_history_currency_quote.GetHistCurrencyQuoteUseCase.execute') as mock_hist_quote:
+    with patch(
+        "currency_quote.application.use_cases.validate_currency.ValidateCurrencyUseCase.execute"
+    ) as mock_validate:
+        with patch(
+            "currency_quote.application.use_cases.get_history_currency_quote.GetHistCurrencyQuoteUseCase.execute"
+        ) as mock_hist_quote:
             # Configure mocks
             mock_validate.return_value = MagicMock()
             mock_hist_quote.return_value = []
-            
+
             # Create client and call with invalid date
             client = ClientBuilder(currency_list=["USD-BRL"])
             result = client.get_history_quote(reference_date=99999999)
-            
+
             # Should return empty list
             assert result == []
+
+
+def test_client_validates_once_across_calls():
+    """Test that repeated calls reuse the validation instead of redoing it."""
+    index = ParityIndex.from_parities(["USD-BRL", "EUR-BRL"], version="v1")
+    quote = CurrencyQuote("USD-BRL", "Dólar/Real", "USD", "BRL", 1, 5.0, 5.1, 2)
+
+    with patch.object(PARITIES_CACHE, "get_index", return_value=index), patch.object(
+        CurrencyValidatorAPI, "validate_currency_code"
+    ) as validator, patch.object(CurrencyAPI, "get_last_quote", return_value=[quote]):
+        client = ClientBuilder(currency_list=["USD-BRL"])
+        client.get_last_quote()
+        first = client.validated_currency.get()
+        client.get_last_quote()
+
+        assert client.validated_currency.get() is first
+        validator.assert_not_called()
+
+
+def test_client_add_and_remove_pairs():
+    """Test that pairs can be added and removed on a long-lived client."""
+    index = ParityIndex.from_parities(["USD-BRL", "EUR-BRL"], version="v1")
+
+    with patch.object(PARITIES_CACHE, "get_index", return_value=index):
+        client = ClientBuilder(currency_list="USD-BRL")
+
+        assert client.add_pairs(["EUR-BRL", "AAA-BBB"]) == ["EUR-BRL", "AAA-BBB"]
+        assert client.currency_list == ["USD-BRL", "EUR-BRL", "AAA-BBB"]
+        assert client.validated_currency.get().get_currency_list() == [
+            "USD-BRL",
+            "EUR-BRL",
+        ]
+
+        assert client.remove_pairs("USD-BRL") == ["USD-BRL"]
+        assert client.currency_obj.get_currency_list() == ["EUR-BRL", "AAA-BBB"]
+        assert client.validated_currency.get().get_currency_list() == ["EUR-BRL"]
+
+
+def test_client_reports_failed_pairs():
+    """Test that the pairs that failed upstream are exposed next to the quotes."""
+    index = ParityIndex.from_parities(["USD-BRL", "EUR-BRL"], version="v1")
+    quote = CurrencyQuote("USD-BRL", "Dólar/Real", "USD", "BRL", 1, 5.0, 5.1, 2)
+    error = ConnectionError("upstream down")
+    result = QuoteResult([quote], {"EUR-BRL": error})
+
+    with patch.object(PARITIES_CACHE, "get_index", return_value=index), patch.object(
+        CurrencyAPI, "get_last_quote", return_value=result
+    ):
+        client = ClientBuilder(currency_list=["USD-BRL", "EUR-BRL"])
+        quotes = client.get_last_quote()
+        columns = client.get_last_quote(columnar=True)
+
+    assert [item["currency_pair"] for item in quotes] == ["USD-BRL"]
+    assert quotes.errors == {"EUR-BRL": error}
+    assert len(columns) == 1 and columns.errors == {"EUR-BRL": error}
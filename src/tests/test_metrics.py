@@ -0,0 +1,321 @@
+import asyncio
+from unittest.mock import patch
+import pytest
+from currency_quote.adapters.outbound.currency_api import CurrencyAPI
+from currency_quote.adapters.outbound.http_transport import (
+    RequestsTransport,
+    endpoint_label,
+)
+from currency_quote.adapters.outbound.last_quote_cache import LastQuoteCache
+from currency_quote.adapters.outbound.parities_cache import PARITIES_CACHE
+from currency_quote.adapters.outbound.quote_poller import QUOTE_POLLER
+from currency_quote.application.use_cases.get_history_range_currency_quote import (
+    GetHistRangeCurrencyQuoteUseCase,
+)
+from currency_quote.application.use_cases.stream_currency_quote import (
+    StreamCurrencyQuoteUseCase,
+)
+from currency_quote.config.endpoints import API
+from currency_quote.domain.entities.currency import CurrencyObject, CurrencyQuote
+from currency_quote.domain.entities.parity_index import ParityIndex
+from currency_quote.utils.metrics import (
+    InMemoryMetrics,
+    MetricsRecorder,
+    OpenTelemetryMetrics,
+    get_metrics,
+    instrument_use_case,
+    set_metrics,
+)
+
+
+@pytest.fixture
+def metrics():
+    recorder = InMemoryMetrics()
+    previous = set_metrics(recorder)
+    yield recorder
+    set_metrics(previous)
+
+
+class FakeLastTransport:
+    def __init__(self, payload):
+        self.payload = payload
+
+    def get_json(self, url):
+        return self.payload
+
+
+def test_disabled_recorder_is_the_default():
+    """Test that instrumentation is off by default and timers are shared no-ops."""
+    recorder = get_metrics()
+
+    assert type(recorder) is MetricsRecorder  # pylint: disable=unidiomatic-typecheck
+    assert not recorder.enabled
+    assert recorder.timer("a") is recorder.timer("b")
+
+
+def test_set_metrics_returns_previous_and_none_disables():
+    """Test that set_metrics swaps recorders and None restores the no-op one."""
+    recorder = InMemoryMetrics()
+    original = set_metrics(recorder)
+    try:
+        assert get_metrics() is recorder
+        assert set_metrics(None) is recorder
+        assert not get_metrics().enabled
+    finally:
+        set_metrics(original)
+
+
+def test_in_memory_counters_and_histograms():
+    """Test that counters add up per label set and histograms track the values."""
+    recorder = InMemoryMetrics()
+    recorder.increment("requests_total", outcome="ok")
+    recorder.increment("requests_total", 2, outcome="ok")
+    recorder.increment("requests_total", outcome="error")
+    for value in (0.002, 0.004, 0.2, 0.3):
+        recorder.observe("latency_seconds", value, endpoint="last")
+
+    histogram = recorder.histogram("latency_seconds", endpoint="last")
+
+    assert recorder.counter("requests_total", outcome="ok") == 3
+    assert recorder.counter("requests_total", outcome="error") == 1
+    assert recorder.counter("requests_total", outcome="missing") == 0
+    assert histogram.count == 4
+    assert histogram.sum == pytest.approx(0.506)
+    assert (histogram.min, histogram.max) == (0.002, 0.3)
+    assert 0.002 <= histogram.quantile(0.5) <= 0.1
+    assert histogram.quantile(0.99) <= 0.3
+
+
+def test_timer_observes_duration(metrics):
+    """Test that a timer records one observation under its labels."""
+    with metrics.timer("phase_seconds", phase="parse"):
+        pass
+
+    assert metrics.histogram("phase_seconds", phase="parse").count == 1
+
+
+def test_prometheus_exposition():
+    """Test that counters and cumulative histogram buckets are rendered."""
+    recorder = InMemoryMetrics(buckets={"size_bytes": [100, 1000]})
+    recorder.increment("calls_total", endpoint="last")
+    recorder.observe("size_bytes", 50)
+    recorder.observe("size_bytes", 500)
+
+    assert recorder.to_prometheus().splitlines() == [
+        "# TYPE calls_total counter",
+        'calls_total{endpoint="last"} 1',
+        "# TYPE size_bytes histogram",
+        'size_bytes_bucket{le="100"} 1',
+        'size_bytes_bucket{le="1000"} 2',
+        'size_bytes_bucket{le="+Inf"} 2',
+        "size_bytes_sum 550.0",
+        "size_bytes_count 2",
+    ]
+
+
+def test_snapshot_and_reset():
+    """Test that snapshot keys series by name and labels and reset empties them."""
+    recorder = InMemoryMetrics()
+    recorder.increment("calls_total", endpoint="last")
+    recorder.observe("latency_seconds", 0.01)
+
+    snapshot = recorder.snapshot()
+    recorder.reset()
+
+    assert snapshot["counters"] == {'calls_total{endpoint="last"}': 1}
+    assert snapshot["histograms"]["latency_seconds"]["count"] == 1
+    assert recorder.snapshot() == {"counters": {}, "histograms": {}}
+
+
+def test_open_telemetry_recorder_forwards_to_meter():
+    """Test that instruments are created once per name and receive attributes."""
+
+    class FakeInstrument:
+        def __init__(self, name, unit):
+            self.name, self.unit, self.values = name, unit, []
+
+        def add(self, value, attributes):
+            self.values.append((value, attributes))
+
+        record = add
+
+    class FakeMeter:
+        def __init__(self):
+            self.created = []
+
+        def create_counter(self, name, unit=""):
+            self.created.append(FakeInstrument(name, unit))
+            return self.created[-1]
+
+        create_histogram = create_counter
+
+    meter = FakeMeter()
+    recorder = OpenTelemetryMetrics(meter)
+    recorder.increment("calls_total", endpoint="last")
+    recorder.increment("calls_total", endpoint="daily")
+    recorder.observe("latency_seconds", 0.5)
+
+    counter, histogram = meter.created
+    assert counter.values == [(1, {"endpoint": "last"}), (1, {"endpoint": "daily"})]
+    assert (histogram.unit, histogram.values) == ("s", [(0.5, {})])
+
+
+def test_instrument_use_case_times_calls_and_counts_errors(metrics):
+    """Test that decorated use cases, sync or async, are timed and errors counted."""
+
+    @instrument_use_case("sync")
+    def sync_case(fail):
+        if fail:
+            raise ValueError("boom")
+        return "ok"
+
+    @instrument_use_case("async")
+    async def async_case():
+        return "ok"
+
+    assert sync_case(False) == "ok"
+    with pytest.raises(ValueError):
+        sync_case(True)
+    assert asyncio.run(async_case()) == "ok"
+
+    assert (
+        metrics.histogram("currency_quote_use_case_seconds", use_case="sync").count == 2
+    )
+    assert metrics.counter("currency_quote_use_case_errors_total", use_case="sync") == 1
+    assert (
+        metrics.histogram("currency_quote_use_case_seconds", use_case="async").count
+        == 1
+    )
+
+
+def test_instrument_use_case_times_generators_until_consumed(metrics):
+    """Test that lazy use cases are timed over their iteration, errors included."""
+
+    @instrument_use_case("lazy")
+    def lazy_case(fail):
+        def quotes():
+            yield 1
+            if fail:
+                raise ValueError("boom")
+            yield 2
+
+        return quotes()
+
+    result = lazy_case(False)
+    assert metrics.histogram("currency_quote_use_case_seconds", use_case="lazy") is None
+    assert list(result) == [1, 2]
+    with pytest.raises(ValueError):
+        list(lazy_case(True))
+    abandoned = lazy_case(False)
+    next(abandoned)
+    abandoned.close()
+
+    assert (
+        metrics.histogram("currency_quote_use_case_seconds", use_case="lazy").count == 3
+    )
+    assert metrics.counter("currency_quote_use_case_errors_total", use_case="lazy") == 1
+
+
+def test_history_range_and_stream_use_cases_are_instrumented(metrics):
+    """Test that the history range and stream use cases record their calls."""
+    index = ParityIndex.from_parities(["USD-BRL"], version="v1")
+    quote = CurrencyQuote("USD-BRL", "Dólar/Real", "USD", "BRL", 1, 5.0, 5.1, 2)
+
+    with patch.object(PARITIES_CACHE, "get_index", return_value=index), patch.object(
+        CurrencyAPI, "get_history_range", return_value=iter([quote])
+    ):
+        quotes = GetHistRangeCurrencyQuoteUseCase.execute(
+            CurrencyObject(["USD-BRL"]), 20220103, 20220104
+        )
+        assert list(quotes) == [quote]
+
+    with patch.object(PARITIES_CACHE, "get_index", return_value=index), patch.object(
+        QUOTE_POLLER, "subscribe"
+    ) as subscribe:
+        StreamCurrencyQuoteUseCase.execute(CurrencyObject(["USD-BRL"]), interval=1)
+        subscribe.assert_called_once()
+
+    for use_case in ("get_history_range", "stream"):
+        histogram = metrics.histogram(
+            "currency_quote_use_case_seconds", use_case=use_case
+        )
+        assert histogram.count == 1
+
+
+def test_endpoint_label():
+    """Test that URLs are labelled by endpoint, without the requested pairs."""
+    assert endpoint_label(API.ENDPOINT_LAST_COTATION + "USD-BRL,EUR-BRL") == "last"
+    assert (
+        endpoint_label(API.ENDPOINT_HISTORY_COTATION + "USD-BRL?start_date=1")
+        == "daily"
+    )
+    assert endpoint_label(API.ENDPOINT_AVALIABLE_PARITIES) == "available"
+    assert endpoint_label("http://127.0.0.1/other") == "other"
+
+
+def test_transport_records_requests_retries_and_bytes(metrics, stub_server):
+    """Test that every attempt, retry and response size is recorded."""
+    stub_server.statuses = [503]
+    transport = RequestsTransport(retry_attempts=3, retry_time_seconds=0)
+
+    transport.get_json(f"http://127.0.0.1:{stub_server.server_port}/last/USD-BRL")
+    transport.close()
+
+    assert (
+        metrics.counter(
+            "currency_quote_http_requests_total", endpoint="other", outcome="503"
+        )
+        == 1
+    )
+    assert (
+        metrics.counter(
+            "currency_quote_http_requests_total", endpoint="other", outcome="ok"
+        )
+        == 1
+    )
+    assert metrics.counter("currency_quote_http_retries_total", endpoint="other") == 1
+    assert (
+        metrics.histogram("currency_quote_http_request_seconds", endpoint="other").count
+        == 2
+    )
+    assert (
+        metrics.histogram("currency_quote_http_response_bytes", endpoint="other").sum
+        > 0
+    )
+
+
+def test_currency_api_records_phases_pairs_and_cache(
+    metrics, mock_currency_api_response
+):
+    """Test that fetch and parse phases, per-pair latency and cache use are recorded."""
+    cache = LastQuoteCache(ttl_seconds=60)
+    repository = CurrencyAPI(
+        CurrencyObject(["USD-BRL", "EUR-BRL"]),
+        transport=FakeLastTransport(mock_currency_api_response),
+        quote_cache=cache,
+    )
+
+    repository.get_last_quote()
+    repository.get_last_quote()
+
+    assert metrics.histogram("currency_quote_phase_seconds", phase="fetch").count == 1
+    assert metrics.histogram("currency_quote_phase_seconds", phase="parse").count == 1
+    for currency_pair in ("USD-BRL", "EUR-BRL"):
+        assert (
+            metrics.histogram(
+                "currency_quote_pair_latency_seconds", currency_pair=currency_pair
+            ).count
+            == 1
+        )
+    assert (
+        metrics.counter(
+            "currency_quote_cache_requests_total", cache="last_quote", result="miss"
+        )
+        == 2
+    )
+    assert (
+        metrics.counter(
+            "currency_quote_cache_requests_total", cache="last_quote", result="hit"
+        )
+        == 2
+    )
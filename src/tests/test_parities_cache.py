@@ -0,0 +1,190 @@
+import asyncio
+import json
+import threading
+import time
+import pytest
+from unittest.mock import MagicMock, patch
+from currency_quote.adapters.outbound.async_currency_validator_api import (
+    AsyncCurrencyValidatorAPI,
+)
+from currency_quote.adapters.outbound.parities_cache import ParitiesCache
+from currency_quote.adapters.outbound.currency_validator_api import CurrencyValidatorAPI
+from currency_quote.domain.entities.currency import CurrencyObject
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def make_cache(loader, clock, **kwargs):
+    return ParitiesCache(
+        loader=loader,
+        ttl_seconds=60,
+        stale_seconds=600,
+        snapshot_path=None,
+        clock=clock,
+        **kwargs
+    )
+
+
+def test_serves_from_memory_within_ttl(mock_validator_api_response):
+    """Test that the loader runs only once while the entry is fresh."""
+    loader = MagicMock(return_value=mock_validator_api_response)
+    clock = FakeClock()
+    cache = make_cache(loader, clock)
+
+    first = cache.get()
+    clock.now += 30
+    second = cache.get()
+
+    assert first is second
+    assert "USD-BRL" in first
+    loader.assert_called_once()
+
+
+def test_stale_entry_is_served_while_refreshing_in_background():
+    """Test stale-while-revalidate: the old copy is returned and refreshed once."""
+    refreshed = threading.Event()
+
+    def loader():
+        if loader.calls:
+            refreshed.set()
+            return {"USD-BRL": "new"}
+        loader.calls += 1
+        return {"USD-BRL": "old"}
+
+    loader.calls = 0
+    clock = FakeClock()
+    cache = make_cache(loader, clock)
+    cache.get()
+
+    clock.now += 120
+    assert cache.get() == {"USD-BRL": "old"}
+    assert refreshed.wait(timeout=5)
+
+    for _ in range(100):
+        if cache.get() == {"USD-BRL": "new"}:
+            break
+        time.sleep(0.01)
+    assert cache.get() == {"USD-BRL": "new"}
+
+
+def test_expired_entry_is_refreshed_synchronously():
+    """Test that entries past the stale window are reloaded before returning."""
+    loader = MagicMock(side_effect=[{"USD-BRL": "old"}, {"EUR-BRL": "new"}])
+    clock = FakeClock()
+    cache = make_cache(loader, clock)
+    cache.get()
+
+    clock.now += 1000
+    assert cache.get() == {"EUR-BRL": "new"}
+    assert loader.call_count == 2
+
+
+def test_failed_refresh_falls_back_to_stale_copy():
+    """Test that an upstream failure serves the previous copy."""
+    loader = MagicMock(side_effect=[{"USD-BRL": "old"}, Exception("API Error")])
+    clock = FakeClock()
+    cache = make_cache(loader, clock)
+    cache.get()
+
+    clock.now += 1000
+    assert cache.get() == {"USD-BRL": "old"}
+
+
+def test_failed_first_load_raises():
+    """Test that an upstream failure without a cached copy is propagated."""
+    cache = make_cache(MagicMock(side_effect=Exception("API Error")), FakeClock())
+
+    with pytest.raises(Exception, match="API Error"):
+        cache.get()
+
+
+def test_snapshot_lets_cold_process_skip_network(tmp_path, mock_validator_api_response):
+    """Test that a snapshot written by one cache is used by a fresh one."""
+    snapshot_path = str(tmp_path / "parities.json")
+    clock = FakeClock()
+
+    warm = make_cache(MagicMock(return_value=mock_validator_api_response), clock)
+    warm.snapshot_path = snapshot_path
+    warm.get()
+
+    with open(snapshot_path, encoding="utf-8") as snapshot:
+        assert json.load(snapshot)["fetched_at"] == clock.now
+
+    loader = MagicMock(side_effect=Exception("No network"))
+    cold = make_cache(loader, clock)
+    cold.snapshot_path = snapshot_path
+
+    assert "EUR-BRL" in cold.get()
+    loader.assert_not_called()
+
+
+def test_validator_uses_shared_cache(mock_validator_api_response):
+    """Test that CurrencyValidatorAPI validates against the cached parities."""
+    cache = make_cache(MagicMock(return_value=mock_validator_api_response), FakeClock())
+
+    with patch(
+        "currency_quote.adapters.outbound.currency_validator_api.PARITIES_CACHE", cache
+    ):
+        currency_obj = CurrencyObject(["USD-BRL", "AAA-BBB"])
+        assert CurrencyValidatorAPI(currency_obj).validate_currency_code() == [
+            "USD-BRL"
+        ]
+        assert CurrencyValidatorAPI(currency_obj).validate_currency_code() == [
+            "USD-BRL"
+        ]
+
+    cache.loader.assert_called_once()
+
+
+def test_background_refresh_and_index_use_the_callers_loader():
+    """Test that a stale entry is refreshed with the loader passed to get_index."""
+    default_loader = MagicMock(return_value={"USD-BRL": "old"})
+    refreshed = threading.Event()
+
+    def injected_loader():
+        refreshed.set()
+        return {"USD-BRL": "new", "EUR-BRL": "new"}
+
+    clock = FakeClock()
+    cache = make_cache(default_loader, clock)
+    cache.get()
+
+    clock.now += 120
+    index = cache.get_index(injected_loader)
+    assert refreshed.wait(timeout=5)
+
+    assert index.split(["USD-BRL", "EUR-BRL"])[0] == ["USD-BRL"]
+    default_loader.assert_called_once()
+
+
+def test_async_validator_falls_back_to_stale_copy():
+    """Test that a failed async reload validates against the expired parities."""
+
+    class FailingHttpClient:
+        async def get_json(self, url):
+            raise ConnectionError("upstream down")
+
+    clock = FakeClock()
+    cache = make_cache(MagicMock(return_value=["USD-BRL"]), clock)
+    validator = AsyncCurrencyValidatorAPI(
+        CurrencyObject(["USD-BRL", "AAA-BBB"]), http_client=FailingHttpClient()
+    )
+
+    with patch(
+        "currency_quote.adapters.outbound.async_currency_validator_api.PARITIES_CACHE",
+        cache,
+    ):
+        with pytest.raises(ConnectionError, match="upstream down"):
+            asyncio.run(validator.validate_currency_code())
+
+        cache.get()
+        clock.now += 1000
+        assert asyncio.run(validator.validate_currency_code()) == ["USD-BRL"]
+
+    cache.loader.assert_called_once()
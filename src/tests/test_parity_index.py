@@ -0,0 +1,49 @@
+from unittest.mock import MagicMock
+from currency_quote.adapters.outbound.parities_cache import ParitiesCache
+from currency_quote.domain.entities.parity_index import ParityIndex
+
+
+def test_parity_index_lookups(mock_validator_api_response):
+    """Test membership and adjacency lookups of the parity index."""
+    index = ParityIndex.from_parities(mock_validator_api_response, version="v1")
+
+    assert "USD-BRL" in index
+    assert "AAA-BBB" not in index
+    assert len(index) == 3
+    assert index.quoted_in("BRL") == frozenset({"USD-BRL", "EUR-BRL"})
+    assert index.based_on("USD") == frozenset({"USD-BRL", "USD-BRLT"})
+    assert index.quoted_in("JPY") == frozenset()
+
+
+def test_parity_index_split_preserves_order(mock_validator_api_response):
+    """Test that split partitions pairs in one pass keeping the input order."""
+    index = ParityIndex.from_parities(mock_validator_api_response)
+
+    valid, invalid = index.split(["EUR-BRL", "AAA-BBB", "USD-BRL", "XXX-YYY"])
+
+    assert valid == ["EUR-BRL", "USD-BRL"]
+    assert invalid == ["AAA-BBB", "XXX-YYY"]
+
+
+def test_parity_index_ignores_malformed_entries():
+    """Test that entries without a pair separator are skipped."""
+    index = ParityIndex.from_parities(["USD-BRL", "INVALID"])
+
+    assert index.pairs == frozenset({"USD-BRL"})
+
+
+def test_cache_builds_index_once_per_version(mock_validator_api_response):
+    """Test that the cache reuses the index until the parity list changes."""
+    loader = MagicMock(side_effect=[mock_validator_api_response, ["USD-BRL"]])
+    cache = ParitiesCache(loader=loader, snapshot_path=None)
+
+    first = cache.get_index()
+    assert cache.get_index() is first
+    assert first.version == cache.version
+
+    cache.clear()
+    second = cache.get_index()
+
+    assert second is not first
+    assert second.version != first.version
+    assert second.pairs == frozenset({"USD-BRL"})
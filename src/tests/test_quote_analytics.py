@@ -0,0 +1,120 @@
+import math
+import random
+import pytest
+from currency_quote.domain.entities.currency import CurrencyQuote
+from currency_quote.domain.entities.quote_columns import QuoteColumns
+from currency_quote.domain.services import quote_analytics as analytics
+
+np = pytest.importorskip("numpy")
+
+DAY = 86400
+# Noon in Brasília time on 2022-01-03.
+START = 1641222000
+
+
+def history(pair, bids, start=START):
+    return [
+        CurrencyQuote(
+            pair, pair, pair[:3], pair[4:], start + index * DAY, bid, bid + 0.01, 1
+        )
+        for index, bid in enumerate(bids)
+    ]
+
+
+def test_pair_series_extracts_sorted_pair():
+    """Test that one pair is pulled out of a mixed batch, oldest first."""
+    quotes = history("USD-BRL", [5.0, 5.1, 5.2])[::-1] + history("EUR-BRL", [6.0])
+    series = analytics.pair_series(QuoteColumns.from_quotes(quotes), "USD-BRL")
+
+    assert series["bid"].tolist() == [5.0, 5.1, 5.2]
+    assert np.all(np.diff(series["timestamp"]) == DAY)
+    assert (
+        len(analytics.pair_series(QuoteColumns.from_quotes(quotes), "JPY-BRL")["bid"])
+        == 0
+    )
+
+
+def test_prices_spread_and_returns():
+    """Test mid price, spreads and returns."""
+    bid, ask = np.array([4.0, 5.0]), np.array([6.0, 5.0])
+
+    assert analytics.mid_price(bid, ask).tolist() == [5.0, 5.0]
+    assert analytics.spread(bid, ask).tolist() == [2.0, 0.0]
+    assert analytics.spread(bid, ask, relative=True).tolist() == [0.4, 0.0]
+    assert analytics.returns([100, 110, 99]).tolist() == pytest.approx([0.1, -0.1])
+    assert analytics.returns([1, math.e], log=True).tolist() == pytest.approx([1.0])
+
+
+def test_rolling_windows():
+    """Test rolling mean, std, volatility and correlation on full windows."""
+    values = np.array([1.0, 2.0, 3.0, 4.0, 6.0])
+
+    assert analytics.rolling_mean(values, 3).tolist() == pytest.approx(
+        [2.0, 3.0, 13 / 3]
+    )
+    assert analytics.rolling_std(values, 2).tolist() == pytest.approx(
+        [math.sqrt(0.5)] * 3 + [math.sqrt(2)]
+    )
+    assert analytics.rolling_correlation(
+        values, values * 2 + 1, 3
+    ).tolist() == pytest.approx([1.0, 1.0, 1.0])
+    assert analytics.rolling_correlation(values, -values, 4).tolist() == pytest.approx(
+        [-1.0, -1.0]
+    )
+    assert len(analytics.rolling_volatility(values, 2, periods_per_year=252)) == 3
+    assert len(analytics.rolling_mean(values, 10)) == 0
+
+
+def test_resample_ohlc():
+    """Test daily and weekly OHLC bars, aligned on upstream days."""
+    timestamps = START + np.arange(10) * DAY
+    prices = np.arange(10, dtype=float)
+
+    daily = analytics.resample_ohlc(timestamps, prices)
+    assert daily["close"].tolist() == prices.tolist()
+
+    # Seven-day bars are aligned on the epoch, so they start on Thursdays.
+    bars = analytics.resample_ohlc(timestamps, prices, period_seconds=7 * DAY)
+    assert bars["open"].tolist() == [0.0, 3.0]
+    assert bars["high"].tolist() == [2.0, 9.0]
+    assert bars["low"].tolist() == [0.0, 3.0]
+    assert bars["close"].tolist() == [2.0, 9.0]
+    assert np.all(np.diff(bars["period_start"]) == 7 * DAY)
+
+
+def test_align_mid_prices_keeps_common_days():
+    """Test aligning two pairs on the days both were quoted."""
+    quotes = history("USD-BRL", [5.0, 5.1, 5.2]) + history(
+        "EUR-BRL", [6.0, 6.1], start=START + DAY
+    )
+    days, matrix = analytics.align_mid_prices(
+        QuoteColumns.from_quotes(quotes), ["USD-BRL", "EUR-BRL"]
+    )
+
+    assert len(days) == 2
+    assert matrix[:, 0].tolist() == pytest.approx([5.105, 5.205])
+    assert matrix[:, 1].tolist() == pytest.approx([6.005, 6.105])
+
+
+def test_incremental_stats_match_batch_computation():
+    """Test that O(1) updates agree with recomputing every window."""
+    generator = random.Random(7)
+    values = [5 + generator.gauss(0, 0.1) for _ in range(200)]
+    others = [value * 2 + generator.gauss(0, 0.05) for value in values]
+    stats = analytics.RollingStats(20)
+    correlation = analytics.RollingCorrelation(20)
+
+    means, stds, correlations = [], [], []
+    for value, other in zip(values, others):
+        stats.push(value)
+        correlation.push(value, other)
+        if stats.full:
+            means.append(stats.mean)
+            stds.append(stats.std)
+            correlations.append(correlation.value)
+
+    assert means == pytest.approx(analytics.rolling_mean(values, 20).tolist())
+    assert stds == pytest.approx(analytics.rolling_std(values, 20).tolist())
+    assert correlations == pytest.approx(
+        analytics.rolling_correlation(values, others, 20).tolist()
+    )
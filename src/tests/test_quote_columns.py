@@ -0,0 +1,84 @@
+import pytest
+from unittest.mock import patch
+from currency_quote import ClientBuilder
+from currency_quote.domain.entities.currency import CurrencyQuote
+from currency_quote.domain.entities.quote_columns import QUOTE_FIELDS, QuoteColumns
+
+
+@pytest.fixture
+def quotes():
+    return [
+        CurrencyQuote(
+            currency_pair="USD-BRL",
+            currency_pair_name="Dólar Americano/Real Brasileiro",
+            base_currency_code="USD",
+            quote_currency_code="BRL",
+            quote_timestamp=1614024000 + day,
+            bid_price=5.0 + day,
+            ask_price=5.1 + day,
+        )
+        for day in range(3)
+    ]
+
+
+def test_columns_from_quotes(quotes):
+    """Test that quotes are stored as typed, dictionary-encoded columns."""
+    columns = QuoteColumns.from_quotes(quotes)
+
+    assert len(columns) == 3
+    assert columns.keys() == QUOTE_FIELDS
+    assert columns["currency_pair"].categories == ["USD-BRL"]
+    assert list(columns["currency_pair"]) == ["USD-BRL"] * 3
+    assert columns["bid_price"].typecode == "d"
+    assert list(columns["quote_timestamp"]) == [1614024000, 1614024001, 1614024002]
+
+
+def test_columns_round_trip_to_records(quotes):
+    """Test that records match the default dict output."""
+    records = QuoteColumns.from_quotes(quotes).to_records()
+
+    assert records[1]["bid_price"] == 6.0
+    assert records[1]["currency_pair_name"] == "Dólar Americano/Real Brasileiro"
+
+
+def test_columns_to_numpy(quotes):
+    """Test the NumPy export."""
+    np = pytest.importorskip("numpy")
+    arrays = QuoteColumns.from_quotes(quotes).to_numpy()
+
+    assert arrays["ask_price"].dtype == np.float64
+    assert arrays["currency_pair"].tolist() == ["USD-BRL"] * 3
+
+
+def test_columns_to_pandas(quotes):
+    """Test the pandas export keeps string fields as categoricals."""
+    pytest.importorskip("pandas")
+    frame = QuoteColumns.from_quotes(quotes).to_pandas()
+
+    assert list(frame.columns) == list(QUOTE_FIELDS)
+    assert str(frame["base_currency_code"].dtype) == "category"
+    assert frame["bid_price"].sum() == pytest.approx(18.0)
+
+
+def test_columns_to_arrow(quotes):
+    """Test the pyarrow export."""
+    pytest.importorskip("pyarrow")
+    table = QuoteColumns.from_quotes(quotes).to_arrow()
+
+    assert table.num_rows == 3
+    assert table.column("quote_timestamp").to_pylist()[0] == 1614024000
+    assert table.column("currency_pair").to_pylist() == ["USD-BRL"] * 3
+
+
+def test_client_columnar_output(quotes):
+    """Test that ClientBuilder returns columns when asked to."""
+    with patch(
+        "currency_quote.adapters.inbound.lib_controller.GetLastCurrencyQuoteUseCase.execute",
+        return_value=quotes,
+    ):
+        client = ClientBuilder(currency_list=["USD-BRL"])
+        columns = client.get_last_quote(columnar=True)
+        records = client.get_last_quote()
+
+    assert isinstance(columns, QuoteColumns)
+    assert columns.to_records() == records
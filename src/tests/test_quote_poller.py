@@ -0,0 +1,132 @@
+import asyncio
+import threading
+import time
+import pytest
+from currency_quote.adapters.outbound.quote_poller import QuotePoller
+from currency_quote.domain.entities.currency import CurrencyQuote
+
+
+class FakeRepository:
+    """Last-quote stand-in whose USD-BRL bid changes only on selected polls."""
+
+    def __init__(self, changes_on=(3,)):
+        self.polls = []
+        self.changes_on = set(changes_on)
+        self.bid = 5.0
+        self.lock = threading.Lock()
+
+    def __call__(self, currency_obj):
+        self.currency_list = currency_obj.get_currency_list()
+        return self
+
+    def get_last_quote(self):
+        with self.lock:
+            self.polls.append(list(self.currency_list))
+            if len(self.polls) in self.changes_on:
+                self.bid += 0.01
+            return [
+                CurrencyQuote(pair, pair, pair[:3], pair[4:], 1, self.bid, self.bid, 1)
+                for pair in self.currency_list
+            ]
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.01)
+
+
+def test_subscribers_share_one_poll_per_interval():
+    """Test that many subscribers are served by a single upstream request per tick."""
+    repository = FakeRepository()
+    poller = QuotePoller(repository=repository)
+
+    subscriptions = [
+        poller.subscribe(["USD-BRL", "EUR-BRL"] if index % 2 else ["USD-BRL"], 0.05)
+        for index in range(50)
+    ]
+    wait_for(lambda: len(repository.polls) >= 3)
+
+    for subscription in subscriptions:
+        subscription.close()
+
+    assert poller.subscriber_count() == 0
+    # Past the first poll, a request covers the whole group or only pairs new to it.
+    assert all(
+        sorted(polled) in (["EUR-BRL", "USD-BRL"], ["EUR-BRL"])
+        for polled in repository.polls[1:]
+    )
+    assert len(repository.polls) < 50
+
+
+def test_newcomers_get_last_quotes_and_fetch_only_new_pairs():
+    """Test that joining a group polls upstream only for the pairs it adds."""
+    repository = FakeRepository(changes_on=())
+    poller = QuotePoller(repository=repository)
+    first = poller.subscribe(["USD-BRL"], 60)
+    assert next(first).currency_pair == "USD-BRL"
+
+    newcomers = [poller.subscribe(["USD-BRL"], 60) for _ in range(5)]
+    mixed = poller.subscribe(["EUR-BRL", "USD-BRL"], 60)
+
+    assert [next(subscription).bid_price for subscription in newcomers] == [5.0] * 5
+    assert sorted(next(mixed).currency_pair for _ in range(2)) == ["EUR-BRL", "USD-BRL"]
+    assert repository.polls == [["USD-BRL"], ["EUR-BRL"]]
+
+    for subscription in [first, mixed, *newcomers]:
+        subscription.close()
+
+
+def test_only_changed_quotes_are_delivered():
+    """Test that a quote is emitted once, then again only after it changes."""
+    repository = FakeRepository(changes_on=(3,))
+    poller = QuotePoller(repository=repository)
+
+    with poller.subscribe(["USD-BRL"], 0.01) as subscription:
+        first = next(subscription)
+        second = next(subscription)
+
+    assert first.bid_price == 5.0
+    assert second.bid_price == pytest.approx(5.01)
+    assert len(repository.polls) >= 3
+
+
+def test_poller_thread_stops_without_subscribers():
+    """Test that the scheduler thread exits once every subscription is closed."""
+    poller = QuotePoller(repository=FakeRepository())
+    subscription = poller.subscribe(["USD-BRL"], 0.01)
+    thread = poller._thread  # pylint: disable=protected-access
+
+    subscription.close()
+    thread.join(timeout=5)
+
+    assert not thread.is_alive()
+    assert list(subscription) == []
+
+
+def test_async_subscription_iterates_changes():
+    """Test the async iterator and transform of a subscription."""
+    poller = QuotePoller(repository=FakeRepository(changes_on=(2,)))
+
+    async def run():
+        async with poller.subscribe(
+            ["USD-BRL"],
+            0.01,
+            transform=lambda quote: quote.bid_price,
+            asynchronous=True,
+        ) as subscription:
+            received = []
+            async for bid in subscription:
+                received.append(bid)
+                if len(received) == 2:
+                    break
+            return received
+
+    assert asyncio.run(run()) == [5.0, pytest.approx(5.01)]
+
+
+def test_rejects_non_positive_interval():
+    """Test that a zero interval is refused."""
+    with pytest.raises(ValueError, match="interval"):
+        QuotePoller(repository=FakeRepository()).subscribe(["USD-BRL"], 0)
@@ -0,0 +1,156 @@
+from unittest.mock import patch
+import pytest
+import requests
+from currency_quote.adapters.outbound.currency_api import CurrencyAPI, last_quote_url
+from currency_quote.adapters.outbound.http_transport import (
+    HTTP_TRANSPORT,
+    get_transport,
+    set_transport,
+)
+from currency_quote.adapters.outbound.quote_archive import QuoteArchive, archive_key
+from currency_quote.adapters.outbound.replay_transport import (
+    RecordingTransport,
+    ReplayTransport,
+)
+from currency_quote.domain.entities.currency import CurrencyObject
+
+
+class FakeResponse:
+    status_code = 503
+
+
+class FakeHttpError(Exception):
+    response = FakeResponse()
+
+
+class FakeTransport:
+    def __init__(self, payloads):
+        self.payloads = payloads
+        self.urls = []
+
+    def get_json(self, url):
+        self.urls.append(url)
+        payload = self.payloads.pop(0)
+        if isinstance(payload, Exception):
+            raise payload
+        return payload
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def archive(tmp_path):
+    quote_archive = QuoteArchive(str(tmp_path / "responses.jsonl"))
+    yield quote_archive
+    quote_archive.close()
+
+
+def test_archive_key_ignores_the_api_base_url():
+    """Test that recordings are keyed by path and query only."""
+    assert archive_key("https://example.com/last/USD-BRL") == "/last/USD-BRL"
+    assert archive_key("http://127.0.0.1:8000/json/daily/USD-BRL?start_date=1") == (
+        "/json/daily/USD-BRL?start_date=1"
+    )
+
+
+def test_archive_replays_responses_in_recording_order(archive):
+    """Test that repeated URLs cycle through their recordings, from a reopened file."""
+    archive.append("http://a/last/USD-BRL", 200, 0.1, {"n": 1})
+    archive.append("http://a/json/available", 200, 0.2, {"USD-BRL": "Dólar/Real"})
+    archive.append("http://a/last/USD-BRL", 200, 0.3, {"n": 2})
+    archive.close()
+    with open(archive.path, "ab") as file:
+        file.write(b'/last/EUR-BRL\t200\t0.1\t{"n"')  # interrupted recording
+
+    reopened = QuoteArchive(archive.path)
+    bodies = [reopened.next_response("http://b/last/USD-BRL").body for _ in range(3)]
+
+    assert len(reopened) == 3
+    assert bodies == [{"n": 1}, {"n": 2}, {"n": 1}]
+    assert reopened.next_response("http://b/json/available").elapsed_seconds == 0.2
+    reopened.rewind()
+    assert reopened.next_response("http://b/last/USD-BRL").body == {"n": 1}
+    with pytest.raises(KeyError, match="/last/EUR-BRL"):
+        reopened.next_response("http://b/last/EUR-BRL")
+    reopened.close()
+
+
+def test_recording_transport_archives_successes_and_failures(archive):
+    """Test that responses and failures are recorded and failures still raised."""
+    inner = FakeTransport([{"USDBRL": {}}, FakeHttpError("503 Server Error")])
+    transport = RecordingTransport(archive, transport=inner)
+
+    assert transport.get_json("http://a/last/USD-BRL") == {"USDBRL": {}}
+    with pytest.raises(FakeHttpError):
+        transport.get_json("http://a/last/EUR-BRL")
+
+    failure = archive.next_response("http://a/last/EUR-BRL")
+    assert archive.next_response("http://a/last/USD-BRL").status == 200
+    assert (failure.status, failure.body) == (503, "503 Server Error")
+
+
+def test_replay_transport_timing_and_failures(archive):
+    """Test fast and recorded timing, and that recorded failures are raised."""
+    archive.append("http://a/last/USD-BRL", 200, 0.25, {"USDBRL": {}})
+    archive.append("http://a/last/EUR-BRL", 503, 0.5, "503 Server Error")
+    archive.append("http://a/last/GBP-BRL", 0, 0.5, "Connection refused")
+
+    with patch("currency_quote.adapters.outbound.replay_transport.time.sleep") as sleep:
+        assert ReplayTransport(archive).get_json("http://b/last/USD-BRL") == {
+            "USDBRL": {}
+        }
+        sleep.assert_not_called()
+
+        with pytest.raises(requests.HTTPError, match="\\(503\\)") as failure:
+            ReplayTransport(archive, timing="recorded").get_json(
+                "http://b/last/EUR-BRL"
+            )
+        sleep.assert_called_once_with(0.5)
+        with pytest.raises(ConnectionError, match="no response"):
+            ReplayTransport(archive).get_json("http://b/last/GBP-BRL")
+
+    assert failure.value.response.status_code == 503
+
+    with pytest.raises(ValueError, match="timing must be one of"):
+        ReplayTransport(archive, timing="slow")
+
+
+def test_replayed_client_errors_are_not_retried(archive):
+    """Test that a recorded 404 fails at once and a 503 is retried without waiting."""
+    archive.append(last_quote_url(["EUR-BRL", "USD-BRL"]), 404, 0.1, "404 Not Found")
+    archive.append(last_quote_url(["GBP-BRL"]), 503, 0.1, "503 Server Error")
+    replay = ReplayTransport(archive)
+
+    with patch.object(replay, "get_json", wraps=replay.get_json) as get_json, patch(
+        "currency_quote.adapters.outbound.currency_api.time.sleep"
+    ) as sleep:
+        with pytest.raises(requests.HTTPError):
+            CurrencyAPI(
+                CurrencyObject(["USD-BRL", "EUR-BRL"]), transport=replay
+            ).get_last_quote()
+        assert get_json.call_count == 1
+
+        with pytest.raises(requests.HTTPError):
+            CurrencyAPI(CurrencyObject(["GBP-BRL"]), transport=replay).get_last_quote()
+        assert get_json.call_count == 3
+
+    sleep.assert_called_once_with(0)
+
+
+def test_set_transport_replays_through_the_repository(
+    archive, mock_currency_api_response
+):
+    """Test that adapters built without a transport use the installed one."""
+    pairs = ["USD-BRL", "EUR-BRL"]
+    archive.append(last_quote_url(sorted(pairs)), 200, 0.1, mock_currency_api_response)
+    replay = ReplayTransport(archive)
+
+    previous = set_transport(replay)
+    try:
+        quotes = CurrencyAPI(CurrencyObject(pairs)).get_last_quote()
+    finally:
+        assert set_transport(None) is replay
+
+    assert previous is HTTP_TRANSPORT and get_transport() is HTTP_TRANSPORT
+    assert [quote.bid_price for quote in quotes] == [5.0876, 6.0876]
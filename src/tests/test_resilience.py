@@ -0,0 +1,156 @@
+import pytest
+import requests
+from currency_quote.adapters.outbound.currency_api import CurrencyAPI
+from currency_quote.adapters.outbound.http_transport import RequestsTransport
+from currency_quote.adapters.outbound.last_quote_cache import LastQuoteCache
+from currency_quote.domain.entities.currency import CurrencyObject, CurrencyQuote
+from currency_quote.utils.resilience import (
+    AdaptiveTokenBucket,
+    CircuitBreaker,
+    CircuitOpenError,
+    RateLimitedError,
+)
+
+
+def url(server, path):
+    return f"http://127.0.0.1:{server.server_port}{path}"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_circuit_opens_after_consecutive_failures():
+    """Test closed -> open after the threshold, then failing fast."""
+    breaker = CircuitBreaker(
+        failure_threshold=3, reset_timeout_seconds=30, clock=FakeClock()
+    )
+
+    for _ in range(3):
+        breaker.before_call()
+        breaker.record_failure()
+
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_circuit_half_open_allows_a_single_probe():
+    """Test open -> half-open after the timeout, and the probe's outcome."""
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout_seconds=30, clock=clock)
+    breaker.record_failure()
+
+    clock.now += 30
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+    clock.now += 30
+    breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_token_bucket_spaces_calls_beyond_burst():
+    """Test that calls beyond the burst wait for the refill rate."""
+    clock = FakeClock()
+    bucket = AdaptiveTokenBucket(
+        max_rate=10, burst=2, min_rate=1, max_wait_seconds=1, clock=clock
+    )
+
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == 0
+    assert bucket.reserve() == pytest.approx(0.1)
+    assert bucket.reserve() == pytest.approx(0.2)
+
+
+def test_token_bucket_adapts_to_throttling():
+    """Test that 429s halve the rate, honour Retry-After and recover on success."""
+    clock = FakeClock()
+    bucket = AdaptiveTokenBucket(
+        max_rate=10, burst=5, min_rate=1, max_wait_seconds=5, clock=clock
+    )
+
+    bucket.throttle(retry_after=3)
+    assert bucket.rate == 5
+    assert bucket.reserve() == pytest.approx(3)
+
+    bucket.throttle(retry_after=10)
+    with pytest.raises(RateLimitedError):
+        bucket.reserve()
+
+    for _ in range(3):
+        bucket.throttle()
+    assert bucket.rate == 1
+
+    for _ in range(100):
+        bucket.relax()
+    assert bucket.rate == 10
+
+
+def test_transport_fails_fast_while_circuit_is_open(stub_server):
+    """Test that an outage opens the circuit and stops hitting upstream."""
+    stub_server.statuses = [500] * 4
+    transport = RequestsTransport(
+        retry_attempts=2,
+        retry_time_seconds=0,
+        circuit_breaker=CircuitBreaker(failure_threshold=2, reset_timeout_seconds=60),
+    )
+
+    for _ in range(2):
+        with pytest.raises(requests.HTTPError):
+            transport.get_json(url(stub_server, "/last/USD-BRL"))
+
+    with pytest.raises(CircuitOpenError):
+        transport.get_json(url(stub_server, "/last/USD-BRL"))
+
+    assert len(stub_server.requests) == 4
+    assert transport.state["circuit"] == CircuitBreaker.OPEN
+    transport.close()
+
+
+def test_transport_lowers_rate_on_429(stub_server):
+    """Test that a 429 response slows the shared rate limiter down."""
+    stub_server.statuses = [429]
+    transport = RequestsTransport(retry_attempts=2, retry_time_seconds=0)
+
+    assert transport.get_json(url(stub_server, "/last/USD-BRL")) == {
+        "path": "/last/USD-BRL"
+    }
+    assert transport.state["rate_per_second"] < transport.rate_limiter.max_rate
+    assert transport.state["circuit"] == CircuitBreaker.CLOSED
+    transport.close()
+
+
+class OpenCircuitTransport:
+    def get_json(self, url):
+        raise CircuitOpenError("Upstream circuit is open, failing fast")
+
+    def close(self):
+        pass
+
+
+def test_last_quote_serves_stale_cache_while_circuit_is_open():
+    """Test that expired cached quotes are served instead of failing."""
+    clock = FakeClock()
+    cache = LastQuoteCache(ttl_seconds=5, clock=clock)
+    cache.store([CurrencyQuote("USD-BRL", "Dólar", "USD", "BRL", 1, 5.0, 5.1, 1)])
+    clock.now += 60
+
+    result = CurrencyAPI(
+        CurrencyObject(["USD-BRL", "EUR-BRL"]),
+        transport=OpenCircuitTransport(),
+        quote_cache=cache,
+    ).get_last_quote()
+
+    assert [quote.currency_pair for quote in result] == ["USD-BRL"]
+    assert isinstance(result.errors["EUR-BRL"], CircuitOpenError)
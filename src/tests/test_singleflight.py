@@ -0,0 +1,103 @@
+import threading
+import time
+from currency_quote.adapters.outbound.currency_api import CurrencyAPI
+from currency_quote.adapters.outbound.last_quote_cache import LastQuoteCache
+from currency_quote.domain.entities.currency import CurrencyObject
+from currency_quote.utils.singleflight import SingleFlight
+
+
+def run_in_threads(count, target):
+    barrier = threading.Barrier(count)
+    results, errors = [], []
+
+    def worker():
+        barrier.wait()
+        try:
+            results.append(target())
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results, errors
+
+
+def test_concurrent_calls_share_one_execution():
+    """Test that callers with the same key wait for a single execution."""
+    flight = SingleFlight()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        time.sleep(0.1)
+        return "quote"
+
+    results, errors = run_in_threads(10, lambda: flight.do("USD-BRL", slow))
+
+    assert results == ["quote"] * 10
+    assert errors == []
+    assert len(calls) == 1
+    assert flight.in_flight() == 0
+
+
+def test_errors_are_shared_by_waiting_callers():
+    """Test that every coalesced caller receives the leader's exception."""
+    flight = SingleFlight()
+
+    def failing():
+        time.sleep(0.1)
+        raise ConnectionError("upstream down")
+
+    results, errors = run_in_threads(5, lambda: flight.do("key", failing))
+
+    assert results == []
+    assert len(errors) == 5
+    assert all(isinstance(error, ConnectionError) for error in errors)
+
+
+def test_completed_calls_are_not_cached():
+    """Test that a new call after completion executes again."""
+    flight = SingleFlight()
+    counter = iter(range(10))
+
+    assert flight.do("key", lambda: next(counter)) == 0
+    assert flight.do("key", lambda: next(counter)) == 1
+
+
+class CountingTransport:
+    def __init__(self, response):
+        self.response = response
+        self.requested = []
+
+    def get_json(self, url):
+        self.requested.append(url)
+        time.sleep(0.1)
+        return self.response
+
+    def close(self):
+        pass
+
+
+def test_currency_api_coalesces_identical_last_quote_requests(
+    mock_currency_api_response,
+):
+    """Test that concurrent requests for the same pair set hit upstream once."""
+    transport = CountingTransport(mock_currency_api_response)
+    no_cache = LastQuoteCache(ttl_seconds=0)
+
+    def fetch(pairs):
+        return lambda: CurrencyAPI(
+            CurrencyObject(pairs), transport=transport, quote_cache=no_cache
+        ).get_last_quote()
+
+    results, errors = run_in_threads(8, fetch(["USD-BRL", "EUR-BRL"]))
+    reordered, _ = run_in_threads(1, fetch(["EUR-BRL", "USD-BRL"]))
+
+    assert errors == []
+    assert len(transport.requested) == 2
+    assert transport.requested[0] == transport.requested[1]
+    assert [quote.currency_pair for quote in results[0]] == ["USD-BRL", "EUR-BRL"]
+    assert [quote.currency_pair for quote in reordered[0]] == ["EUR-BRL", "USD-BRL"]
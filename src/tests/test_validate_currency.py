@@ -5,16 +5,22 @@ from currency_quote.application.use_cases.validate_currency import (
 )
 from currency_quote.domain.entities.currency import CurrencyObject
 from currency_quote.adapters.outbound.currency_validator_api import CurrencyValidatorAPI
-from currency_quote.domain.services.validate_currency import CurrencyValidatorService
+from currency_quote.domain.entities.parity_index import ParityIndex
+from currency_quote.domain.services.validate_currency import (
+    CurrencyValidatorService,
+    ValidatedCurrencyList,
+)
 
 
 def test_valid_currency():
     """Test validation of valid currencies."""
     currency_list = ["USD-BRL", "USD-BRLT"]
     currency_quote = CurrencyObject(currency_list)
-    
+
     # Mock the validator API to return the same currencies
-    with patch.object(CurrencyValidatorAPI, 'validate_currency_code', return_value=currency_list):
+    with patch.object(
+        CurrencyValidatorAPI, "validate_currency_code", return_value=currency_list
+    ):
         result = ValidateCurrencyUseCase.execute(currency_quote=currency_quote)
         assert result.get_currency_list() == currency_list
         assert isinstance(result, CurrencyObject)
@@ -25,9 +31,11 @@ def test_partial_valid_currency():
     currency_list = ["USD-BRL", "USD-BRLT", "AAA-BBB"]
     currency_quote = CurrencyObject(currency_list)
     expected_result = ["USD-BRL", "USD-BRLT"]
-    
+
     # Mock the validator API to return only valid currencies
-    with patch.object(CurrencyValidatorAPI, 'validate_currency_code', return_value=expected_result):
+    with patch.object(
+        CurrencyValidatorAPI, "validate_currency_code", return_value=expected_result
+    ):
         result = ValidateCurrencyUseCase.execute(currency_quote=currency_quote)
         assert result.get_currency_list() == expected_result
         assert isinstance(result, CurrencyObject)
@@ -37,9 +45,9 @@ def test_all_invalid_currencies():
     """Test validation when all currencies are invalid."""
     currency_list = ["AAA-BBB", "XXX-YYY"]
     currency_quote = CurrencyObject(currency_list)
-    
+
     # Mock the validator to return empty list, which raises ValueError
-    with patch.object(CurrencyValidatorAPI, 'validate_currency_code', return_value=[]):
+    with patch.object(CurrencyValidatorAPI, "validate_currency_code", return_value=[]):
         with pytest.raises(ValueError, match="All params: .* are invalid."):
             ValidateCurrencyUseCase.execute(currency_quote=currency_quote)
 
@@ -48,9 +56,13 @@ def test_api_validator_error():
     """Test handling of validator API errors."""
     currency_list = ["USD-BRL"]
     currency_quote = CurrencyObject(currency_list)
-    
+
     # Mock the validator API to raise an exception
-    with patch.object(CurrencyValidatorAPI, 'validate_currency_code', side_effect=Exception("API Error")):
+    with patch.object(
+        CurrencyValidatorAPI,
+        "validate_currency_code",
+        side_effect=Exception("API Error"),
+    ):
         with pytest.raises(Exception, match="API Error"):
             ValidateCurrencyUseCase.execute(currency_quote=currency_quote)
 
@@ -59,13 +71,88 @@ def test_special_character_validation():
     """Test validation of currencies including special characters (which should be invalid)."""
     # Create currency object with only valid currencies first
     currency_quote = CurrencyObject(["USD-BRL"])
-    
+
     # Then test validation where API only returns valid currencies
     expected_result = ["USD-BRL"]
-    invalid_result = ["XXX-YYY"] # This represents what would have been filtered out
-    
+    invalid_result = ["XXX-YYY"]  # This represents what would have been filtered out
+
     # Mock validator to only return valid currencies
-    with patch.object(CurrencyValidatorAPI, 'validate_currency_code', return_value=expected_result):
+    with patch.object(
+        CurrencyValidatorAPI, "validate_currency_code", return_value=expected_result
+    ):
         result = ValidateCurrencyUseCase.execute(currency_quote=currency_quote)
         assert result.get_currency_list() == expected_result
         assert all(c not in result.get_currency_list() for c in invalid_result)
+
+
+class IndexLoader:
+    def __init__(self, parities, version="v1"):
+        self.index = ParityIndex.from_parities(parities, version=version)
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.index
+
+
+def test_validated_list_reused_while_parities_unchanged():
+    """Test that the pairs are validated once per parity-list version."""
+    loader = IndexLoader(["USD-BRL", "EUR-BRL"])
+    session = ValidatedCurrencyList(CurrencyObject(["USD-BRL", "AAA-BBB"]), loader)
+
+    first = session.get()
+    second = session.get()
+
+    assert first is second
+    assert first.get_currency_list() == ["USD-BRL"]
+    assert session.version == "v1"
+
+
+def test_validated_list_revalidates_when_parities_change():
+    """Test that a new parity-list version triggers a full validation."""
+    loader = IndexLoader(["USD-BRL"])
+    session = ValidatedCurrencyList(CurrencyObject(["USD-BRL", "EUR-BRL"]), loader)
+    assert session.get().get_currency_list() == ["USD-BRL"]
+
+    loader.index = ParityIndex.from_parities(["USD-BRL", "EUR-BRL"], version="v2")
+
+    assert session.get().get_currency_list() == ["USD-BRL", "EUR-BRL"]
+    assert session.version == "v2"
+
+
+def test_validated_list_add_checks_only_new_pairs():
+    """Test that added pairs are checked against the remembered parity list."""
+    loader = IndexLoader(["USD-BRL", "EUR-BRL"])
+    session = ValidatedCurrencyList(CurrencyObject(["USD-BRL"]), loader)
+    session.get()
+
+    assert session.add(["EUR-BRL", "USD-BRL", "AAA-BBB"]) == ["EUR-BRL", "AAA-BBB"]
+    assert session.currency_list == ["USD-BRL", "EUR-BRL", "AAA-BBB"]
+    assert session.get().get_currency_list() == ["USD-BRL", "EUR-BRL"]
+    with pytest.raises(ValueError, match="format"):
+        session.add("USDBRL")
+
+
+def test_validated_list_remove():
+    """Test that removed pairs are dropped and the last one cannot be removed."""
+    loader = IndexLoader(["USD-BRL", "EUR-BRL"])
+    session = ValidatedCurrencyList(CurrencyObject(["USD-BRL", "EUR-BRL"]), loader)
+    session.get()
+
+    assert session.remove("EUR-BRL") == ["EUR-BRL"]
+    assert session.get().get_currency_list() == ["USD-BRL"]
+    with pytest.raises(ValueError, match="empty"):
+        session.remove(["USD-BRL"])
+    assert session.currency_list == ["USD-BRL"]
+
+
+def test_validated_list_remove_normalizes_pairs():
+    """Test that pairs are removed whatever their case."""
+    loader = IndexLoader(["USD-BRL", "EUR-BRL"])
+    session = ValidatedCurrencyList(CurrencyObject(["USD-BRL", "EUR-BRL"]), loader)
+    session.get()
+
+    assert session.remove(["eur-brl"]) == ["EUR-BRL"]
+    assert session.get().get_currency_list() == ["USD-BRL"]
+    with pytest.raises(ValueError, match="format"):
+        session.remove("USDBRL")